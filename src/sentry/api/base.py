@@ -474,6 +474,11 @@ class Endpoint(APIView):
             response["X-Hits"] = cursor_result.hits
         if cursor_result.max_hits is not None:
             response["X-Max-Hits"] = cursor_result.max_hits
+        timings = getattr(cursor_result, "timings", None)
+        if timings:
+            response["Server-Timing"] = ", ".join(
+                f"{name};dur={duration:.1f}" for name, duration in timings.items()
+            )
         response["Link"] = ", ".join(
             [
                 self.build_cursor_link(request, "previous", cursor_result.prev),
@@ -37,6 +37,7 @@ from sentry.search.utils import (
     parse_size,
 )
 from sentry.snuba.dataset import Dataset
+from sentry.utils import metrics
 from sentry.utils.snuba import is_duration_measurement, is_measurement, is_span_op_breakdown
 from sentry.utils.validators import is_event_id, is_span_id
 
@@ -689,6 +690,9 @@ class SearchVisitor(NodeVisitor[list[QueryToken]]):
         super().__init__()
 
         self.config = config
+        # Whether the result only depends on the query and the config. Relative
+        # dates are resolved against the current time and must not be cached.
+        self.cacheable = True
 
         if TYPE_CHECKING:
             from sentry.search.events.builder.discover import UnresolvedQuery
@@ -781,11 +785,14 @@ class SearchVisitor(NodeVisitor[list[QueryToken]]):
     def visit_free_text(self, node: Node, children: tuple[str]) -> SearchFilter | None:
         if not children[0]:
             return None
+        return self._handle_free_text(children[0])
+
+    def _handle_free_text(self, text: str) -> SearchFilter:
         # Free text searches need to be treated like they were wildcards
         return SearchFilter(
             SearchKey(self.config.free_text_key),
             "=",
-            SearchValue(wrap_free_text(children[0], self.config.wildcard_free_text)),
+            SearchValue(wrap_free_text(text, self.config.wildcard_free_text)),
         )
 
     def visit_paren_group(
@@ -911,6 +918,7 @@ class SearchVisitor(NodeVisitor[list[QueryToken]]):
         (search_key, _, value) = children
 
         if self.is_date_key(search_key.name):
+            self.cacheable = False
             try:
                 dt_range = parse_datetime_range(value.text)
             except InvalidQuery as exc:
@@ -1206,6 +1214,7 @@ class SearchVisitor(NodeVisitor[list[QueryToken]]):
         operator_s = handle_negation(negation, operator)
         is_date_aggregate = any(key in search_key.name for key in self.config.date_keys)
         if is_date_aggregate:
+            self.cacheable = False
             try:
                 dt_range = parse_datetime_range(search_value.text)
             except InvalidQuery as exc:
@@ -1493,7 +1502,9 @@ class SearchVisitor(NodeVisitor[list[QueryToken]]):
         return f'"{value}"'
 
     def visit_search_key(self, node: Node, children: tuple[str | SearchKey]) -> SearchKey:
-        key = children[0]
+        return self._resolve_search_key(children[0])
+
+    def _resolve_search_key(self, key: str | SearchKey) -> SearchKey:
         if (
             self.config.allowed_keys
             and key not in self.config.allowed_keys
@@ -1724,8 +1735,68 @@ def parse_search_query(
     if config is None:
         config = default_config
 
+    with metrics.timer("api.event_search.parse_search_query") as metric_tags:
+        # The result only depends on the query and the config unless callers
+        # bring their own field type resolution.
+        if params is None and get_field_type is None and get_function_result_type is None:
+            hits = _parse_search_query_cached.cache_info().hits
+            tokens = _parse_search_query_cached(query, _IdentityKey(config))
+            metric_tags["cached"] = str(_parse_search_query_cached.cache_info().hits > hits)
+            if tokens is not None:
+                return list(tokens)
+
+        visitor = SearchVisitor(
+            config,
+            params=params,
+            get_field_type=get_field_type,
+            get_function_result_type=get_function_result_type,
+        )
+        return _visit_search_query(query, visitor)
+
+
+class _IdentityKey:
+    """Hashes and compares the wrapped object by identity.
+
+    Search configs are mutable dataclasses and therefore unhashable. The cache
+    holds a reference to the config, so its id cannot be reused while cached.
+    """
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj: object) -> None:
+        self.obj = obj
+
+    def __hash__(self) -> int:
+        return id(self.obj)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _IdentityKey) and other.obj is self.obj
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_search_query_cached(
+    query: str, config_key: _IdentityKey
+) -> tuple[QueryToken, ...] | None:
+    """Parses a query with a search config, or returns `None` if the result
+    must not be cached. Tokens are shared between callers and must not be
+    mutated."""
+    visitor = SearchVisitor(config_key.obj)
+    tokens = _visit_search_query(query, visitor)
+    return tuple(tokens) if visitor.cacheable else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_search_tree(query: str) -> Node:
+    return event_search_grammar.parse(query)
+
+
+def _visit_search_query(query: str, visitor: SearchVisitor) -> list[QueryToken]:
+    tokens = _parse_simple_search_query(query, visitor)
+    if tokens is not None:
+        return tokens
+
     try:
-        tree = event_search_grammar.parse(query)
+        tree = _parse_search_tree(query)
     except IncompleteParseError as e:
         idx = e.column()
         prefix = query[max(0, idx - 5) : idx]
@@ -1737,9 +1808,73 @@ def parse_search_query(
             )
         )
 
-    return SearchVisitor(
-        config,
-        params=params,
-        get_field_type=get_field_type,
-        get_function_result_type=get_function_result_type,
-    ).visit(tree)
+    return visitor.visit(tree)
+
+
+# Characters which need the grammar: quotes, parens and whitespace other than
+# the space that separates terms.
+_SIMPLE_QUERY_UNSUPPORTED = re.compile(r'["()\t\n\r]')
+_SIMPLE_TERM = re.compile(r"[^ ]+")
+_SIMPLE_FILTER = re.compile(r"(!?)([a-zA-Z0-9_.-]+):(.+)")
+# Value prefixes which may select a filter type other than the text filter:
+# operators, numbers, durations, sizes, dates, relative dates and lists.
+_SIMPLE_VALUE_UNSUPPORTED_PREFIXES = frozenset("<>=!+-[0123456789")
+
+
+def _parse_simple_search_query(query: str, visitor: SearchVisitor) -> list[QueryToken] | None:
+    """Parses queries made only of free text and plain `key:value` text filters
+    without running the grammar, or returns `None` for anything else.
+
+    This produces exactly the tokens the grammar would: anything that could
+    match another filter type, a boolean operator or a paren group is left to
+    the grammar.
+    """
+    if _SIMPLE_QUERY_UNSUPPORTED.search(query):
+        return None
+
+    # Check the shape of every term before building any token, so errors are
+    # only raised for queries the grammar would accept as well.
+    terms: list[tuple[int, int, tuple[str, str, str] | None]] = []
+    for term in _SIMPLE_TERM.finditer(query):
+        word = term.group()
+        if ":" not in word:
+            if word.upper() in (SearchBoolean.BOOLEAN_AND, SearchBoolean.BOOLEAN_OR):
+                return None
+            terms.append((term.start(), term.end(), None))
+            continue
+
+        match = _SIMPLE_FILTER.fullmatch(word)
+        if match is None:
+            return None
+        negation, key, value = match.groups()
+        if (
+            key in ("has", "is")
+            or value[0] in _SIMPLE_VALUE_UNSUPPORTED_PREFIXES
+            or value.lower() in ("true", "false")
+        ):
+            return None
+        terms.append((term.start(), term.end(), (negation, key, value)))
+
+    tokens: list[QueryToken] = []
+    # Consecutive free text words form a single free text token.
+    free_text_start = free_text_end = -1
+    for start, end, text_filter in terms:
+        if text_filter is None:
+            if free_text_start < 0:
+                free_text_start = start
+            free_text_end = end
+            continue
+
+        if free_text_start >= 0:
+            tokens.append(visitor._handle_free_text(query[free_text_start:free_text_end]))
+            free_text_start = -1
+        negation, key, value = text_filter
+        tokens.append(
+            visitor._handle_basic_filter(
+                visitor._resolve_search_key(key), "!=" if negation else "=", SearchValue(value)
+            )
+        )
+
+    if free_text_start >= 0:
+        tokens.append(visitor._handle_free_text(query[free_text_start:free_text_end]))
+    return tokens
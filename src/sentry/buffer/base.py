@@ -1,6 +1,10 @@
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from django.db import connections, router
 from django.db.models import Expression, F
 
 from sentry.db import models
@@ -11,6 +15,48 @@ from sentry.utils.services import Service
 BufferField = models.Model | str | int
 
 
+@dataclass
+class BufferedIncr:
+    """
+    A single flushed buffer entry, as passed to `Buffer.process`.
+    """
+
+    model: type[models.Model]
+    columns: dict[str, int]
+    filters: dict[str, Any]
+    extra: dict[str, Any] = field(default_factory=dict)
+    signal_only: bool | None = None
+
+
+def _bulk_update_shape(item: BufferedIncr) -> tuple[str, ...] | None:
+    """
+    Returns the filter column names for entries that can be flushed with a
+    multi-row counter update, or None when the entry needs the regular
+    `Buffer.process` path.
+    """
+    from sentry.models.group import Group
+
+    # Group updates need to go through `Group.update` to keep the cache warm,
+    # extras and signal-only entries need the full per-row semantics.
+    if item.model is Group or item.extra or item.signal_only or not item.columns:
+        return None
+
+    opts = item.model._meta
+    filter_columns = []
+    for name, value in sorted(item.filters.items()):
+        if isinstance(value, models.Model):
+            value = value.pk
+        if not isinstance(value, int):
+            return None
+        try:
+            model_field = opts.pk if name == "pk" else opts.get_field(name)
+        except Exception:
+            return None
+        filter_columns.append(model_field.column)
+
+    return tuple(filter_columns)
+
+
 class Buffer(Service):
     """
     Buffers act as temporary stores for counters. The default implementation is just a passthru and
@@ -30,6 +76,7 @@ class Buffer(Service):
         "incr",
         "process",
         "process_pending",
+        "process_many",
         "process_batch",
         "validate",
         "push_to_sorted_set",
@@ -140,6 +187,104 @@ class Buffer(Service):
     def process_pending(self) -> None:
         return
 
+    def process_many(self, items: Sequence[BufferedIncr]) -> int:
+        """
+        Flush many buffered entries at once. Counter-only entries sharing the
+        same model, filter columns and counter columns are written back with a
+        single `UPDATE ... FROM (VALUES ...)` statement, everything else
+        (and rows which don't exist yet) goes through `process`.
+
+        Returns the number of statements issued for the multi-row updates.
+        """
+        batches: dict[
+            tuple[type[models.Model], tuple[str, ...], tuple[str, ...]], list[BufferedIncr]
+        ] = defaultdict(list)
+        fallback: list[BufferedIncr] = []
+
+        for item in items:
+            shape = _bulk_update_shape(item)
+            if shape is None:
+                fallback.append(item)
+            else:
+                batches[(item.model, shape, tuple(sorted(item.columns)))].append(item)
+
+        statements = 0
+        for (model, filter_columns, column_names), batch in batches.items():
+            if len(batch) == 1:
+                fallback.extend(batch)
+                continue
+
+            updated = self._bulk_update_counters(model, filter_columns, column_names, batch)
+            statements += 1
+            for item in batch:
+                if self._filter_values(item) in updated:
+                    buffer_incr_complete.send_robust(
+                        model=model,
+                        columns=item.columns,
+                        filters=item.filters,
+                        extra=item.extra,
+                        created=False,
+                        sender=model,
+                    )
+                else:
+                    fallback.append(item)
+
+        for item in fallback:
+            # Subclasses (e.g. RedisBuffer) override `process` with a different
+            # signature, so always go through the base implementation here.
+            Buffer.process(
+                self, item.model, item.columns, item.filters, item.extra, item.signal_only
+            )
+
+        return statements
+
+    def _filter_values(self, item: BufferedIncr) -> tuple[int, ...]:
+        return tuple(
+            value.pk if isinstance(value, models.Model) else value
+            for _, value in sorted(item.filters.items())
+        )
+
+    def _bulk_update_counters(
+        self,
+        model: type[models.Model],
+        filter_columns: tuple[str, ...],
+        column_names: tuple[str, ...],
+        items: Sequence[BufferedIncr],
+    ) -> set[tuple[int, ...]]:
+        """
+        Increment the counters of every existing row matched by `items` in a
+        single statement, returning the filter values of the rows that were
+        updated.
+        """
+        opts = model._meta
+        connection = connections[router.db_for_write(model)]
+        qn = connection.ops.quote_name
+        counter_columns = [opts.get_field(name).column for name in column_names]
+        value_columns = [*filter_columns, *counter_columns]
+
+        placeholder = "({})".format(", ".join(["%s"] * len(value_columns)))
+        params: list[int] = []
+        for item in items:
+            params.extend(self._filter_values(item))
+            params.extend(item.columns[name] for name in column_names)
+
+        sql = (
+            "UPDATE {table} AS t SET {assignments} "
+            "FROM (VALUES {values}) AS v ({value_columns}) "
+            "WHERE {conditions} RETURNING {returning}"
+        ).format(
+            table=qn(opts.db_table),
+            assignments=", ".join(f"{qn(c)} = t.{qn(c)} + v.{qn(c)}" for c in counter_columns),
+            values=", ".join([placeholder] * len(items)),
+            value_columns=", ".join(qn(c) for c in value_columns),
+            conditions=" AND ".join(f"t.{qn(c)} = v.{qn(c)}" for c in filter_columns),
+            returning=", ".join(f"t.{qn(c)}" for c in filter_columns),
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return {tuple(row) for row in cursor.fetchall()}
+
     def process_batch(self) -> None:
         return
 
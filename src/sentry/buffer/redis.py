@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 import pickle
+from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
@@ -13,7 +14,8 @@ import rb
 from django.utils.encoding import force_bytes, force_str
 from rediscluster import RedisCluster
 
-from sentry.buffer.base import Buffer, BufferField
+from sentry import options
+from sentry.buffer.base import Buffer, BufferedIncr, BufferField
 from sentry.db import models
 from sentry.tasks.process_buffer import process_incr
 from sentry.utils import json, metrics
@@ -509,8 +511,12 @@ class RedisBuffer(Buffer):
         if not lock_key:
             return
 
+        incr_batch_size = self.incr_batch_size
+        if options.get("buffer.bulk-flush.enabled"):
+            incr_batch_size = max(incr_batch_size, options.get("buffer.bulk-flush.batch-size"))
+
         pending_buffers_router = redis_buffer_router.create_pending_buffers_router(
-            incr_batch_size=self.incr_batch_size
+            incr_batch_size=incr_batch_size
         )
 
         def _generate_process_incr_kwargs(model_key: str | None) -> dict[str, Any]:
@@ -609,6 +615,10 @@ class RedisBuffer(Buffer):
             batch_keys = [key]
 
         if batch_keys is not None:
+            if len(batch_keys) > 1 and options.get("buffer.bulk-flush.enabled"):
+                self._process_incr_batch(batch_keys)
+                return
+
             for key in batch_keys:
                 self._process_single_incr(key)
 
@@ -622,6 +632,43 @@ class RedisBuffer(Buffer):
     ) -> Any:
         return super().process(model, columns, filters, extra, signal_only)
 
+    def _load_buffered_incr(self, values: dict[Any, Any]) -> BufferedIncr:
+        # XXX(python3): In python2 this isn't as important since redis will
+        # return string tyes (be it, byte strings), but in py3 we get bytes
+        # back, and really we just want to deal with keys as strings.
+        values = {force_str(k): v for k, v in values.items()}
+
+        model = import_string(force_str(values.pop("m")))
+
+        if values["f"].startswith(b"{" if not self.is_redis_cluster else "{"):
+            filters = self._load_values(json.loads(force_str(values.pop("f"))))
+        else:
+            # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
+            filters = pickle.loads(force_bytes(values.pop("f")))
+
+        incr_values = {}
+        extra_values = {}
+        signal_only = None
+        for k, v in values.items():
+            if k.startswith("i+"):
+                incr_values[k[2:]] = int(v)
+            elif k.startswith("e+"):
+                if v.startswith(b"[" if not self.is_redis_cluster else "["):
+                    extra_values[k[2:]] = self._load_value(json.loads(force_str(v)))
+                else:
+                    # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
+                    extra_values[k[2:]] = pickle.loads(force_bytes(v))
+            elif k == "s":
+                signal_only = bool(int(v))  # Should be 1 if set
+
+        return BufferedIncr(
+            model=model,
+            columns=incr_values,
+            filters=filters,
+            extra=extra_values,
+            signal_only=signal_only,
+        )
+
     def _process_single_incr(self, key: str) -> None:
         client = get_cluster_routing_client(self.cluster, self.is_redis_cluster)
         lock_key = self._lock_key(client, key, ex=10)
@@ -637,39 +684,107 @@ class RedisBuffer(Buffer):
             pipe.delete(key)
             values = pipe.execute()[0]
 
-            # XXX(python3): In python2 this isn't as important since redis will
-            # return string tyes (be it, byte strings), but in py3 we get bytes
-            # back, and really we just want to deal with keys as strings.
-            values = {force_str(k): v for k, v in values.items()}
-
             if not values:
                 metrics.incr("buffer.revoked", tags={"reason": "empty"}, skip_internal=False)
                 logger.debug("buffer.revoked.empty", extra={"redis_key": key})
                 return
 
-            model = import_string(force_str(values.pop("m")))
-
-            if values["f"].startswith(b"{" if not self.is_redis_cluster else "{"):
-                filters = self._load_values(json.loads(force_str(values.pop("f"))))
-            else:
-                # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
-                filters = pickle.loads(force_bytes(values.pop("f")))
-
-            incr_values = {}
-            extra_values = {}
-            signal_only = None
-            for k, v in values.items():
-                if k.startswith("i+"):
-                    incr_values[k[2:]] = int(v)
-                elif k.startswith("e+"):
-                    if v.startswith(b"[" if not self.is_redis_cluster else "["):
-                        extra_values[k[2:]] = self._load_value(json.loads(force_str(v)))
-                    else:
-                        # TODO(dcramer): legacy pickle support - remove in Sentry 9.1
-                        extra_values[k[2:]] = pickle.loads(force_bytes(v))
-                elif k == "s":
-                    signal_only = bool(int(v))  # Should be 1 if set
-
-            self._base_process(model, incr_values, filters, extra_values, signal_only)
+            item = self._load_buffered_incr(values)
+            self._base_process(item.model, item.columns, item.filters, item.extra, item.signal_only)
         finally:
             client.delete(lock_key)
+
+    def _pipelines_by_node(self, keys: list[str]) -> list[tuple[Pipeline, list[str]]]:
+        """
+        Groups keys by the Redis node they live on, returning one pipeline per
+        node together with the keys it is responsible for.
+        """
+        if not keys:
+            return []
+        if is_instance_redis_cluster(self.cluster, self.is_redis_cluster):
+            # The cluster pipeline routes every command to its own node.
+            return [(self.cluster.pipeline(transaction=False), keys)]
+        elif is_instance_rb_cluster(self.cluster, self.is_redis_cluster):
+            router = self.cluster.get_router()
+            keys_by_host: dict[int, list[str]] = defaultdict(list)
+            for key in keys:
+                keys_by_host[router.get_host_for_key(key)].append(key)
+            return [
+                (self.cluster.get_local_client(host_id).pipeline(transaction=False), host_keys)
+                for host_id, host_keys in keys_by_host.items()
+            ]
+        else:
+            raise AssertionError("unreachable")
+
+    def _lock_keys(self, keys: list[str], ex: int) -> list[str]:
+        """
+        Acquires the per-key flush locks for all `keys` in a single round-trip
+        per node, returning the keys that were locked.
+        """
+        lock_keys = {self._make_lock_key(key): key for key in keys}
+        locked = []
+        for pipe, node_lock_keys in self._pipelines_by_node(list(lock_keys)):
+            for lock_key in node_lock_keys:
+                pipe.set(lock_key, "1", nx=True, ex=ex)
+            for lock_key, acquired in zip(node_lock_keys, pipe.execute()):
+                if acquired:
+                    locked.append(lock_keys[lock_key])
+        return locked
+
+    def _unlock_keys(self, keys: list[str]) -> None:
+        # Lock keys can live on another host than the keys they protect, so
+        # they are routed like in `_lock_keys`.
+        lock_keys = [self._make_lock_key(key) for key in keys]
+        for pipe, node_lock_keys in self._pipelines_by_node(lock_keys):
+            for lock_key in node_lock_keys:
+                pipe.delete(lock_key)
+            pipe.execute()
+
+    def _process_incr_batch(self, batch_keys: list[str]) -> None:
+        """
+        Bulk version of `_process_single_incr`: locks, reads and deletes all
+        keys with one pipeline per Redis node and writes the merged values back
+        through `Buffer.process_many`.
+        """
+        start = time()
+        keys = self._lock_keys(list(dict.fromkeys(batch_keys)), ex=10)
+        if len(keys) < len(batch_keys):
+            metrics.incr(
+                "buffer.revoked",
+                amount=len(batch_keys) - len(keys),
+                tags={"reason": "locked"},
+                skip_internal=False,
+            )
+
+        try:
+            items: list[BufferedIncr] = []
+            for pipe, node_keys in self._pipelines_by_node(keys):
+                for key in node_keys:
+                    pipe.hgetall(key)
+                # Keys are deleted one at a time, on RedisCluster they can live in
+                # different hash slots and a multi-key DEL would fail with CROSSSLOT.
+                # The ZREM only touches the pending key.
+                for key in node_keys:
+                    pipe.delete(key)
+                pipe.zrem(self.pending_key, *node_keys)
+                results = pipe.execute()
+
+                for key, values in zip(node_keys, results):
+                    if not values:
+                        metrics.incr(
+                            "buffer.revoked", tags={"reason": "empty"}, skip_internal=False
+                        )
+                        logger.debug("buffer.revoked.empty", extra={"redis_key": key})
+                        continue
+                    items.append(self._load_buffered_incr(values))
+
+            statements = self.process_many(items)
+        finally:
+            self._unlock_keys(keys)
+
+        duration = time() - start
+        metrics.distribution("buffer.bulk-flush.keys", len(items))
+        metrics.distribution("buffer.bulk-flush.db-statements", statements)
+        metrics.distribution("buffer.bulk-flush.duration", duration, unit="second")
+        if duration > 0:
+            metrics.distribution("buffer.bulk-flush.keys-per-second", len(items) / duration)
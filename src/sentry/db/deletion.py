@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import itertools
 from collections.abc import Generator
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
@@ -11,27 +11,63 @@ from django.utils import timezone
 
 
 class BulkDeleteQuery:
-    def __init__(self, model, project_id=None, dtfield=None, days=None, order_by=None):
+    def __init__(self, model, project_id=None, dtfield=None, days=None, order_by=None, cutoff=None):
         self.model = model
         self.project_id = int(project_id) if project_id else None
         self.dtfield = dtfield
         self.days = int(days) if days is not None else None
         self.order_by = order_by
+        # An explicit cutoff takes precedence over `days`, so that chunks of the same
+        # delete run at different times agree on which rows are expired.
+        self.cutoff: datetime | None = cutoff
         self.using = router.db_for_write(model)
 
-    def execute(self, chunk_size=10000):
-        quote_name = connections[self.using].ops.quote_name
+    def get_cutoff(self) -> datetime | None:
+        if self.cutoff is not None:
+            return self.cutoff
+        if self.days is not None:
+            return timezone.now() - timedelta(days=self.days)
+        return None
 
+    def _where(self, quote_name) -> list[str]:
         where = []
-        if self.dtfield and self.days is not None:
+        cutoff = self.get_cutoff()
+        if self.dtfield and cutoff is not None:
             where.append(
-                "{} < '{}'::timestamptz".format(
-                    quote_name(self.dtfield),
-                    (timezone.now() - timedelta(days=self.days)).isoformat(),
-                )
+                "{} < '{}'::timestamptz".format(quote_name(self.dtfield), cutoff.isoformat())
             )
         if self.project_id:
             where.append(f"project_id = {self.project_id}")
+        return where
+
+    def get_id_bounds(self) -> tuple[int, int] | None:
+        """
+        Return the lowest and highest id of the rows this query would delete, or None
+        when there are none.
+        """
+        quote_name = connections[self.using].ops.quote_name
+        where = self._where(quote_name)
+        where_clause = "where {}".format(" and ".join(where)) if where else ""
+
+        cursor = connections[self.using].cursor()
+        cursor.execute(f"select min(id), max(id) from {self.model._meta.db_table} {where_clause}")
+        min_id, max_id = cursor.fetchone()
+        if min_id is None:
+            return None
+        return min_id, max_id
+
+    def execute(self, chunk_size=10000, id_range: tuple[int, int] | None = None) -> int:
+        """
+        Delete matching rows `chunk_size` at a time and return the number deleted.
+
+        `id_range` is a half open `[min, max)` range that restricts the delete, to
+        split one large delete across several workers.
+        """
+        quote_name = connections[self.using].ops.quote_name
+
+        where = self._where(quote_name)
+        if id_range is not None:
+            where.append(f"id >= {int(id_range[0])} and id < {int(id_range[1])}")
 
         if where:
             where_clause = "where {}".format(" and ".join(where))
@@ -67,12 +103,16 @@ class BulkDeleteQuery:
 
         return self._continuous_query(query)
 
-    def _continuous_query(self, query):
+    def _continuous_query(self, query) -> int:
+        deleted = 0
         results = True
         cursor = connections[self.using].cursor()
         while results:
             cursor.execute(query)
             results = cursor.rowcount > 0
+            if results:
+                deleted += cursor.rowcount
+        return deleted
 
     def iterator(self, chunk_size=100, batch_size=100000) -> Generator[tuple[int, ...]]:
         assert self.days is not None
@@ -2,15 +2,17 @@ from __future__ import annotations
 
 import logging
 import time
-from collections.abc import Generator, Iterable
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
-from typing import Any
+from typing import Any, TypeVar
 
 from rb.clients import LocalClient
 from redis.exceptions import ResponseError
 
 from sentry.digests.backends.base import Backend, InvalidState, ScheduleEntry
 from sentry.digests.types import Record
+from sentry.utils import metrics
 from sentry.utils.locking.backends.redis import RedisLockBackend
 from sentry.utils.locking.lock import Lock
 from sentry.utils.locking.manager import LockManager
@@ -21,6 +23,8 @@ logger = logging.getLogger("sentry.digests")
 
 script = load_redis_script("digests/digests.lua")
 
+T = TypeVar("T")
+
 
 class RedisBackend(Backend):
     """
@@ -88,6 +92,11 @@ class RedisBackend(Backend):
         # too early.
         self.ttl = options.pop("ttl", 60 * 60)
 
+        # The maximum number of host partitions that are scheduled or
+        # maintained concurrently. Each partition is a single script call, so
+        # the work is almost entirely waiting on the network.
+        self.partition_concurrency = options.pop("partition_concurrency", 8)
+
         super().__init__(**options)
 
     def validate(self) -> None:
@@ -143,9 +152,56 @@ class RedisBackend(Backend):
             )
         )
 
+    def _map_partitions(
+        self, operation: str, fn: Callable[[int], T]
+    ) -> Iterator[tuple[int, T | None]]:
+        """
+        Call `fn` for every host of the cluster, running up to
+        `partition_concurrency` hosts at a time, and yield `(host, result)`
+        pairs in completion order. Errors are logged and yield a `None` result
+        so that a single unavailable host does not hold back the others.
+        """
+
+        def run(host: int) -> T:
+            with metrics.timer(f"digests.{operation}.partition.duration", tags={"host": host}):
+                return fn(host)
+
+        hosts = list(self.cluster.hosts)
+        workers = min(len(hosts), self.partition_concurrency)
+        if workers <= 1:
+            for host in hosts:
+                try:
+                    yield host, run(host)
+                except Exception:
+                    logger.exception(
+                        "Failed to perform %s for digest partition %s",
+                        operation,
+                        host,
+                        extra={"host": host},
+                    )
+                    yield host, None
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix=f"digests-{operation}"
+        ) as executor:
+            futures = {executor.submit(run, host): host for host in hosts}
+            for future in as_completed(futures):
+                host = futures[future]
+                try:
+                    yield host, future.result()
+                except Exception:
+                    logger.exception(
+                        "Failed to perform %s for digest partition %s",
+                        operation,
+                        host,
+                        extra={"host": host},
+                    )
+                    yield host, None
+
     def __schedule_partition(
         self, host: int, deadline: float, timestamp: float
-    ) -> Iterable[tuple[bytes, float]]:
+    ) -> list[tuple[bytes, float]]:
         return script(
             ["-"],
             ["SCHEDULE", self.namespace, self.ttl, timestamp, deadline],
@@ -156,37 +212,44 @@ class RedisBackend(Backend):
         if timestamp is None:
             timestamp = time.time()
 
-        for host in self.cluster.hosts:
-            try:
-                for key, timestamp in self.__schedule_partition(host, deadline, timestamp):
-                    yield ScheduleEntry(key.decode("utf-8"), float(timestamp))
-            except Exception as error:
-                logger.exception(
-                    "Failed to perform scheduling for partition %s due to error: %s",
-                    host,
-                    error,
-                )
+        for host, entries in self._map_partitions(
+            "schedule", lambda host: self.__schedule_partition(host, deadline, timestamp)
+        ):
+            if entries is None:
+                continue
+
+            metrics.distribution(
+                "digests.schedule.partition.scheduled", len(entries), tags={"host": host}
+            )
+            for key, entry_timestamp in entries:
+                yield ScheduleEntry(key.decode("utf-8"), float(entry_timestamp))
 
     def __maintenance_partition(self, host: int, deadline: float, timestamp: float) -> None:
+        connection = self.cluster.get_local_client(host)
         script(
             ["-"],
             ["MAINTENANCE", self.namespace, self.ttl, timestamp, deadline],
-            self.cluster.get_local_client(host),
+            connection,
         )
 
+        # After maintenance, anything left in the ready set is still waiting
+        # on a digest task, which is the partition's delivery backlog.
+        with connection.pipeline(transaction=False) as pipeline:
+            pipeline.zcard(f"{self.namespace}:s:w")
+            pipeline.zcard(f"{self.namespace}:s:r")
+            waiting, ready = pipeline.execute()
+
+        metrics.gauge("digests.schedule.waiting", waiting, tags={"host": host})
+        metrics.gauge("digests.schedule.ready", ready, tags={"host": host})
+
     def maintenance(self, deadline: float, timestamp: float | None = None) -> None:
         if timestamp is None:
             timestamp = time.time()
 
-        for host in self.cluster.hosts:
-            try:
-                self.__maintenance_partition(host, deadline, timestamp)
-            except Exception as error:
-                logger.exception(
-                    "Failed to perform maintenance on digest partition %s due to error: %s",
-                    host,
-                    error,
-                )
+        for _ in self._map_partitions(
+            "maintenance", lambda host: self.__maintenance_partition(host, deadline, timestamp)
+        ):
+            pass
 
     @contextmanager
     def digest(
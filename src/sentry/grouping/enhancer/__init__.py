@@ -3,6 +3,7 @@ from __future__ import annotations
 import base64
 import logging
 import os
+import threading
 import zlib
 from collections import Counter
 from collections.abc import Sequence
@@ -14,6 +15,7 @@ from typing import Any, Literal
 import msgpack
 import sentry_sdk
 import zstandard
+from cachetools import LRUCache
 from sentry_ophio.enhancers import AssembleResult as RustStacktraceResult
 from sentry_ophio.enhancers import Cache as RustCache
 from sentry_ophio.enhancers import Component as RustFrame
@@ -37,6 +39,12 @@ logger = logging.getLogger(__name__)
 # So this leaves quite a bit of headroom for custom enhancement rules as well.
 RUST_CACHE = RustCache(1_000)
 
+# Decoded `Enhancements` objects, keyed by their base64 representation. Every event carries the
+# base64 string of its project's enhancements, so there are only as many distinct keys as there are
+# projects with custom rules (and bases) being processed.
+_BASE64_ENHANCEMENTS_CACHE: LRUCache[bytes, Enhancements] = LRUCache(maxsize=1_000)
+_BASE64_ENHANCEMENTS_CACHE_LOCK = threading.Lock()
+
 # TODO: Move 3 to the end when we're ready for it to be the default
 VERSIONS = [
     3,  # Enhancements with this version run the split enhancements experiment
@@ -856,17 +864,37 @@ class Enhancements:
     def from_base64_string(
         cls, base64_string: str | bytes, referrer: str | None = None
     ) -> Enhancements:
-        """Convert a base64 string into an `Enhancements` object"""
+        """
+        Convert a base64 string into an `Enhancements` object.
+
+        Decoded objects are kept in an LRU keyed by the base64 string, since the same few configs
+        get decoded for every event.
+        """
+        raw_bytes_str = (
+            base64_string.encode("ascii", "ignore")
+            if isinstance(base64_string, str)
+            else base64_string
+        )
+
+        with _BASE64_ENHANCEMENTS_CACHE_LOCK:
+            enhancements = _BASE64_ENHANCEMENTS_CACHE.get(raw_bytes_str)
 
+        metrics.incr(
+            "grouping.enhancements.base64_cache",
+            tags={"hit": enhancements is not None, "referrer": referrer},
+        )
+        if enhancements is None:
+            enhancements = cls._from_base64_bytes(raw_bytes_str, referrer)
+            with _BASE64_ENHANCEMENTS_CACHE_LOCK:
+                _BASE64_ENHANCEMENTS_CACHE[raw_bytes_str] = enhancements
+
+        return enhancements
+
+    @classmethod
+    def _from_base64_bytes(cls, raw_bytes_str: bytes, referrer: str | None = None) -> Enhancements:
         with metrics.timer("grouping.enhancements.creation") as metrics_timer_tags:
             metrics_timer_tags.update({"source": "base64_string", "referrer": referrer})
 
-            raw_bytes_str = (
-                base64_string.encode("ascii", "ignore")
-                if isinstance(base64_string, str)
-                else base64_string
-            )
-
             # Split the string to get encoded data for each set of rules: unsplit rules (i.e., rules
             # the way they're stored in project config), classifier rules, and contributes rules.
             # Older base64 strings - such as those stored in events created before rule-splitting was
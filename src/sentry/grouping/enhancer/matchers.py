@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, Literal, Self, TypedDict
 
 from sentry.grouping.utils import bool_from_string
@@ -15,6 +16,10 @@ from .exceptions import InvalidEnhancerConfig
 # A cache of function return values, keyed by function and args
 ReturnValueCache = dict[tuple[Any, ...], Any]
 
+# How many distinct frames (by platform, function, module, package and path) to
+# keep precomputed match data for
+MATCH_FRAME_CACHE_SIZE = 10_000
+
 
 def _cached(
     cache: ReturnValueCache,
@@ -104,40 +109,72 @@ def _get_function_name(frame_data: dict[str, Any], platform: str | None) -> str:
     return function_name or "<unknown>"
 
 
-def create_match_frame(frame_data: dict[str, Any], platform: str | None) -> MatchFrame:
-    """Create flat dict of values relevant to matchers"""
-    match_frame = dict(
-        category=get_path(frame_data, "data", "category"),
-        family=get_behavior_family_for_platform(frame_data.get("platform") or platform),
-        function=_get_function_name(frame_data, platform),
-        in_app=frame_data.get("in_app"),
-        orig_in_app=get_path(frame_data, "data", "orig_in_app"),
-        module=get_path(frame_data, "module"),
-        package=frame_data.get("package"),
-        path=frame_data.get("abs_path") or frame_data.get("filename"),
+def _encode_match_value(value: Any, path_like: bool = False) -> Any:
+    if isinstance(value, (bytes, str)):
+        if isinstance(value, str):
+            value = value.encode("utf-8")
+
+        if path_like:
+            # NOTE: path-like matchers are case insensitive, and normalize
+            # file-system separators to `/`.
+            # We do this here in a central place instead of in each matcher separately.
+            value = value.lower().replace(b"\\", b"/")
+
+    return value
+
+
+@lru_cache(maxsize=MATCH_FRAME_CACHE_SIZE)
+def _create_static_match_frame(
+    platform: str | None,
+    function: Any,
+    has_raw_function: bool,
+    module: Any,
+    package: Any,
+    path: Any,
+) -> tuple[Any, Any, Any, Any, Any]:
+    """
+    Computes the parts of a match frame which only depend on the frame's
+    identity (as opposed to ``in_app`` and ``category``, which get updated by
+    the enhancer itself). Frames repeat a lot within a stacktrace and across
+    events, so this is cached.
+    """
+    frame_data = {"function": function, "raw_function": has_raw_function, "platform": platform}
+    return (
+        _encode_match_value(get_behavior_family_for_platform(platform)),
+        _encode_match_value(_get_function_name(frame_data, platform)),
+        _encode_match_value(module),
+        _encode_match_value(package, path_like=True),
+        _encode_match_value(path, path_like=True),
     )
 
-    for key in list(match_frame.keys()):
-        value = match_frame[key]
-        if isinstance(value, (bytes, str)):
-            if isinstance(value, str):
-                value = match_frame[key] = value.encode("utf-8")
 
-            if key in ("package", "path"):
-                # NOTE: path-like matchers are case insensitive, and normalize
-                # file-system separators to `/`.
-                # We do this here in a central place instead of in each matcher separately.
-                value = match_frame[key] = value.lower().replace(b"\\", b"/")
+def create_match_frame(frame_data: dict[str, Any], platform: str | None) -> MatchFrame:
+    """Create flat dict of values relevant to matchers"""
+    static_key = (
+        frame_data.get("platform") or platform,
+        frame_data.get("function"),
+        bool(frame_data.get("raw_function")),
+        get_path(frame_data, "module"),
+        frame_data.get("package"),
+        frame_data.get("abs_path") or frame_data.get("filename"),
+    )
+    try:
+        family, function, module, package, path = _create_static_match_frame(*static_key)
+    except TypeError:
+        # Unhashable garbage in the frame, don't bother caching it
+        family, function, module, package, path = _create_static_match_frame.__wrapped__(
+            *static_key
+        )
 
     return MatchFrame(
-        category=match_frame["category"],
-        family=match_frame["family"],
-        function=match_frame["function"],
-        in_app=match_frame["in_app"],
-        orig_in_app=match_frame["orig_in_app"],
-        module=match_frame["module"],
-        package=match_frame["package"],
-        path=match_frame["path"],
+        category=_encode_match_value(get_path(frame_data, "data", "category")),
+        family=family,
+        function=function,
+        in_app=frame_data.get("in_app"),
+        orig_in_app=get_path(frame_data, "data", "orig_in_app"),
+        module=module,
+        package=package,
+        path=path,
     )
 
 
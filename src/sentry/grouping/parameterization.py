@@ -1,10 +1,12 @@
 import dataclasses
 import re
+import threading
 from collections import defaultdict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Hashable, Sequence
 from functools import lru_cache
 
 import tiktoken
+from cachetools import LRUCache
 
 __all__ = [
     "ParameterizationCallable",
@@ -12,6 +14,7 @@ __all__ = [
     "ParameterizationExperiment",
     "ParameterizationRegex",
     "ParameterizationRegexExperiment",
+    "ParameterizationResultCache",
     "Parameterizer",
     "UniqueIdExperiment",
 ]
@@ -237,6 +240,7 @@ class _UniqueId:
     TOKEN_LENGTH_RATIO_LONG = 0.4
 
     @staticmethod
+    @lru_cache(maxsize=10_000)
     def is_probably_uniq_id(token_str: str) -> bool:
         token_str = token_str.strip("\"'[]{}():;")
         if len(token_str) < _UniqueId.TOKEN_LENGTH_MINIMUM:
@@ -275,19 +279,58 @@ UniqueIdExperiment = ParameterizationCallableExperiment(
 ParameterizationExperiment = ParameterizationCallableExperiment | ParameterizationRegexExperiment
 
 
+class ParameterizationResultCache:
+    """
+    A bounded, thread-safe LRU of parameterization results, keyed by the input
+    string and everything that can influence the output. The same messages
+    tend to get parameterized over and over again, so this can be shared
+    between `Parameterizer` instances.
+
+    Inputs longer than `max_content_length` are never cached, so the memory
+    used by the cache is bounded by roughly `maxsize * max_content_length`.
+    """
+
+    def __init__(self, maxsize: int, max_content_length: int = 1024):
+        self._cache: LRUCache[Hashable, tuple[str, dict[str, int]]] = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self.max_content_length = max_content_length
+
+    def get(self, key: Hashable) -> tuple[str, dict[str, int]] | None:
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: Hashable, value: tuple[str, dict[str, int]]) -> None:
+        with self._lock:
+            self._cache[key] = value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+def _get_experiment_cache_key(experiment: ParameterizationExperiment) -> Hashable:
+    if isinstance(experiment, ParameterizationCallableExperiment):
+        return (experiment.name, experiment.apply)
+    return (experiment.name, experiment.raw_pattern, experiment.lookbehind, experiment.lookahead)
+
+
 class Parameterizer:
     def __init__(
         self,
         regex_pattern_keys: Sequence[str],
         experiments: Sequence[ParameterizationExperiment] = (),
+        result_cache: ParameterizationResultCache | None = None,
     ):
-        self._parameterization_regex = self._make_regex_from_patterns(regex_pattern_keys)
+        self._regex_pattern_keys = tuple(regex_pattern_keys)
+        self._parameterization_regex = self._make_regex_from_patterns(self._regex_pattern_keys)
         self._experiments = experiments
+        self._result_cache = result_cache
 
         self.matches_counter: defaultdict[str, int] = defaultdict(int)
 
     @staticmethod
-    def _make_regex_from_patterns(pattern_keys: Sequence[str]) -> re.Pattern[str]:
+    @lru_cache(maxsize=32)
+    def _make_regex_from_patterns(pattern_keys: tuple[str, ...]) -> re.Pattern[str]:
         """
         Takes list of pattern keys and returns a compiled regex pattern that matches any of them.
 
@@ -365,4 +408,28 @@ class Parameterizer:
     def parameterize_all(
         self, content: str, should_run: Callable[[str], bool] = lambda _: True
     ) -> str:
-        return self.parametrize_w_experiments(self.parametrize_w_regex(content), should_run)
+        if self._result_cache is None or len(content) > self._result_cache.max_content_length:
+            return self.parametrize_w_experiments(self.parametrize_w_regex(content), should_run)
+
+        experiments_to_run = [e for e in self._experiments if should_run(e.name)]
+        cache_key = (
+            self._regex_pattern_keys,
+            tuple(_get_experiment_cache_key(e) for e in experiments_to_run),
+            content,
+        )
+
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            result, matches = cached
+        else:
+            parameterizer = Parameterizer(self._regex_pattern_keys, experiments_to_run)
+            result = parameterizer.parametrize_w_experiments(
+                parameterizer.parametrize_w_regex(content)
+            )
+            matches = dict(parameterizer.matches_counter)
+            self._result_cache.set(cache_key, (result, matches))
+
+        for key, count in matches.items():
+            self.matches_counter[key] += count
+
+        return result
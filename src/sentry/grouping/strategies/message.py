@@ -5,7 +5,11 @@ from typing import TYPE_CHECKING, Any
 
 from sentry import analytics
 from sentry.grouping.component import MessageGroupingComponent
-from sentry.grouping.parameterization import Parameterizer, UniqueIdExperiment
+from sentry.grouping.parameterization import (
+    ParameterizationResultCache,
+    Parameterizer,
+    UniqueIdExperiment,
+)
 from sentry.grouping.strategies.base import (
     GroupingContext,
     ReturnedVariants,
@@ -37,6 +41,9 @@ REGEX_PATTERN_KEYS = (
     "bool",
 )
 
+# Log-heavy projects send the same messages over and over again, so we keep the results around
+PARAMETERIZATION_CACHE = ParameterizationResultCache(maxsize=10_000)
+
 EXPERIMENT_PROJECTS = [  # Active internal Sentry projects
     1,
     11276,
@@ -72,7 +79,9 @@ def normalize_message_for_grouping(message: str, event: Event, share_analytics:
         trimmed += "..."
 
     parameterizer = Parameterizer(
-        regex_pattern_keys=REGEX_PATTERN_KEYS, experiments=(UniqueIdExperiment,)
+        regex_pattern_keys=REGEX_PATTERN_KEYS,
+        experiments=(UniqueIdExperiment,),
+        result_cache=PARAMETERIZATION_CACHE,
     )
 
     def _shoudl_run_experiment(experiment_name: str) -> bool:
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
-from collections.abc import Mapping
+from collections import Counter, defaultdict
+from collections.abc import Mapping, Sequence
 from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Any
 from uuid import UUID
@@ -22,7 +22,7 @@ from sentry import nodestore, options
 from sentry.event_manager import GroupInfo
 from sentry.eventstore.models import Event
 from sentry.issues.grouptype import InvalidGroupTypeError, get_group_type_by_type_id
-from sentry.issues.ingest import process_occurrence_data, save_issue_occurrence
+from sentry.issues.ingest import hash_fingerprint, process_occurrence_data, save_issue_occurrence
 from sentry.issues.issue_occurrence import DEFAULT_LEVEL, IssueOccurrence, IssueOccurrenceData
 from sentry.issues.json_schemas import EVENT_PAYLOAD_SCHEMA, LEGACY_EVENT_PAYLOAD_SCHEMA
 from sentry.issues.producer import PayloadType
@@ -77,6 +77,43 @@ def is_rate_limited(
         return False
 
 
+def check_rate_limits(keys: Sequence[tuple[int, str]]) -> list[bool]:
+    """
+    Checks `is_rate_limited` for many (project_id, fingerprint) pairs with a
+    single Redis round trip. Occurrences of the same project and fingerprint
+    are requested together and granted in order, so the earliest ones get the
+    remaining quota.
+    """
+    if not keys:
+        return []
+    try:
+        rate_limit_enabled = options.get("issues.occurrence-consumer.rate-limit.enabled")
+        if not rate_limit_enabled:
+            return [False] * len(keys)
+
+        rate_limit_quota = Quota(**options.get("issues.occurrence-consumer.rate-limit.quota"))
+        counts = Counter(keys)
+        granted_quotas = rate_limiter.check_and_use_quotas(
+            [
+                RequestedQuota(
+                    create_rate_limit_key(project_id, fingerprint),
+                    count,
+                    [rate_limit_quota],
+                )
+                for (project_id, fingerprint), count in counts.items()
+            ]
+        )
+        remaining = {key: granted.granted for key, granted in zip(counts, granted_quotas)}
+        limited = []
+        for key in keys:
+            limited.append(remaining[key] <= 0)
+            remaining[key] -= 1
+        return limited
+    except Exception:
+        logger.exception("Failed to check issue platform rate limiter")
+        return [False] * len(keys)
+
+
 @sentry_sdk.tracing.trace
 def save_event_from_occurrence(
     data: dict[str, Any],
@@ -167,13 +204,17 @@ def process_event_and_issue_occurrence(
 @sentry_sdk.tracing.trace
 def lookup_event_and_process_issue_occurrence(
     occurrence_data: IssueOccurrenceData,
+    event: Event | None = None,
 ) -> tuple[IssueOccurrence, GroupInfo | None]:
     project_id = occurrence_data["project_id"]
     event_id = occurrence_data["event_id"]
-    try:
-        event = lookup_event(project_id, event_id)
-    except Exception:
-        raise EventLookupError(f"Failed to lookup event({event_id}) for project_id({project_id})")
+    if event is None:
+        try:
+            event = lookup_event(project_id, event_id)
+        except Exception:
+            raise EventLookupError(
+                f"Failed to lookup event({event_id}) for project_id({project_id})"
+            )
 
     with metrics.timer(
         "occurrence_consumer._process_message.save_issue_occurrence",
@@ -323,7 +364,10 @@ def _get_kwargs(payload: Mapping[str, Any]) -> Mapping[str, Any]:
 @sentry_sdk.tracing.trace
 @metrics.wraps("occurrence_consumer.process_occurrence_message")
 def process_occurrence_message(
-    message: Mapping[str, Any], txn: Transaction | NoOpSpan | Span
+    message: Mapping[str, Any],
+    txn: Transaction | NoOpSpan | Span,
+    rate_limited: bool | None = None,
+    events: Mapping[str, Event] | None = None,
 ) -> tuple[IssueOccurrence, GroupInfo | None] | None:
     with metrics.timer("occurrence_consumer._process_message._get_kwargs"):
         kwargs = _get_kwargs(message)
@@ -356,7 +400,9 @@ def process_occurrence_message(
         txn.set_tag("result", "dropped_feature_disabled")
         return None
 
-    if is_rate_limited(project.id, fingerprint=occurrence_data["fingerprint"][0]):
+    if rate_limited is None:
+        rate_limited = is_rate_limited(project.id, fingerprint=occurrence_data["fingerprint"][0])
+    if rate_limited:
         metrics.incr(
             "occurrence_ingest.dropped_rate_limited",
             sample_rate=1.0,
@@ -382,15 +428,23 @@ def process_occurrence_message(
             "occurrence_consumer._process_message.lookup_event_and_process_issue_occurrence",
             tags=metric_tags,
         ):
-            return lookup_event_and_process_issue_occurrence(kwargs["occurrence_data"])
+            event = None
+            if events is not None:
+                event = events.get(Event.generate_node_id(project.id, occurrence_data["event_id"]))
+            return lookup_event_and_process_issue_occurrence(kwargs["occurrence_data"], event)
 
 
 @sentry_sdk.tracing.trace
 @metrics.wraps("occurrence_consumer.process_message")
 def _process_message(
     message: Mapping[str, Any],
+    rate_limited: bool | None = None,
+    events: Mapping[str, Event] | None = None,
 ) -> tuple[IssueOccurrence | None, GroupInfo | None] | None:
     """
+    :param rate_limited: the result of the rate limit check for this message, when it was
+        already checked as part of a batch.
+    :param events: events prefetched from nodestore by node id.
     :raises InvalidEventPayloadError: when the message is invalid
     :raises EventLookupError: when the provided event_id in the message couldn't be found.
     """
@@ -408,7 +462,7 @@ def _process_message(
 
                 return None, GroupInfo(group=group, is_new=False, is_regression=False)
             elif payload_type == PayloadType.OCCURRENCE.value:
-                return process_occurrence_message(message, txn)
+                return process_occurrence_message(message, txn, rate_limited, events)
             else:
                 metrics.incr(
                     "occurrence_consumer._process_message.dropped_invalid_payload_type",
@@ -490,11 +544,68 @@ def process_occurrence_group(items: list[Mapping[str, Any]]) -> None:
             sample_rate=1.0,
         )
 
-    for item in items:
-        cache_key = f"occurrence_consumer.process_occurrence_group.{item['id']}"
-        if cache.get(cache_key):
+    cache_keys = [f"occurrence_consumer.process_occurrence_group.{item['id']}" for item in items]
+    seen = cache.get_many(cache_keys)
+    processed: set[str] = set()
+
+    # Rate limits and events of all occurrences are fetched up front, so that
+    # a burst for one fingerprint costs one Redis and one nodestore round trip.
+    # Occurrences that `process_occurrence_message` drops before its rate limit
+    # check must not spend quota, so they are skipped here as well.
+    occurrences: dict[int, tuple[int, str]] = {}
+    queued: set[str] = set()
+    event_keys: dict[str, tuple[int, str]] = {}
+    for index, (item, cache_key) in enumerate(zip(items, cache_keys)):
+        payload_type = item.get("payload_type", PayloadType.OCCURRENCE.value)
+        if payload_type != PayloadType.OCCURRENCE.value or seen.get(cache_key):
+            continue
+        if cache_key in queued:
+            continue
+        queued.add(cache_key)
+        try:
+            project_id = item["project_id"]
+            fingerprint = hash_fingerprint(item["fingerprint"])[0]
+            project = Project.objects.get_from_cache(id=project_id)
+            organization = Organization.objects.get_from_cache(id=project.organization_id)
+            if not get_group_type_by_type_id(item["type"]).allow_ingest(organization):
+                continue
+            if "event" not in item:
+                event_id = UUID(item["event_id"]).hex
+                event_keys[Event.generate_node_id(project_id, event_id)] = (project_id, event_id)
+        except (
+            KeyError,
+            IndexError,
+            TypeError,
+            ValueError,
+            InvalidGroupTypeError,
+            Project.DoesNotExist,
+            Organization.DoesNotExist,
+        ):
+            # Invalid messages are rejected when they are processed
+            continue
+        occurrences[index] = (project_id, fingerprint)
+
+    rate_limits = dict(zip(occurrences, check_rate_limits(list(occurrences.values()))))
+    events: dict[str, Event] = {}
+    if event_keys:
+        try:
+            bulk_data = nodestore.backend.get_multi(list(event_keys))
+        except Exception:
+            # Events that weren't prefetched are looked up one by one
+            logger.exception("Failed to prefetch events for occurrences")
+            bulk_data = {}
+        for node_id, data in bulk_data.items():
+            if data is not None:
+                project_id, event_id = event_keys[node_id]
+                event = Event(event_id=event_id, project_id=project_id)
+                event.data = data
+                events[node_id] = event
+
+    for index, (item, cache_key) in enumerate(zip(items, cache_keys)):
+        if seen.get(cache_key) or cache_key in processed:
             logger.info("Skipping processing of occurrence %s due to cache hit", item["id"])
             continue
-        _process_message(item)
+        _process_message(item, rate_limits.get(index), events)
+        processed.add(cache_key)
         # just need a 300 second cache
         cache.set(cache_key, 1, 300)
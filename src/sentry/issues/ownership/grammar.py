@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import re
-from collections import namedtuple
+from collections import defaultdict, namedtuple
 from collections.abc import Callable, Iterable, Mapping, Sequence
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 from parsimonious.exceptions import ParseError
@@ -320,6 +321,94 @@ def load_schema(schema: Mapping[str, Any]) -> list[Rule]:
     return [Rule.load(r) for r in schema["rules"]]
 
 
+# Characters that make a path component of a glob or CODEOWNERS pattern match
+# something other than exactly that component.
+_NON_LITERAL_CHARS = frozenset("*?[]{}!\\")
+
+
+def _literal_path_components(pattern: str) -> list[str]:
+    """
+    Return the components of a `path` or `codeowners` pattern that any
+    matching path must contain as a whole component (case-folded).
+    """
+    return [
+        component.casefold()
+        for component in pattern.split("/")
+        if component and component not in (".", "..") and _NON_LITERAL_CHARS.isdisjoint(component)
+    ]
+
+
+class RuleIndex:
+    """
+    An index over the rules of an ownership schema that narrows down which
+    rules can possibly match an event before running their (comparatively
+    expensive) matchers.
+
+    Every literal component of a `path`/`codeowners` pattern (``src`` and
+    ``api`` in ``src/api/*.py``) has to appear as a whole component in a
+    frame path for the pattern to match. Each such rule is indexed under its
+    longest literal component, so a single pass over the components of all
+    frame paths yields the candidate rules. Candidates are then verified with
+    `Matcher.test`, which keeps matching semantics exactly as before. Rules
+    without literal components and other matcher types are always
+    candidates.
+    """
+
+    def __init__(self, matchers: Sequence[tuple[str, str]]) -> None:
+        self.num_rules = len(matchers)
+        self.unindexed: list[int] = []
+        self.by_component: dict[str, list[int]] = defaultdict(list)
+
+        for i, (type, pattern) in enumerate(matchers):
+            components = _literal_path_components(pattern) if type in (PATH, CODEOWNERS) else []
+            if components:
+                self.by_component[max(components, key=len)].append(i)
+            else:
+                self.unindexed.append(i)
+
+        self.by_component = dict(self.by_component)
+
+    def candidates(
+        self, munged_data: tuple[Sequence[Mapping[str, Any]], Sequence[str]]
+    ) -> list[int]:
+        """
+        Return the positions of all rules that may match, in schema order.
+        """
+        frames, keys = munged_data
+        if not self.by_component:
+            return self.unindexed
+
+        seen_components = set()
+        for frame in frames:
+            for key in keys:
+                value = frame.get(key)
+                if value and isinstance(value, str):
+                    seen_components.update(value.replace("\\", "/").casefold().split("/"))
+
+        candidates = list(self.unindexed)
+        for component in seen_components:
+            candidates.extend(self.by_component.get(component, ()))
+        candidates.sort()
+        return candidates
+
+
+@lru_cache(maxsize=256)
+def _get_rule_index(matchers: tuple[tuple[str, str], ...]) -> RuleIndex:
+    return RuleIndex(matchers)
+
+
+def get_rule_index(schema: Mapping[str, Any]) -> RuleIndex:
+    """
+    Return the (cached) `RuleIndex` of an ownership schema. The index only
+    depends on the matchers of the rules, so owner changes reuse it.
+    """
+    if schema["$version"] != VERSION:
+        raise RuntimeError("Invalid schema $version: %r" % schema["$version"])
+    return _get_rule_index(
+        tuple((r["matcher"]["type"], r["matcher"]["pattern"]) for r in schema["rules"])
+    )
+
+
 def convert_schema_to_rules_text(schema: Mapping[str, Any]) -> str:
     rules = load_schema(schema)
     text = ""
@@ -14,7 +14,7 @@ from sentry.backup.scopes import RelocationScope
 from sentry.db.models import Model, region_silo_model, sane_repr
 from sentry.db.models.fields import FlexibleForeignKey, JSONField
 from sentry.eventstore.models import Event, GroupEvent
-from sentry.issues.ownership.grammar import Matcher, Rule, load_schema, resolve_actors
+from sentry.issues.ownership.grammar import Matcher, Rule, get_rule_index, resolve_actors
 from sentry.models.activity import Activity
 from sentry.models.group import Group
 from sentry.models.groupowner import OwnerRuleType
@@ -377,13 +377,22 @@ class ProjectOwnership(Model):
             tags={"ownership_type": ownership_type},
         )
 
-        rules = load_schema(ownership.schema)
+        # Only rules the index could not rule out are loaded and tested.
+        rule_index = get_rule_index(ownership.schema)
+        candidates = rule_index.candidates(munged_data)
         metrics.distribution(
             key="projectownership.matching_ownership_rules.rules",
-            value=len(rules),
+            value=rule_index.num_rules,
+            tags={"ownership_type": ownership_type},
+        )
+        metrics.distribution(
+            key="projectownership.matching_ownership_rules.candidates",
+            value=len(candidates),
             tags={"ownership_type": ownership_type},
         )
 
+        schema_rules = ownership.schema["rules"]
+        rules = [Rule.load(schema_rules[i]) for i in candidates]
         return [rule for rule in rules if rule.test(data, munged_data)]
 
 
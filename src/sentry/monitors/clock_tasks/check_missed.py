@@ -49,13 +49,15 @@ def dispatch_check_missing(ts: datetime):
 
     This will dispatch MarkMissing messages into monitors-clock-tasks.
     """
+    # This is a single range scan over the `sentry_monitorenv_missed` index,
+    # next_checkin_latest is kept up to date by every check-in
     missed_envs = list(
         MonitorEnvironment.objects.filter(
             IGNORE_MONITORS,
             next_checkin_latest__lte=ts,
-        ).values(
-            "id"
-        )[:MONITOR_LIMIT]
+        )
+        .order_by("next_checkin_latest")
+        .values("id")[:MONITOR_LIMIT]
     )
 
     metrics.gauge(
@@ -29,13 +29,14 @@ def dispatch_check_timeout(ts: datetime):
 
     This will dispatch MarkTimeout messages into monitors-clock-tasks.
     """
+    # This is a single range scan over the (status, timeout_at) index
     timed_out_checkins = list(
         MonitorCheckIn.objects.filter(
             status=CheckInStatus.IN_PROGRESS,
             timeout_at__lte=ts,
-        ).values(
-            "id", "monitor_environment_id"
-        )[:CHECKINS_LIMIT]
+        )
+        .order_by("timeout_at")
+        .values("id", "monitor_environment_id")[:CHECKINS_LIMIT]
     )
 
     metrics.gauge(
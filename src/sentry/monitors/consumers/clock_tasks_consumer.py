@@ -22,6 +22,7 @@ from sentry.conf.types.kafka_definition import Topic, get_topic_codec
 from sentry.monitors.clock_tasks.check_missed import mark_environment_missing
 from sentry.monitors.clock_tasks.check_timeout import mark_checkin_timeout
 from sentry.monitors.clock_tasks.mark_unknown import mark_checkin_unknown
+from sentry.utils import metrics
 
 MONITORS_CLOCK_TASKS_CODEC: Codec[MonitorsClockTasks] = get_topic_codec(Topic.MONITORS_CLOCK_TASKS)
 
@@ -50,17 +51,21 @@ def process_clock_task(message: Message[KafkaPayload | FilteredPayload]):
 
         if is_mark_timeout(wrapper):
             mark_checkin_timeout(int(wrapper["checkin_id"]), ts)
-            return
-
-        if is_mark_unknown(wrapper):
+        elif is_mark_unknown(wrapper):
             mark_checkin_unknown(int(wrapper["checkin_id"]), ts)
-            return
-
-        if is_mark_missing(wrapper):
+        elif is_mark_missing(wrapper):
             mark_environment_missing(int(wrapper["monitor_environment_id"]), ts)
+        else:
+            logger.error("Unsupported clock-tick task type: %s", wrapper["type"])
             return
 
-        logger.error("Unsupported clock-tick task type: %s", wrapper["type"])
+        # Time from the clock tick until its task was processed. This includes
+        # the dispatch and the time the task spent in the clock tasks topic.
+        metrics.timing(
+            "monitors.clock_tasks.tick_to_mark",
+            (datetime.now(timezone.utc) - ts).total_seconds(),
+            tags={"type": wrapper["type"]},
+        )
     except Exception:
         logger.exception("Failed to process clock tick task")
 
@@ -5,7 +5,8 @@ import uuid
 from collections import defaultdict
 from collections.abc import Mapping
 from concurrent.futures import ThreadPoolExecutor, wait
-from copy import deepcopy
+from copy import copy, deepcopy
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from functools import partial
 from typing import Any, Literal, NotRequired, TypedDict
@@ -22,11 +23,12 @@ from sentry_kafka_schemas.codecs import Codec
 from sentry_kafka_schemas.schema_types.ingest_monitors_v1 import IngestMonitorMessage
 from sentry_sdk.tracing import Span, Transaction
 
-from sentry import quotas, ratelimits
+from sentry import options, quotas, ratelimits
 from sentry.conf.types.kafka_definition import Topic, get_topic_codec
 from sentry.constants import DataCategory, ObjectStatus
 from sentry.db.postgres.transactions import in_test_hide_transaction_boundary
 from sentry.killswitches import killswitch_matches_context
+from sentry.models.environment import Environment
 from sentry.models.project import Project
 from sentry.monitors.clock_dispatch import try_monitor_clock_tick
 from sentry.monitors.constants import PermitCheckInStatus
@@ -86,19 +88,97 @@ CHECKIN_QUOTA_LIMIT = 6
 CHECKIN_QUOTA_WINDOW = 60
 
 
+@dataclass
+class CheckinGroupPrefetch:
+    """
+    Objects loaded in bulk for a check-in group before the group is processed.
+    Only the first check-in of a group may use them, later check-ins may see
+    objects that were modified by the check-ins before them.
+
+    The monitor environment is not prefetched. Its status and check-in times
+    may change while the group waits for a worker, so it is read when the
+    check-in is processed.
+    """
+
+    project: Project
+    monitor: Monitor | None
+    environment: Environment | None
+
+
+def prefetch_checkin_groups(
+    checkin_mapping: Mapping[str, list[CheckinItem]],
+) -> dict[str, CheckinGroupPrefetch]:
+    """
+    Load the projects, monitors and environments of every check-in group in a
+    batch using a fixed number of queries, instead of a few queries per
+    check-in.
+
+    Groups whose monitor or environment does not exist yet are left for
+    `_process_checkin` to look up (and possibly create) on its own.
+    """
+    first_items = {key: items[0] for key, items in checkin_mapping.items() if items}
+    if not first_items:
+        return {}
+
+    project_ids = {int(item.message["project_id"]) for item in first_items.values()}
+    projects = {p.id: p for p in Project.objects.get_many_from_cache(project_ids)}
+
+    monitors: dict[tuple[int, str], Monitor] = {}
+    for monitor in Monitor.objects.filter(
+        project_id__in=projects.keys(),
+        slug__in={item.valid_monitor_slug for item in first_items.values()},
+    ):
+        if monitor.organization_id == projects[monitor.project_id].organization_id:
+            monitors[(monitor.project_id, monitor.slug)] = monitor
+
+    environment_names = {
+        item.payload.get("environment") or "production" for item in first_items.values()
+    }
+    environments = {
+        (env.organization_id, env.name): env
+        for env in Environment.objects.filter(
+            organization_id__in={p.organization_id for p in projects.values()},
+            name__in=environment_names,
+        )
+    }
+
+    prefetched: dict[str, CheckinGroupPrefetch] = {}
+    for key, item in first_items.items():
+        project = projects.get(int(item.message["project_id"]))
+        if project is None:
+            continue
+
+        monitor = monitors.get((project.id, item.valid_monitor_slug))
+        environment = environments.get(
+            (project.organization_id, item.payload.get("environment") or "production")
+        )
+
+        # Groups for different environments of the same monitor run in
+        # parallel, each of them gets its own copy of the model instances.
+        prefetched[key] = CheckinGroupPrefetch(
+            project=copy(project),
+            monitor=copy(monitor),
+            environment=environment,
+        )
+
+    return prefetched
+
+
 def _ensure_monitor_with_config(
     project: Project,
     monitor_slug: str,
     config: dict[str, Any] | None,
+    monitor: Monitor | None = None,
 ) -> Monitor | None:
-    try:
-        monitor = Monitor.objects.get(
-            slug=monitor_slug,
-            project_id=project.id,
-            organization_id=project.organization_id,
-        )
-    except Monitor.DoesNotExist:
-        monitor = None
+    if monitor is None:
+        try:
+            monitor = Monitor.objects.get(
+                slug=monitor_slug,
+                project_id=project.id,
+                organization_id=project.organization_id,
+            )
+        except Monitor.DoesNotExist:
+            monitor = None
 
     if not config:
         return monitor
@@ -414,7 +494,11 @@ def update_existing_check_in(
     existing_check_in.update(**updated_checkin)
 
 
-def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
+def _process_checkin(
+    item: CheckinItem,
+    txn: Transaction | Span,
+    prefetch: CheckinGroupPrefetch | None = None,
+) -> None:
     params = item.payload
 
     # XXX: The start_time is when relay received the original envelope store
@@ -427,7 +511,10 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
     monitor_slug = item.valid_monitor_slug
     environment = params.get("environment")
 
-    project = Project.objects.get_from_cache(id=project_id)
+    if prefetch is not None:
+        project = prefetch.project
+    else:
+        project = Project.objects.get_from_cache(id=project_id)
 
     # Strip sdk version to reduce metric cardinality
     sdk_platform = source_sdk.split("/")[0] if source_sdk else "none"
@@ -560,6 +647,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
             project,
             monitor_slug,
             monitor_config,
+            monitor=prefetch.monitor if prefetch else None,
         )
     except ProcessingErrorsException as e:
         ensure_config_errors = list(e.processing_errors)
@@ -669,9 +757,19 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
     # 02
     # Retrieve or upsert monitor environment for this check-in
     try:
-        monitor_environment = MonitorEnvironment.objects.ensure_environment(
-            project, monitor, environment
-        )
+        monitor_environment = None
+        if prefetch is not None and prefetch.environment is not None:
+            try:
+                monitor_environment = MonitorEnvironment.objects.get(
+                    monitor_id=monitor.id, environment_id=prefetch.environment.id
+                )
+                monitor_environment.monitor = monitor
+            except MonitorEnvironment.DoesNotExist:
+                pass
+        if monitor_environment is None:
+            monitor_environment = MonitorEnvironment.objects.ensure_environment(
+                project, monitor, environment
+            )
     except MonitorEnvironmentLimitsExceeded as e:
         metrics.incr(
             "monitors.checkin.result",
@@ -929,7 +1027,7 @@ def _process_checkin(item: CheckinItem, txn: Transaction | Span) -> None:
         logger.exception("Failed to process check-in")
 
 
-def process_checkin(item: CheckinItem) -> None:
+def process_checkin(item: CheckinItem, prefetch: CheckinGroupPrefetch | None = None) -> None:
     """
     Process an individual check-in
     """
@@ -940,20 +1038,22 @@ def process_checkin(item: CheckinItem) -> None:
         ) as txn:
             # Deepcopy the checkin here so that it's not modified. We need the original when we get a
             # `ProcessingErrorsException`
-            _process_checkin(deepcopy(item), txn)
+            _process_checkin(deepcopy(item), txn, prefetch)
     except ProcessingErrorsException as e:
         handle_processing_errors(item, e)
     except Exception:
         logger.exception("Failed to process check-in")
 
 
-def process_checkin_group(items: list[CheckinItem]) -> None:
+def process_checkin_group(
+    items: list[CheckinItem], prefetch: CheckinGroupPrefetch | None = None
+) -> None:
     """
     Process a group of related check-ins (all part of the same monitor)
     completely serially.
     """
-    for item in items:
-        process_checkin(item)
+    for i, item in enumerate(items):
+        process_checkin(item, prefetch if i == 0 else None)
 
 
 def process_batch(
@@ -1005,8 +1105,17 @@ def process_batch(
 
     # Submit check-in groups for processing
     with sentry_sdk.start_transaction(op="process_batch", name="monitors.monitor_consumer"):
+        prefetched: dict[str, CheckinGroupPrefetch] = {}
+        if options.get("crons.consumer.prefetch-checkin-groups"):
+            try:
+                with metrics.timer("monitors.checkin.parallel_batch_prefetch"):
+                    prefetched = prefetch_checkin_groups(checkin_mapping)
+            except Exception:
+                logger.exception("Failed to prefetch check-in groups")
+
         futures = [
-            executor.submit(process_checkin_group, group) for group in checkin_mapping.values()
+            executor.submit(process_checkin_group, group, prefetched.get(key))
+            for key, group in checkin_mapping.items()
         ]
         wait(futures)
 
@@ -665,6 +665,18 @@ class MonitorEnvironment(Model):
         unique_together = (("monitor", "environment_id"),)
         indexes = [
             models.Index(fields=["status", "next_checkin_latest"]),
+            # used for dispatch_check_missing, must match IGNORE_MONITORS
+            models.Index(
+                fields=["next_checkin_latest"],
+                condition=~Q(
+                    status__in=[
+                        MonitorStatus.DISABLED,
+                        MonitorStatus.PENDING_DELETION,
+                        MonitorStatus.DELETION_IN_PROGRESS,
+                    ]
+                ),
+                name="sentry_monitorenv_missed",
+            ),
         ]
 
     __repr__ = sane_repr("monitor_id", "environment_id")
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import datetime, tzinfo
+from functools import lru_cache
 
 from cronsim import CronSim
 from dateutil import rrule
@@ -14,6 +15,45 @@ SCHEDULE_INTERVAL_MAP: dict[IntervalUnit, int] = {
     "minute": rrule.MINUTELY,
 }
 
+# Size of the schedule computation caches. Schedules have minute granularity,
+# so reference timestamps are truncated to the minute before they become part
+# of the cache key. Clock tasks for the same tick, and check-ins received
+# within the same minute, then share entries for identical schedules and
+# timezones.
+SCHEDULE_CACHE_SIZE = 10_000
+
+
+@lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def _get_crontab_schedule(
+    crontab: str,
+    reference_ts: datetime,
+    tz: tzinfo | None,
+    fold: int,
+    reverse: bool,
+) -> datetime:
+    # The timezone and fold are part of the cache key, aware datetimes
+    # representing the same instant compare equal even when their timezone or
+    # fold differs, but the schedule is evaluated in local time.
+    iter = CronSim(crontab, reference_ts, reverse=reverse)
+    return next(iter).replace(second=0, microsecond=0)
+
+
+@lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def _get_next_interval_schedule(
+    interval: int,
+    unit: IntervalUnit,
+    reference_ts: datetime,
+    tz: tzinfo | None,
+    fold: int,
+) -> datetime:
+    rule = rrule.rrule(
+        freq=SCHEDULE_INTERVAL_MAP[unit],
+        interval=interval,
+        dtstart=reference_ts,
+        count=2,
+    )
+    return rule.after(reference_ts).replace(second=0, microsecond=0)
+
 
 def get_next_schedule(
     reference_ts: datetime,
@@ -35,20 +75,27 @@ def get_next_schedule(
     >>> 07:35
     """
     # Ensure we clamp the expected time down to the minute, that is the level
-    # of granularity we're able to support
+    # of granularity we're able to support. Clamping the reference as well
+    # doesn't change the result and keeps the cache keys per minute.
+    reference_ts = reference_ts.replace(second=0, microsecond=0)
 
     if schedule.type == "crontab":
-        iter = CronSim(schedule.crontab, reference_ts)
-        return next(iter).replace(second=0, microsecond=0)
+        return _get_crontab_schedule(
+            schedule.crontab,
+            reference_ts,
+            reference_ts.tzinfo,
+            reference_ts.fold,
+            reverse=False,
+        )
 
     if schedule.type == "interval":
-        rule = rrule.rrule(
-            freq=SCHEDULE_INTERVAL_MAP[schedule.unit],
-            interval=schedule.interval,
-            dtstart=reference_ts,
-            count=2,
+        return _get_next_interval_schedule(
+            schedule.interval,
+            schedule.unit,
+            reference_ts,
+            reference_ts.tzinfo,
+            reference_ts.fold,
         )
-        return rule.after(reference_ts).replace(second=0, microsecond=0)
 
     raise NotImplementedError("unknown schedule_type")
 
@@ -77,8 +124,15 @@ def get_prev_schedule(
     >>> 05:30
     """
     if schedule.type == "crontab":
-        iter = CronSim(schedule.crontab, reference_ts, reverse=True)
-        return next(iter).replace(second=0, microsecond=0)
+        # CronSim ignores seconds, truncating here only improves cache hits
+        reference_minute = reference_ts.replace(second=0, microsecond=0)
+        return _get_crontab_schedule(
+            schedule.crontab,
+            reference_minute,
+            reference_minute.tzinfo,
+            reference_minute.fold,
+            reverse=True,
+        )
 
     if schedule.type == "interval":
         rule = rrule.rrule(
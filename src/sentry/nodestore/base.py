@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
 from collections.abc import Mapping
 from datetime import datetime, timedelta
-from threading import local
+from threading import Lock, local
 from typing import Any
 
 import sentry_sdk
@@ -29,6 +31,133 @@ json_dumps = json.JSONEncoder(
 json_loads = json.loads
 
 
+class NodeBytesCache:
+    """
+    In-process LRU of decompressed nodestore payloads, bounded by the total
+    size of the stored bytes rather than by the number of entries.
+
+    The raw (decompressed) bytes are kept instead of decoded values so that
+    callers can never mutate a cached payload, and so that any subkey can be
+    served from a single entry.
+
+    Writes and deletes made by other processes never reach this cache, so
+    entries are only served for `ttl` seconds after they were stored.
+    """
+
+    def __init__(self, max_bytes: int = 0, ttl: float = 10) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.size = 0
+        self._data: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> bytes | None:
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: list[str]) -> dict[str, bytes]:
+        rv = {}
+        expired = 0
+        now = time.monotonic()
+        with self._lock:
+            for key in keys:
+                item = self._data.get(key)
+                if item is None:
+                    continue
+                inserted, value = item
+                if now - inserted > self.ttl:
+                    self._pop(key)
+                    expired += 1
+                    continue
+                self._data.move_to_end(key)
+                rv[key] = value
+
+        if expired:
+            metrics.incr("nodestore.local_cache.expired", amount=expired)
+        return rv
+
+    def set(self, key: str, value: bytes) -> None:
+        self.set_many({key: value})
+
+    def set_many(self, items: Mapping[str, bytes | None]) -> None:
+        evicted = 0
+        now = time.monotonic()
+        with self._lock:
+            for key, value in items.items():
+                self._pop(key)
+                # A single payload larger than the whole budget would only
+                # flush everything else out of the cache.
+                if value is None or len(value) > self.max_bytes:
+                    continue
+                self._data[key] = (now, value)
+                self.size += len(value)
+
+            while self.size > self.max_bytes:
+                _, (_, value) = self._data.popitem(last=False)
+                self.size -= len(value)
+                evicted += 1
+
+            size = self.size
+
+        if evicted:
+            metrics.incr("nodestore.local_cache.evictions", amount=evicted)
+        metrics.gauge("nodestore.local_cache.bytes", size)
+
+    def delete_many(self, keys: list[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+    def _pop(self, key: str) -> None:
+        item = self._data.pop(key, None)
+        if item is not None:
+            self.size -= len(item[1])
+
+
+def _find_payload(value: bytes, subkey: str | None) -> tuple[int, int] | None:
+    """
+    Locate the JSON line of `subkey` in an encoded node without splitting or
+    decoding any of the other lines. Returns the slice bounds, or None when
+    the subkey is not present.
+    """
+    size = len(value)
+    end = value.find(b"\n")
+    if end == -1:
+        end = size
+    if subkey is None:
+        return (0, end) if end else None
+
+    # Those keys should be statically known identifiers in the app, such as
+    # "unprocessed_event". There is really no reason to allow anything but
+    # ASCII here.
+    _subkey = subkey.encode("ascii")
+
+    while end < size:
+        key_start = end + 1
+        key_end = value.find(b"\n", key_start)
+        if key_end == -1:
+            return None
+        end = value.find(b"\n", key_end + 1)
+        if end == -1:
+            end = size
+        if value[key_start:key_end].strip() == _subkey:
+            return key_end + 1, end
+
+    return None
+
+
+# Shared by every thread of the process. `NodeStorage` instances are
+# thread-local, so this cannot live on the instance.
+_local_cache = NodeBytesCache()
+
+
 class NodeStorage(local, Service):
     """
     Nodestore is a key-value store that is used to store event payloads. It comes in two flavors:
@@ -97,35 +226,34 @@ class NodeStorage(local, Service):
             self.delete(id)
 
     def _decode(self, value: None | bytes, subkey: str | None) -> Any | None:
+        """
+        Decode the main payload or `subkey` of an encoded node. Only the
+        requested line is parsed.
+        """
         if value is None:
             return None
 
-        lines_iter = iter(value.splitlines())
-        try:
-            if subkey is not None:
-                # Those keys should be statically known identifiers in the app, such as
-                # "unprocessed_event". There is really no reason to allow anything but
-                # ASCII here.
-                _subkey = subkey.encode("ascii")
-
-                next(lines_iter)
-
-                for line in lines_iter:
-                    if line.strip() == _subkey:
-                        break
-
-                    next(lines_iter)
-
-            return json_loads(next(lines_iter))
-        except StopIteration:
+        bounds = _find_payload(value, subkey)
+        if bounds is None:
             return None
 
+        start, end = bounds
+        return json_loads(value[start:end])
+
     def get_bytes(self, id: str) -> bytes | None:
         """
         >>> nodestore._get_bytes('key1')
         b'{"message": "hello world"}'
         """
-        return self._get_bytes(id)
+        local_cache = self.local_cache
+        if local_cache is not None:
+            bytes_data = local_cache.get(id)
+            if bytes_data is not None:
+                return bytes_data
+        bytes_data = self._get_bytes(id)
+        if local_cache is not None and bytes_data is not None:
+            local_cache.set(id, bytes_data)
+        return bytes_data
 
     def _get_bytes(self, id: str) -> bytes | None:
         raise NotImplementedError
@@ -138,6 +266,19 @@ class NodeStorage(local, Service):
         """
         with sentry_sdk.start_span(op="nodestore.get") as span:
             span.set_tag("node_id", id)
+            local_cache = self.local_cache
+            if local_cache is not None:
+                bytes_data = local_cache.get(id)
+                if bytes_data is not None:
+                    rv = self._decode(bytes_data, subkey=subkey)
+                    metrics.incr("nodestore.get", tags={"cache": "local"})
+                    metrics.distribution(
+                        "nodestore.local_cache.hit_bytes", len(bytes_data), unit="byte"
+                    )
+                    span.set_tag("origin", "from_local_cache")
+                    span.set_tag("found", bool(rv))
+                    return rv
+
             if subkey is None:
                 item_from_cache = self._get_cache_item(id)
                 if item_from_cache:
@@ -152,6 +293,8 @@ class NodeStorage(local, Service):
             if subkey is None:
                 # set cache item only after we know decoding did not fail
                 self._set_cache_item(id, rv)
+            if local_cache is not None and bytes_data is not None:
+                local_cache.set(id, bytes_data)
 
             span.set_tag("result", "from_service")
             if bytes_data:
@@ -173,6 +316,10 @@ class NodeStorage(local, Service):
 
     def get_multi(self, id_list: list[str], subkey: str | None = None) -> dict[str, Any | None]:
         """
+        Fetch multiple nodes, reading each tier only for the ids the previous
+        tier did not have: the in-process cache first, then the shared cache
+        (main payloads only), then the backend.
+
         >>> nodestore.get_multi(['key1', 'key2')
         {
             "key1": {"message": "hello world"},
@@ -185,24 +332,46 @@ class NodeStorage(local, Service):
             span.set_tag("subkey", str(subkey))
             span.set_tag("num_ids", len(id_list))
 
-            if subkey is None:
-                cache_items = self._get_cache_items(id_list)
-                if len(cache_items) == len(id_list):
-                    span.set_tag("result", "from_cache")
-                    return cache_items
+            items: dict[str, Any | None] = {}
+            uncached_ids = id_list
+
+            local_cache = self.local_cache
+            if local_cache is not None:
+                local_items = local_cache.get_many(uncached_ids)
+                if local_items:
+                    for id, value in local_items.items():
+                        items[id] = self._decode(value, subkey=subkey)
+                    uncached_ids = [id for id in uncached_ids if id not in local_items]
+                    metrics.distribution(
+                        "nodestore.local_cache.hit_bytes",
+                        sum(len(value) for value in local_items.values()),
+                        unit="byte",
+                    )
+                metrics.incr(
+                    "nodestore.get_multi", amount=len(local_items), tags={"cache": "local"}
+                )
+
+            if subkey is None and uncached_ids:
+                cache_items = self._get_cache_items(uncached_ids)
+                items.update(cache_items)
+                uncached_ids = [id for id in uncached_ids if id not in cache_items]
+                metrics.incr("nodestore.get_multi", amount=len(cache_items), tags={"cache": "hit"})
 
-                uncached_ids = [id for id in id_list if id not in cache_items]
-            else:
-                uncached_ids = id_list
+            if not uncached_ids:
+                span.set_tag("result", "from_cache")
+                return items
 
+            metrics.incr("nodestore.get_multi", amount=len(uncached_ids), tags={"cache": "miss"})
             with sentry_sdk.start_span(op="nodestore._get_bytes_multi_and_decode") as span:
-                items = {
-                    id: self._decode(value, subkey=subkey)
-                    for id, value in self._get_bytes_multi(uncached_ids).items()
+                bytes_items = self._get_bytes_multi(uncached_ids)
+                service_items = {
+                    id: self._decode(value, subkey=subkey) for id, value in bytes_items.items()
                 }
             if subkey is None:
-                self._set_cache_items(items)
-                items.update(cache_items)
+                self._set_cache_items(service_items)
+            if local_cache is not None:
+                local_cache.set_many(bytes_items)
+            items.update(service_items)
 
             span.set_tag("result", "from_service")
             span.set_tag("found", len(items))
@@ -231,7 +400,12 @@ class NodeStorage(local, Service):
         >>> nodestore.set_bytes('key1', b"{'foo': 'bar'}")
         """
         metrics.distribution("nodestore.set_bytes", len(data))
-        return self._set_bytes(item_id, data, ttl)
+        self._set_bytes(item_id, data, ttl)
+        # the in-process cache holds the raw payload including all subkeys,
+        # so it is always refreshed, independently of the shared cache
+        local_cache = self.local_cache
+        if local_cache is not None:
+            local_cache.set(item_id, data)
 
     def _set_bytes(self, item_id: str, data: bytes, ttl: timedelta | None = None) -> None:
         raise NotImplementedError
@@ -296,13 +470,37 @@ class NodeStorage(local, Service):
             self.cache.set_many(items)
 
     def _delete_cache_item(self, item_id: str) -> None:
+        _local_cache.delete_many([item_id])
         if self.cache:
             self.cache.delete(item_id)
 
     def _delete_cache_items(self, id_list: list[str]) -> None:
+        _local_cache.delete_many(id_list)
         if self.cache:
             self.cache.delete_many([item_id for item_id in id_list])
 
+    def _clear_cache(self) -> None:
+        _local_cache.clear()
+        if self.cache:
+            self.cache.clear()
+
+    @property
+    def local_cache(self) -> NodeBytesCache | None:
+        """
+        The in-process tier in front of the shared cache. Sized by the
+        `nodestore.local-cache.max-bytes` option, disabled when that is 0.
+        Entries expire after `nodestore.local-cache.ttl` seconds.
+        """
+        max_bytes = options.get("nodestore.local-cache.max-bytes")
+        if not max_bytes:
+            # entries could have gone stale while the tier was not consulted
+            if len(_local_cache):
+                _local_cache.clear()
+            return None
+        _local_cache.max_bytes = max_bytes
+        _local_cache.ttl = options.get("nodestore.local-cache.ttl")
+        return _local_cache
+
     @cached_property
     def cache(self) -> BaseCache | None:
         try:
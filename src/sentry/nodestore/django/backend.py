@@ -62,8 +62,7 @@ class DjangoNodeStorage(NodeStorage):
         days = math.floor(total_seconds / 86400)
 
         BulkDeleteQuery(model=Node, dtfield="timestamp", days=days).execute()
-        if self.cache:
-            self.cache.clear()
+        self._clear_cache()
 
     def bootstrap(self) -> None:
         # Nothing for Django backend to do during bootstrap
@@ -745,6 +745,10 @@ register("snuba.search.chunk-growth-rate", default=1.5, flags=FLAG_AUTOMATOR_MOD
 register("snuba.search.max-chunk-size", default=2000, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("snuba.search.max-total-chunk-time-seconds", default=30.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("snuba.search.hits-sample-size", default=100, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Run the hits sample query alongside the first search chunk instead of before it.
+register("snuba.search.concurrent-queries", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# While post-filtering a chunk in Postgres, already fetch the next chunk from Snuba.
+register("snuba.search.speculative-chunks", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
 register("snuba.track-outcomes-sample-rate", default=0.0, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
 # The percentage of tagkeys that we want to cache. Set to 1.0 in order to cache everything, <=0.0 to stop caching
@@ -1168,6 +1172,11 @@ register("processing.release-archive-min-files", default=10, flags=FLAG_AUTOMATO
 # All Relay options (statically authenticated Relays can be registered here)
 register("relay.static_auth", default={}, flags=FLAG_NOSTORE)
 
+# Skip rewriting project configs in the Relay project config cache when their content (ignoring
+# the revision and timestamps) did not change. Unchanged configs only get their TTL refreshed
+# and keep their revision.
+register("relay.projectconfig-cache.skip-unchanged", default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
+
 # Tell Relay to stop extracting metrics from transaction payloads (see killswitches)
 # Example value: [{"project_id": 42}, {"project_id": 123}]
 register("relay.drop-transaction-metrics", default=[], flags=FLAG_AUTOMATOR_MODIFIABLE)
@@ -1533,6 +1542,15 @@ register(
     default=[],
     flags=FLAG_AUTOMATOR_MODIFIABLE,
 )
+# Answer writes limiter checks from a per-process estimate that is synced to
+# Redis periodically, see LocalSyncSlidingWindowRateLimiter. The sync interval,
+# units and error budget are configured through the limiter cluster options.
+# Only read when the consumer starts.
+register(
+    "sentry-metrics.writes-limiter.local-sync",
+    default=False,
+    flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
+)
 
 # per-organization limits on the number of timeseries that can be observed in
 # each window.
@@ -2007,6 +2025,12 @@ register("txnames.bump-lifetime-sample-rate", default=0.1, flags=FLAG_AUTOMATOR_
 register(
     "nodestore.set-subkeys.enable-set-cache-item", default=True, flags=FLAG_AUTOMATOR_MODIFIABLE
 )
+# Byte budget of the in-process cache of decompressed node payloads that sits
+# in front of the shared `nodedata` cache. 0 disables it.
+register("nodestore.local-cache.max-bytes", default=0, flags=FLAG_AUTOMATOR_MODIFIABLE)
+# Seconds an entry of that cache is served for. Deletes and overwrites made by
+# other processes are only picked up once it expires.
+register("nodestore.local-cache.ttl", default=10, flags=FLAG_AUTOMATOR_MODIFIABLE)
 
 # === Backpressure related runtime options ===
 
@@ -2073,6 +2097,15 @@ register(
     flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
 )
 
+# Load the projects, monitors and monitor environments for every check-in group
+# of a batch in bulk before the groups are processed by the batched-parallel
+# monitor consumer.
+register(
+    "crons.consumer.prefetch-checkin-groups",
+    default=False,
+    flags=FLAG_BOOL | FLAG_AUTOMATOR_MODIFIABLE,
+)
+
 # Enables recording tick volume metrics and tick decisions based on those
 # metrics. Decisions are used to delay notifications in a system incident.
 register(
@@ -2668,6 +2701,14 @@ register(
     default=10,
     flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
 )
+# zstd level used to compress span payloads in the span buffer, 0 disables
+# compression. See also SENTRY_SPAN_BUFFER_COMPRESSION_DICT.
+register(
+    "standalone-spans.buffer.compression.level",
+    type=Int,
+    default=0,
+    flags=FLAG_PRIORITIZE_DISK | FLAG_AUTOMATOR_MODIFIABLE,
+)
 register(
     "indexed-spans.agg-span-waterfall.enable",
     default=False,
@@ -3371,3 +3412,8 @@ register(
 # Orgs for which compression should be disabled in the chunk upload endpoint.
 # This is intended to circumvent sporadic 503 errors reported by some customers.
 register("chunk-upload.no-compression", default=[], flags=FLAG_AUTOMATOR_MODIFIABLE)
+
+# Flush buffered counters in bulk: pending keys are read with one pipeline per
+# Redis node and counters are written back with one multi-row update per model.
+register("buffer.bulk-flush.enabled", type=Bool, default=False, flags=FLAG_AUTOMATOR_MODIFIABLE)
+register("buffer.bulk-flush.batch-size", type=Int, default=100, flags=FLAG_AUTOMATOR_MODIFIABLE)
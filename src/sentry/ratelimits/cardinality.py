@@ -1,4 +1,8 @@
-from collections.abc import Mapping, Sequence
+import math
+import time
+from collections import defaultdict
+from collections.abc import Iterator, Mapping, Sequence
+from typing import Any
 
 from sentry_redis_tools.cardinality_limiter import CardinalityLimiter as CardinalityLimiterBase
 from sentry_redis_tools.cardinality_limiter import GrantedQuota, Quota
@@ -6,7 +10,7 @@ from sentry_redis_tools.cardinality_limiter import (
     RedisCardinalityLimiter as RedisCardinalityLimiterImpl,
 )
 from sentry_redis_tools.cardinality_limiter import RequestedQuota
-from sentry_redis_tools.clients import BlasterClient, RedisCluster
+from sentry_redis_tools.clients import BlasterClient, RedisCluster, StrictRedis
 
 from sentry.utils import metrics, redis
 from sentry.utils.redis_metrics import RedisToolsMetricsBackend
@@ -17,6 +21,12 @@ __all__ = ["GrantedQuota", "RequestedQuota", "Quota"]
 Hash = int
 Timestamp = int
 
+_MASK_64 = (1 << 64) - 1
+
+# The maximum number of bit operations sent in one BITFIELD command, to avoid
+# long-running Redis commands for large batches.
+BITFIELD_CHUNK_SIZE = 500
+
 
 class CardinalityLimiter(Service, CardinalityLimiterBase):
     pass
@@ -71,3 +81,223 @@ class RedisCardinalityLimiter(CardinalityLimiter):
         timestamp: Timestamp,
     ) -> None:
         return self.impl.use_quotas(grants, timestamp)
+
+
+def _mix64(value: int) -> int:
+    """
+    splitmix64 finalizer, spreads arbitrary integers over 64 bits.
+    """
+    value = (value + 0x9E3779B97F4A7C15) & _MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return value ^ (value >> 31)
+
+
+class RedisBloomCardinalityLimiter(CardinalityLimiter):
+    """
+    A cardinality limiter that stores a Bloom filter per prefix and time
+    bucket instead of the exact sets of hashes `RedisCardinalityLimiter`
+    keeps.
+
+    Both the "was this hash already seen in the window" check and the
+    cardinality of the window are answered from the same filter: membership
+    from the hash's bits, cardinality by estimating the number of inserted
+    elements from the number of set bits. Filters are sized from the quota
+    limit and `error_rate`, so memory per prefix and bucket is fixed at about
+    `-limit * ln(error_rate) / ln(2)^2` bits (~1.2 bytes per admitted hash at
+    1%) regardless of the hash values, and a whole batch is checked with one
+    BITFIELD + BITCOUNT per request in a single round-trip.
+
+    The trade-off is that a false positive admits a new hash for free: once
+    the limit is reached, every further new hash still gets through with a
+    probability of about `error_rate`. The cardinality estimate is also
+    approximate, so the admitted count ends up within a few percent of the
+    limit.
+
+    Time buckets work like in `RedisCardinalityLimiter`: an admitted hash is
+    added to the filter of every bucket in its window, and checks read the
+    oldest one.
+    """
+
+    def __init__(
+        self,
+        cluster: str = "default",
+        error_rate: float = 0.01,
+        metric_tags: Mapping[str, str] | None = None,
+    ) -> None:
+        """
+        :param cluster: Name of the redis cluster to use, to be configured with
+            the `redis.clusters` Sentry option (like any other redis cluster in
+            Sentry).
+        :param error_rate: The false positive rate the filters are sized for.
+        """
+        assert 0 < error_rate < 1
+        self.is_redis_cluster, self.client, _ = redis.get_dynamic_cluster_from_options(
+            "", {"cluster": cluster}
+        )
+        self.error_rate = error_rate
+        self.metric_tags = metric_tags or {}
+        super().__init__()
+
+    def _get_filter_size(self, quota: Quota) -> tuple[int, int]:
+        """
+        Return the number of bits and hash functions for a filter that holds
+        `quota.limit` elements at `self.error_rate`.
+        """
+        limit = max(quota.limit, 1)
+        num_bits = max(64, math.ceil(-limit * math.log(self.error_rate) / math.log(2) ** 2))
+        num_hashes = max(1, round(num_bits / limit * math.log(2)))
+        return num_bits, num_hashes
+
+    def _get_bit_positions(self, hash: Hash, num_bits: int, num_hashes: int) -> Iterator[int]:
+        # double hashing, see Kirsch & Mitzenmacher, "Less Hashing, Same
+        # Performance: Building a Better Bloom Filter"
+        mixed = _mix64(hash)
+        h1 = mixed & 0xFFFFFFFF
+        h2 = (mixed >> 32) | 1
+        for i in range(num_hashes):
+            yield (h1 + i * h2) % num_bits
+
+    @staticmethod
+    def _get_filter_key(
+        request: RequestedQuota, time_bucket: int, num_bits: int, num_hashes: int
+    ) -> str:
+        # A filter can only be read with the geometry it was written with, so
+        # changing the limit or error rate starts new filters.
+        return f"cardinality:bloom:{request.prefix}-{num_bits}-{num_hashes}-{time_bucket}"
+
+    def _run_pipeline(self, commands: Sequence[tuple[Any, ...]]) -> list[Any]:
+        """
+        Run `commands` (each operating on the key in its first argument) in
+        one pipeline per Redis node and return their results in order.
+        """
+        if self.is_redis_cluster:
+            assert isinstance(self.client, (RedisCluster, StrictRedis))
+            with self.client.pipeline(transaction=False) as pipeline:
+                for command in commands:
+                    pipeline.execute_command(*command)
+                return pipeline.execute()
+
+        # rb cannot route BITFIELD by itself, so group commands by host.
+        router = self.client.get_router()
+        indexes_by_host: dict[int, list[int]] = defaultdict(list)
+        for i, command in enumerate(commands):
+            indexes_by_host[router.get_host_for_key(command[1])].append(i)
+
+        results: list[Any] = [None] * len(commands)
+        for host, indexes in indexes_by_host.items():
+            with self.client.get_local_client(host).pipeline(transaction=False) as pipeline:
+                for i in indexes:
+                    pipeline.execute_command(*commands[i])
+                for i, result in zip(indexes, pipeline.execute()):
+                    results[i] = result
+        return results
+
+    def _estimate_cardinality(self, set_bits: int, num_bits: int, num_hashes: int) -> float:
+        if set_bits >= num_bits:
+            return math.inf
+        return -num_bits / num_hashes * math.log(1 - set_bits / num_bits)
+
+    def check_within_quotas(
+        self, requests: Sequence[RequestedQuota], timestamp: Timestamp | None = None
+    ) -> tuple[Timestamp, Sequence[GrantedQuota]]:
+        if timestamp is None:
+            timestamp = int(time.time())
+        else:
+            timestamp = int(timestamp)
+
+        commands: list[tuple[Any, ...]] = []
+        # request index -> (index of BITCOUNT, indexes of BITFIELD chunks)
+        layout = []
+        for request in requests:
+            num_bits, num_hashes = self._get_filter_size(request.quota)
+            oldest_time_bucket = list(request.quota.iter_window(timestamp))[-1]
+            key = self._get_filter_key(request, oldest_time_bucket, num_bits, num_hashes)
+
+            bitcount_index = len(commands)
+            commands.append(("BITCOUNT", key))
+
+            operations: list[Any] = []
+            for hash in request.unit_hashes:
+                for position in self._get_bit_positions(hash, num_bits, num_hashes):
+                    operations.extend(("GET", "u1", position))
+
+            bitfield_indexes = []
+            chunk_size = BITFIELD_CHUNK_SIZE * 3
+            for i in range(0, len(operations), chunk_size):
+                bitfield_indexes.append(len(commands))
+                commands.append(("BITFIELD", key, *operations[i : i + chunk_size]))
+
+            layout.append((bitcount_index, bitfield_indexes))
+
+        results = self._run_pipeline(commands) if commands else []
+
+        grants = []
+        for request, (bitcount_index, bitfield_indexes) in zip(requests, layout):
+            num_bits, num_hashes = self._get_filter_size(request.quota)
+            set_count = self._estimate_cardinality(
+                int(results[bitcount_index] or 0), num_bits, num_hashes
+            )
+            metrics.timing(
+                "ratelimits.cardinality.set_size",
+                min(set_count, num_bits),
+                tags={**self.metric_tags, "backend": "bloom"},
+            )
+
+            bits = iter([bit for i in bitfield_indexes for bit in results[i]])
+            remaining_limit_running = max(0, request.quota.limit - set_count)
+            granted_hashes = []
+            reached_quota = None
+
+            for hash in request.unit_hashes:
+                seen = all([next(bits) for _ in range(num_hashes)])
+                if seen:
+                    granted_hashes.append(hash)
+                elif remaining_limit_running >= 1:
+                    granted_hashes.append(hash)
+                    remaining_limit_running -= 1
+                else:
+                    reached_quota = request.quota
+
+            grants.append(
+                GrantedQuota(
+                    request=request,
+                    granted_unit_hashes=granted_hashes,
+                    reached_quota=reached_quota,
+                )
+            )
+
+        return timestamp, grants
+
+    def use_quotas(
+        self,
+        grants: Sequence[GrantedQuota],
+        timestamp: Timestamp,
+    ) -> None:
+        operations_by_key: dict[str, list[Any]] = defaultdict(list)
+        keys_ttl = {}
+
+        for grant in grants:
+            if not grant.granted_unit_hashes:
+                continue
+
+            num_bits, num_hashes = self._get_filter_size(grant.request.quota)
+            operations = []
+            for hash in grant.granted_unit_hashes:
+                for position in self._get_bit_positions(hash, num_bits, num_hashes):
+                    operations.extend(("SET", "u1", position, 1))
+
+            for time_bucket in grant.request.quota.iter_window(timestamp):
+                key = self._get_filter_key(grant.request, time_bucket, num_bits, num_hashes)
+                operations_by_key[key].extend(operations)
+                keys_ttl[key] = grant.request.quota.window_seconds
+
+        commands: list[tuple[Any, ...]] = []
+        chunk_size = BITFIELD_CHUNK_SIZE * 4
+        for key, operations in operations_by_key.items():
+            for i in range(0, len(operations), chunk_size):
+                commands.append(("BITFIELD", key, *operations[i : i + chunk_size]))
+            commands.append(("EXPIRE", key, keys_ttl[key]))
+
+        if commands:
+            self._run_pipeline(commands)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Sequence
+from threading import Lock
 from typing import Any
 
 from sentry_redis_tools.clients import RedisCluster, StrictRedis
@@ -11,7 +13,7 @@ from sentry_redis_tools.sliding_windows_rate_limiter import (
 from sentry_redis_tools.sliding_windows_rate_limiter import RequestedQuota, Timestamp
 
 from sentry.exceptions import InvalidConfiguration
-from sentry.utils import redis
+from sentry.utils import metrics, redis
 from sentry.utils.services import Service
 
 __all__ = ["Quota", "GrantedQuota", "RequestedQuota", "Timestamp"]
@@ -158,3 +160,210 @@ class RedisSlidingWindowRateLimiter(SlidingWindowRateLimiter):
         timestamp: Timestamp,
     ) -> None:
         return self.impl.use_quotas(requests, grants, timestamp)
+
+
+class LocalSyncSlidingWindowRateLimiter(RedisSlidingWindowRateLimiter):
+    """
+    A sliding window rate limiter that answers most checks from a local
+    estimate of the Redis counters, instead of making two Redis round-trips
+    for every `check_and_use_quotas`.
+
+    The counters of all granules a request needs are fetched from Redis on
+    sync, and quota used locally is added to them and buffered until the next
+    sync. Every sync also re-reads the counters fetched for earlier requests,
+    until their granules have left the window. A sync (flushing buffered usage and re-reading the counters) happens
+    when:
+
+    * `sync_interval_ms` have passed since the last sync,
+    * `sync_units` units of quota have been used locally since the last sync,
+    * a request needs a granule that was not fetched yet (new prefix, or the
+      window moved), or
+    * granting a request would bring the unsynced usage of one of its quotas
+      above `error_budget * quota.limit`.
+
+    The last rule bounds how far a single process can overshoot a quota
+    because of usage it has not seen yet from other processes: with N
+    processes, a quota is overshot by at most `N * error_budget * limit`
+    within one sync interval.
+
+    Buffered usage that was never synced is lost when the process exits,
+    which under-counts by at most `sync_units`.
+    """
+
+    def __init__(self, **options: Any) -> None:
+        self.sync_interval = options.pop("sync_interval_ms", 1000) / 1000.0
+        self.sync_units = options.pop("sync_units", 100)
+        self.error_budget = options.pop("error_budget", 0.05)
+        self._lock = Lock()
+        self._last_sync = 0.0
+        # redis key -> counter value as of the last sync
+        self._remote: dict[str, int] = {}
+        # redis key -> timestamp after which its granule has left every window
+        self._expiry: dict[str, int] = {}
+        # redis key -> (usage not yet written to redis, key ttl)
+        self._pending: dict[str, tuple[int, int]] = {}
+        self._pending_units = 0
+        super().__init__(**options)
+
+    def _get_keys(self, request: RequestedQuota, quota: Quota, timestamp: Timestamp) -> list[str]:
+        return [
+            self.impl._build_redis_key(request=request, quota=quota, granule=granule)
+            for granule in quota.iter_window(timestamp)
+        ]
+
+    def _sync(self, keys: set[str], timestamp: Timestamp) -> None:
+        """
+        Flush buffered usage and re-read `keys`, together with all other
+        counters that are still within their window at `timestamp`, in a
+        single pipeline.
+        """
+        for key in [key for key, expiry in self._expiry.items() if expiry < timestamp]:
+            del self._expiry[key]
+            self._remote.pop(key, None)
+
+        ordered_keys = list(keys.union(self._remote))
+        with self.client.pipeline(transaction=False) as pipeline:
+            for key, (value, ttl) in self._pending.items():
+                pipeline.incrby(key, value)
+                pipeline.expire(key, ttl)
+            for key in ordered_keys:
+                pipeline.get(key)
+            results = pipeline.execute()
+
+        metrics.incr("ratelimits.sliding_windows.local_sync.sync")
+        metrics.distribution(
+            "ratelimits.sliding_windows.local_sync.flushed_units", self._pending_units
+        )
+
+        values = results[len(self._pending) * 2 :]
+        self._remote.update((key, int(value or 0)) for key, value in zip(ordered_keys, values))
+        self._pending = {}
+        self._pending_units = 0
+        self._last_sync = time.monotonic()
+
+    def _used(self, keys: list[str]) -> tuple[int, int]:
+        """
+        Return the estimated total usage of `keys`, and the part of it that
+        has not been synced to Redis yet.
+        """
+        used = unsynced = 0
+        for key in keys:
+            pending = self._pending.get(key, (0, 0))[0]
+            used += self._remote.get(key, 0) + pending
+            unsynced += pending
+        return used, unsynced
+
+    def _grant(
+        self, requests: Sequence[RequestedQuota], timestamp: Timestamp
+    ) -> tuple[Sequence[GrantedQuota], bool]:
+        """
+        Compute grants from the local estimate. Mirrors
+        `RedisSlidingWindowRateLimiterImpl.check_within_quotas`, and
+        additionally reports whether a grant exceeded the error budget.
+        """
+        results = []
+        over_budget = False
+        # quota used by earlier requests for global quotas, see the
+        # sentry_redis_tools implementation
+        quota_used_cache: dict[int, int] = {}
+
+        for request in requests:
+            granted_quota = request.requested
+            reached_quotas = []
+            unsynced_by_quota = []
+
+            for quota in request.quotas:
+                used, unsynced = self._used(self._get_keys(request, quota, timestamp))
+                used += quota_used_cache.get(id(quota), 0)
+                unsynced_by_quota.append(unsynced + quota_used_cache.get(id(quota), 0))
+
+                remaining_quota = max(0, quota.limit - used)
+                if remaining_quota < granted_quota:
+                    granted_quota = remaining_quota
+                    reached_quotas.append(quota)
+
+            for quota, unsynced in zip(request.quotas, unsynced_by_quota):
+                if unsynced + granted_quota > self.error_budget * quota.limit:
+                    over_budget = True
+                if quota.prefix_override:
+                    quota_used_cache[id(quota)] = quota_used_cache.get(id(quota), 0) + granted_quota
+
+            results.append(
+                GrantedQuota(
+                    prefix=request.prefix, granted=granted_quota, reached_quotas=reached_quotas
+                )
+            )
+
+        return results, over_budget
+
+    def check_within_quotas(
+        self, requests: Sequence[RequestedQuota], timestamp: Timestamp | None = None
+    ) -> tuple[Timestamp, Sequence[GrantedQuota]]:
+        if timestamp is None:
+            timestamp = int(time.time())
+        else:
+            timestamp = int(timestamp)
+
+        keys = set()
+        with self._lock:
+            for request in requests:
+                assert request.quotas
+                for quota in request.quotas:
+                    for key in self._get_keys(request, quota, timestamp):
+                        keys.add(key)
+                        self._expiry[key] = max(
+                            self._expiry.get(key, 0), timestamp + quota.window_seconds
+                        )
+
+            synced = False
+            if (
+                time.monotonic() - self._last_sync >= self.sync_interval
+                or self._pending_units >= self.sync_units
+                or not keys.issubset(self._remote)
+            ):
+                self._sync(keys, timestamp)
+                synced = True
+
+            grants, over_budget = self._grant(requests, timestamp)
+            if over_budget and not synced:
+                self._sync(keys, timestamp)
+                grants, _ = self._grant(requests, timestamp)
+
+        metrics.incr(
+            "ratelimits.sliding_windows.local_sync.check",
+            tags={"synced": synced or over_budget},
+        )
+        return timestamp, grants
+
+    def use_quotas(
+        self,
+        requests: Sequence[RequestedQuota],
+        grants: Sequence[GrantedQuota],
+        timestamp: Timestamp,
+    ) -> None:
+        assert len(requests) == len(grants)
+
+        with self._lock:
+            for request, grant in zip(requests, grants):
+                assert request.prefix == grant.prefix
+                if not grant.granted:
+                    continue
+
+                for quota in request.quotas:
+                    # Only incr most recent granule
+                    granule = next(quota.iter_window(timestamp))
+                    key = self.impl._build_redis_key(request=request, quota=quota, granule=granule)
+                    value, _ = self._pending.get(key, (0, 0))
+                    self._pending[key] = (value + grant.granted, quota.window_seconds)
+                self._pending_units += grant.granted
+
+            if self._pending_units >= self.sync_units:
+                self._sync(set(), timestamp)
+
+    def flush(self) -> None:
+        """
+        Write all buffered usage to Redis, e.g. before shutting down.
+        """
+        with self._lock:
+            if self._pending:
+                self._sync(set(), int(time.time()))
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import logging
 import uuid
-from collections.abc import Iterable, Mapping, MutableMapping, Sequence
+from collections.abc import Generator, Iterable, Mapping, MutableMapping, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Literal, NotRequired, TypedDict
 
@@ -83,11 +85,62 @@ MIN_CLUSTERER_RUNS = 10
 logger = logging.getLogger(__name__)
 
 
-def get_exposed_features(project: Project) -> Sequence[str]:
+@contextmanager
+def _config_section(name: str) -> Generator[None]:
+    """Traces and times a single section of the project config."""
+    with (
+        sentry_sdk.start_span(op=name),
+        metrics.timer("relay.config.section.duration", tags={"section": name}),
+    ):
+        yield
+
+
+@dataclass(frozen=True)
+class OrganizationConfigInputs:
+    """Organization-wide inputs of the project config.
+
+    These are identical for every project of an organization. When building
+    configs for many projects at once, compute them once with
+    :func:`get_organization_config_inputs` and pass them to
+    :func:`get_project_config`.
+    """
+
+    organization_id: int
+    trusted_relays: list[str]
+    features: Mapping[str, bool]
+    performance_score_profiles: list[dict[str, Any]]
+    event_retention: int | None
+
+
+def get_organization_config_inputs(organization: Organization) -> OrganizationConfigInputs:
+    with _config_section("get_organization_config_inputs"):
+        return OrganizationConfigInputs(
+            organization_id=organization.id,
+            trusted_relays=_get_trusted_relays(organization),
+            features={
+                feature: features.has(feature, organization)
+                for feature in EXPOSABLE_FEATURES
+                if feature.startswith("organizations:")
+            },
+            performance_score_profiles=_get_performance_score_profiles(organization),
+            event_retention=quotas.backend.get_event_retention(organization),
+        )
+
+
+def _get_trusted_relays(organization: Organization) -> list[str]:
+    return [r["public_key"] for r in organization.get_option("sentry:trusted-relays", []) if r]
+
+
+def get_exposed_features(
+    project: Project, organization_features: Mapping[str, bool] | None = None
+) -> Sequence[str]:
     active_features = []
     for feature in EXPOSABLE_FEATURES:
         if feature.startswith("organizations:"):
-            has_feature = features.has(feature, project.organization)
+            if organization_features is not None:
+                has_feature = organization_features[feature]
+            else:
+                has_feature = features.has(feature, project.organization)
         elif feature.startswith("projects:"):
             has_feature = features.has(feature, project)
         else:
@@ -279,7 +332,9 @@ def get_metrics_config(timeout: TimeChecker, project: Project) -> Mapping[str, A
 
 
 def get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    organization_inputs: OrganizationConfigInputs | None = None,
 ) -> ProjectConfig:
     """Constructs the ProjectConfig information.
     :param project: The project to load configuration for. Ensure that
@@ -289,6 +344,9 @@ def get_project_config(
         no project keys are provided it is assumed that the config does not
         need to contain auth information (this is the case when used in
         python's StoreView)
+    :param organization_inputs: Pre-computed organization-wide inputs, see
+        :func:`get_organization_config_inputs`. Used when building the
+        configs of many projects of the same organization.
     :return: a ProjectConfig object for the given project
     """
     with sentry_sdk.isolation_scope() as scope:
@@ -297,7 +355,9 @@ def get_project_config(
             sentry_sdk.start_transaction(name="get_project_config"),
             metrics.timer("relay.config.get_project_config.duration"),
         ):
-            return _get_project_config(project, project_keys=project_keys)
+            return _get_project_config(
+                project, project_keys=project_keys, organization_inputs=organization_inputs
+            )
 
 
 def get_dynamic_sampling_config(timeout: TimeChecker, project: Project) -> Mapping[str, Any] | None:
@@ -1015,15 +1075,29 @@ def _get_mobile_performance_profiles(
     ]
 
 
+def _get_performance_score_profiles(organization: Organization) -> list[dict[str, Any]]:
+    return [
+        *_get_desktop_browser_performance_profiles(organization),
+        *_get_mobile_browser_performance_profiles(organization),
+        *_get_mobile_performance_profiles(organization),
+        *_get_default_browser_performance_profiles(organization),
+    ]
+
+
 def _get_project_config(
-    project: Project, project_keys: Iterable[ProjectKey] | None = None
+    project: Project,
+    project_keys: Iterable[ProjectKey] | None = None,
+    organization_inputs: OrganizationConfigInputs | None = None,
 ) -> ProjectConfig:
     if project.status != ObjectStatus.ACTIVE:
         return ProjectConfig(project, disabled=True)
 
+    if organization_inputs is not None:
+        assert organization_inputs.organization_id == project.organization_id
+
     public_keys = get_public_key_configs(project_keys=project_keys)
 
-    with sentry_sdk.start_span(op="get_public_config"):
+    with _config_section("get_public_config"):
         now = datetime.now(timezone.utc)
         cfg = {
             "disabled": False,
@@ -1033,12 +1107,12 @@ def _get_project_config(
             "rev": uuid.uuid4().hex,
             "publicKeys": public_keys,
             "config": {
-                "allowedDomains": list(get_origins(project)),
-                "trustedRelays": [
-                    r["public_key"]
-                    for r in project.organization.get_option("sentry:trusted-relays", [])
-                    if r
-                ],
+                "allowedDomains": sorted(get_origins(project)),
+                "trustedRelays": (
+                    organization_inputs.trusted_relays
+                    if organization_inputs is not None
+                    else _get_trusted_relays(project.organization)
+                ),
                 "piiConfig": get_pii_config(project),
                 "datascrubbingSettings": get_datascrubbing_settings(project),
             },
@@ -1048,8 +1122,11 @@ def _get_project_config(
 
     config = cfg["config"]
 
-    with sentry_sdk.start_span(op="get_exposed_features"):
-        if exposed_features := get_exposed_features(project):
+    with _config_section("get_exposed_features"):
+        if exposed_features := get_exposed_features(
+            project,
+            organization_inputs.features if organization_inputs is not None else None,
+        ):
             config["features"] = exposed_features
 
     # NOTE: Omitting dynamicSampling because of a failure increases the number
@@ -1100,27 +1177,28 @@ def _get_project_config(
         ),
     }
 
-    performance_score_profiles = [
-        *_get_desktop_browser_performance_profiles(project.organization),
-        *_get_mobile_browser_performance_profiles(project.organization),
-        *_get_mobile_performance_profiles(project.organization),
-        *_get_default_browser_performance_profiles(project.organization),
-    ]
+    if organization_inputs is not None:
+        performance_score_profiles = organization_inputs.performance_score_profiles
+    else:
+        performance_score_profiles = _get_performance_score_profiles(project.organization)
     if performance_score_profiles:
         config["performanceScore"] = {"profiles": performance_score_profiles}
 
-    with sentry_sdk.start_span(op="get_filter_settings"):
+    with _config_section("get_filter_settings"):
         if filter_settings := get_filter_settings(project):
             config["filterSettings"] = filter_settings
-    with sentry_sdk.start_span(op="get_grouping_config_dict_for_project"):
+    with _config_section("get_grouping_config_dict_for_project"):
         grouping_config = get_grouping_config_dict_for_project(project)
         if grouping_config is not None:
             config["groupingConfig"] = grouping_config
-    with sentry_sdk.start_span(op="get_event_retention"):
-        event_retention = quotas.backend.get_event_retention(project.organization)
+    with _config_section("get_event_retention"):
+        if organization_inputs is not None:
+            event_retention = organization_inputs.event_retention
+        else:
+            event_retention = quotas.backend.get_event_retention(project.organization)
         if event_retention is not None:
             config["eventRetention"] = event_retention
-    with sentry_sdk.start_span(op="get_all_quotas"):
+    with _config_section("get_all_quotas"):
         if quotas_config := get_quotas(project, keys=project_keys):
             config["quotas"] = quotas_config
 
@@ -1,28 +1,80 @@
+import hashlib
 import logging
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 import zstandard
 
+from sentry import options
 from sentry.relay.projectconfig_cache.base import ProjectConfigCache
 from sentry.utils import json, metrics, redis
 from sentry.utils.redis import validate_dynamic_cluster
 
 REDIS_CACHE_TIMEOUT = 3600  # 1 hr
 COMPRESSION_LEVEL = 3  # 3 is the default level of compression
+COMPRESSION_DICTIONARY_SIZE = 64 * 1024
+
+#: Top-level keys of a project config which change on every computation and are therefore
+#: excluded from the content hash.
+VOLATILE_CONFIG_KEYS = frozenset(("rev", "lastFetch", "lastChange"))
 
 logger = logging.getLogger(__name__)
 
 
+def _encode_content_default(o: object) -> object:
+    # Set iteration order depends on the per-process string hash seed.
+    if isinstance(o, (set, frozenset)):
+        return sorted(o)
+    return json.better_default_encoder(o)
+
+
+_content_encoder = json.JSONEncoder(
+    separators=(",", ":"),
+    sort_keys=True,
+    ignore_nan=True,
+    default=_encode_content_default,
+)
+
+
+def _serialize_content(config: Mapping[str, Any]) -> bytes:
+    """Serializes a project config without its revision and timestamps, such that equal
+    configs serialize equally in every process."""
+    return _content_encoder.encode(
+        {k: v for k, v in config.items() if k not in VOLATILE_CONFIG_KEYS}
+    ).encode()
+
+
+def train_compression_dictionary(
+    configs: Iterable[Mapping[str, Any]], dict_size: int = COMPRESSION_DICTIONARY_SIZE
+) -> bytes:
+    """Trains a zstd dictionary on a sample of project configs.
+
+    The result can be stored in a file and passed to the cache through the
+    ``compression_dictionary`` option. All readers of the cache, including Relay,
+    must be configured with the same dictionary.
+    """
+    samples = [json.dumps(config).encode() for config in configs]
+    return zstandard.train_dictionary(dict_size, samples).as_bytes()
+
+
 class RedisProjectConfigCache(ProjectConfigCache):
-    def __init__(self, **options):
-        cluster_key = options.get("cluster", "default")
+    def __init__(self, **cache_options):
+        cluster_key = cache_options.get("cluster", "default")
         self.cluster = redis.redis_clusters.get_binary(cluster_key)
 
-        read_cluster_key = options.get("read_cluster", cluster_key)
+        read_cluster_key = cache_options.get("read_cluster", cluster_key)
         self.cluster_read = redis.redis_clusters.get_binary(read_cluster_key)
 
-        super().__init__(**options)
+        # Optional path to a dictionary created with `train_compression_dictionary`.
+        # Decompression with a dictionary also accepts values written without one, but
+        # values written with a dictionary can only be read by readers which have it.
+        dictionary = None
+        if dictionary_path := cache_options.get("compression_dictionary"):
+            with open(dictionary_path, "rb") as f:
+                dictionary = zstandard.ZstdCompressionDict(f.read())
+        self.compression_dictionary = dictionary
+
+        super().__init__(**cache_options)
 
     def validate(self):
         validate_dynamic_cluster(True, self.cluster)
@@ -33,14 +85,70 @@ class RedisProjectConfigCache(ProjectConfigCache):
     def __get_redis_rev_key(self, public_key):
         return f"{self.__get_redis_key(public_key)}.rev"
 
+    def __get_redis_hash_key(self, public_key):
+        return f"{self.__get_redis_key(public_key)}.hash"
+
+    def __compress(self, serialized: bytes) -> bytes:
+        if self.compression_dictionary is None:
+            return zstandard.compress(serialized, level=COMPRESSION_LEVEL)
+        compressor = zstandard.ZstdCompressor(
+            level=COMPRESSION_LEVEL, dict_data=self.compression_dictionary
+        )
+        return compressor.compress(serialized)
+
+    def __decompress(self, compressed: bytes) -> bytes:
+        if self.compression_dictionary is None:
+            return zstandard.decompress(compressed)
+        decompressor = zstandard.ZstdDecompressor(dict_data=self.compression_dictionary)
+        return decompressor.decompress(compressed)
+
+    def __get_unchanged(self, hashes: Mapping[str, str]) -> set[str]:
+        """Returns the public keys whose cached config has the given content hash."""
+        public_keys = list(hashes)
+        p = self.cluster.pipeline(transaction=False)
+        for public_key in public_keys:
+            p.get(self.__get_redis_hash_key(public_key))
+            p.exists(self.__get_redis_key(public_key))
+        results = p.execute()
+
+        unchanged = set()
+        for i, public_key in enumerate(public_keys):
+            stored_hash, exists = results[2 * i], results[2 * i + 1]
+            if exists and stored_hash is not None and stored_hash.decode() == hashes[public_key]:
+                unchanged.add(public_key)
+        return unchanged
+
     def set_many(self, configs: dict[str, Mapping[str, Any]]):
-        metrics.incr("relay.projectconfig_cache.write", amount=len(configs), tags={"action": "set"})
+        contents: dict[str, bytes] = {}
+        hashes: dict[str, str] = {}
+        unchanged: set[str] = set()
+        if options.get("relay.projectconfig-cache.skip-unchanged"):
+            contents = {
+                public_key: _serialize_content(config) for public_key, config in configs.items()
+            }
+            hashes = {
+                public_key: hashlib.sha1(content).hexdigest()
+                for public_key, content in contents.items()
+            }
+            unchanged = self.__get_unchanged(hashes)
+
+        written_bytes = skipped_bytes = 0
 
         # Note: Those are multiple pipelines, one per cluster node.
         p = self.cluster.pipeline(transaction=False)
         for public_key, config in configs.items():
+            if public_key in unchanged:
+                # The content did not change, keep the stored config and its revision so
+                # readers can keep using what they have and only extend the lifetime.
+                skipped_bytes += len(contents[public_key])
+                p.expire(self.__get_redis_key(public_key), REDIS_CACHE_TIMEOUT)
+                p.expire(self.__get_redis_rev_key(public_key), REDIS_CACHE_TIMEOUT)
+                p.expire(self.__get_redis_hash_key(public_key), REDIS_CACHE_TIMEOUT)
+                continue
+
             serialized = json.dumps(config).encode()
-            compressed = zstandard.compress(serialized, level=COMPRESSION_LEVEL)
+            compressed = self.__compress(serialized)
+            written_bytes += len(serialized)
             metrics.distribution(
                 "relay.projectconfig_cache.uncompressed_size", len(serialized), unit="byte"
             )
@@ -57,31 +165,67 @@ class RedisProjectConfigCache(ProjectConfigCache):
             # made transactional.
             if rev := config.get("rev"):
                 p.setex(self.__get_redis_rev_key(public_key), REDIS_CACHE_TIMEOUT, rev)
+            if content_hash := hashes.get(public_key):
+                p.setex(self.__get_redis_hash_key(public_key), REDIS_CACHE_TIMEOUT, content_hash)
+            else:
+                # Never leave a hash behind which does not match the stored config.
+                p.delete(self.__get_redis_hash_key(public_key))
 
         p.execute()
 
+        metrics.incr(
+            "relay.projectconfig_cache.write",
+            amount=len(configs) - len(unchanged),
+            tags={"action": "set"},
+        )
+        metrics.incr(
+            "relay.projectconfig_cache.write", amount=len(unchanged), tags={"action": "unchanged"}
+        )
+        # Both are reported as uncompressed sizes to make them comparable.
+        metrics.incr(
+            "relay.projectconfig_cache.write_bytes", amount=written_bytes, tags={"action": "set"}
+        )
+        metrics.incr(
+            "relay.projectconfig_cache.write_bytes",
+            amount=skipped_bytes,
+            tags={"action": "unchanged"},
+        )
+
     def delete_many(self, public_keys):
         # Note: Those are multiple pipelines, one per cluster node
         with self.cluster.pipeline() as p:
             for public_key in public_keys:
                 p.delete(self.__get_redis_key(public_key))
+                # The content hash must not outlive the config, otherwise a re-write of
+                # the same content would be skipped.
+                p.delete(self.__get_redis_hash_key(public_key))
             return_values = p.execute()
 
         metrics.incr(
-            "relay.projectconfig_cache.write", amount=sum(return_values), tags={"action": "delete"}
+            "relay.projectconfig_cache.write",
+            amount=sum(return_values[::2]),
+            tags={"action": "delete"},
         )
 
     def get(self, public_key):
         rv_b = self.cluster_read.get(self.__get_redis_key(public_key))
         if rv_b is not None:
             try:
-                rv = zstandard.decompress(rv_b).decode()
+                rv = self.__decompress(rv_b).decode()
             except (TypeError, zstandard.ZstdError):
                 # assume raw json
                 rv = rv_b.decode()
             return json.loads(rv)
         return None
 
+    def exists_many(self, public_keys: Iterable[str]) -> set[str]:
+        public_keys = list(public_keys)
+        # Note: Those are multiple pipelines, one per cluster node.
+        p = self.cluster_read.pipeline(transaction=False)
+        for public_key in public_keys:
+            p.exists(self.__get_redis_key(public_key))
+        return {public_key for public_key, exists in zip(public_keys, p.execute()) if exists}
+
     def get_rev(self, public_key) -> str | None:
         if value := self.cluster_read.get(self.__get_redis_rev_key(public_key)):
             return value.decode()
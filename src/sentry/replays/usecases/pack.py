@@ -16,6 +16,7 @@ binary encoding for the `[` character. These are considered rrweb type
 payloads and can be returned as is.
 """
 
+from collections.abc import Iterable, Iterator
 from enum import Enum
 
 USIZE = 4  # Unsigned integer word size.
@@ -56,3 +57,42 @@ def _unpack_rrweb(mv: memoryview) -> tuple[None, memoryview]:
 def _unpack_video(mv: memoryview) -> tuple[memoryview, memoryview]:
     end = int.from_bytes(mv[1:HEADER_OFFSET]) + HEADER_OFFSET
     return (mv[HEADER_OFFSET:end], mv[end:])
+
+
+def unpack_rrweb_stream(chunks: Iterable[memoryview]) -> Iterator[memoryview]:
+    """Yield the rrweb bytes of a packed payload which is received in chunks.
+
+    Video bytes are skipped as they stream past and are never buffered. Only the header is
+    copied, every other chunk is yielded as a view of the input.
+    """
+    header = b""
+    skip: int | None = None  # Bytes left to discard. Unknown until the header is read.
+
+    for chunk in chunks:
+        if skip is None:
+            header += chunk
+            skip = _header_length(header)
+            if skip is None:
+                continue
+            chunk = memoryview(header)
+
+        if skip >= len(chunk):
+            skip -= len(chunk)
+            continue
+
+        yield chunk[skip:]
+        skip = 0
+
+
+def _header_length(header: bytes) -> int | None:
+    """Return the number of bytes preceding the rrweb payload or None if more are needed."""
+    if not header:
+        return None
+    elif header[0] == Encoding.RRWEB.value:
+        return 1
+    elif header[0] == Encoding.VIDEO.value:
+        if len(header) < HEADER_OFFSET:
+            return None
+        return int.from_bytes(header[1:HEADER_OFFSET]) + HEADER_OFFSET
+    else:  # Not packed.
+        return 0
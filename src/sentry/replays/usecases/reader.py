@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import uuid
 import zlib
+from collections import deque
 from collections.abc import Iterator
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Any
 
@@ -33,7 +34,7 @@ from sentry.replays.lib.storage import (
     storage_kv,
 )
 from sentry.replays.models import ReplayRecordingSegment
-from sentry.replays.usecases.pack import unpack
+from sentry.replays.usecases.pack import unpack, unpack_rrweb_stream
 from sentry.utils.snuba import raw_snql_query
 
 # METADATA QUERY BEHAVIOR.
@@ -250,23 +251,68 @@ def segment_row_to_storage_meta(
 # BLOB DOWNLOAD BEHAVIOR.
 
 
-def download_segments(segments: list[RecordingSegmentStorageMeta]) -> Iterator[bytes]:
-    """Download segment data from remote storage."""
+# The number of segments downloaded ahead of the segment being streamed.
+DOWNLOAD_CONCURRENCY = 10
+
+# The maximum size of a chunk of decompressed segment data.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def download_segments(
+    segments: list[RecordingSegmentStorageMeta],
+) -> Iterator[bytes | memoryview]:
+    """Download segment data from remote storage.
+
+    Segments are downloaded concurrently but only a bounded number of them are held in memory at
+    once. Each segment is decompressed and unpacked incrementally as it is written out, so peak
+    memory does not depend on the number or the size of the segments.
+    """
     yield b"["
 
-    with ThreadPoolExecutor(max_workers=10) as pool:
-        segment_data = pool.map(_download_segment, segments)
+    for i, blob in enumerate(iter_segment_blobs(segments)):
+        if i > 0:
+            yield b","
 
-    for i, result in enumerate(segment_data):
-        if result is None:
+        if blob is None:
             yield b"[]"
         else:
-            yield result[1]
-            if i < len(segments) - 1:
-                yield b","
+            yield from unpack_rrweb_stream(iter_decompress(blob))
+
     yield b"]"
 
 
+def iter_segment_blobs(
+    segments: list[RecordingSegmentStorageMeta],
+    max_workers: int = DOWNLOAD_CONCURRENCY,
+) -> Iterator[bytes | None]:
+    """Yield the compressed blob of each segment in order.
+
+    At most `max_workers` downloads are in flight or waiting to be consumed at any time.
+    """
+    pending: deque[Future[bytes | None]] = deque()
+    remaining = iter(segments)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        try:
+            for segment in remaining:
+                pending.append(pool.submit(_download_blob, segment))
+                if len(pending) == max_workers:
+                    break
+
+            while pending:
+                blob = pending.popleft().result()
+
+                segment = next(remaining, None)
+                if segment is not None:
+                    pending.append(pool.submit(_download_blob, segment))
+
+                yield blob
+        finally:
+            # The response may be closed before it was fully consumed.
+            for future in pending:
+                future.cancel()
+
+
 def download_segment(segment: RecordingSegmentStorageMeta, span: Any) -> bytes:
     results = _download_segment(segment)
     return results[1] if results is not None else b"[]"
@@ -287,10 +333,13 @@ def download_video(segment: RecordingSegmentStorageMeta) -> bytes | None:
         return video
 
 
-def _download_segment(segment: RecordingSegmentStorageMeta) -> tuple[bytes | None, bytes] | None:
+def _download_blob(segment: RecordingSegmentStorageMeta) -> bytes | None:
     driver = filestore if segment.file_id else storage
+    return driver.get(segment)
 
-    result = driver.get(segment)
+
+def _download_segment(segment: RecordingSegmentStorageMeta) -> tuple[bytes | None, bytes] | None:
+    result = _download_blob(segment)
     if result is None:
         return None
 
@@ -308,3 +357,35 @@ def decompress(buffer: bytes) -> bytes:
         return buffer
 
     return zlib.decompress(buffer, zlib.MAX_WBITS | 32)
+
+
+def iter_decompress(buffer: bytes, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[memoryview]:
+    """Yield decompressed output in chunks of at most `chunk_size` bytes.
+
+    See `decompress`. Uncompressed buffers are yielded as views without being copied.
+    """
+    view = memoryview(buffer)
+
+    if buffer.startswith(b"["):
+        for i in range(0, len(view), chunk_size):
+            yield view[i : i + chunk_size]
+        return
+
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 32)
+    for i in range(0, len(view), chunk_size):
+        data: bytes | memoryview = view[i : i + chunk_size]
+        while True:
+            output = decompressor.decompress(data, chunk_size)
+            if output:
+                yield memoryview(output)
+
+            data = decompressor.unconsumed_tail
+            if not data and len(output) < chunk_size:
+                break
+
+    output = decompressor.flush()
+    if output:
+        yield memoryview(output)
+
+    if not decompressor.eof:
+        raise zlib.error("Error -5 while decompressing data: incomplete or truncated stream")
@@ -2,6 +2,7 @@ import logging
 import random
 import uuid
 from collections import defaultdict
+from collections.abc import Iterable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any, DefaultDict, NamedTuple
@@ -38,7 +39,7 @@ from sentry.rules.processing.buffer_processing import (
 from sentry.rules.processing.processor import (
     PROJECT_ID_BUFFER_LIST_KEY,
     activate_downstream_actions,
-    bulk_get_rule_status,
+    bulk_get_rule_statuses,
     is_condition_slow,
     split_conditions_and_filters,
 )
@@ -373,6 +374,9 @@ def get_condition_group_results(
     condition_group_results = {}
     current_time = datetime.now(tz=timezone.utc)
     project_id = project.id
+    rules_by_id = Rule.objects.in_bulk(
+        {rule_id for _, _, rule_id in condition_groups.values() if rule_id}
+    )
 
     for unique_condition, (condition_data, group_ids, rule_id) in condition_groups.items():
         cls_id = unique_condition.cls_id
@@ -385,10 +389,7 @@ def get_condition_group_results(
             )
             continue
 
-        if rule_id:
-            rule = Rule.objects.get(id=rule_id)
-        else:
-            rule = None
+        rule = rules_by_id.get(rule_id) if rule_id else None
 
         condition_inst = condition_cls(
             project=project, data=condition_data, rule=rule  # type: ignore[arg-type]
@@ -419,41 +420,66 @@ def get_condition_group_results(
     return condition_group_results
 
 
-def passes_comparison(
+def get_passing_groups(
     condition_group_results: dict[UniqueConditionQuery, dict[int, int | float]],
     condition_data: EventFrequencyConditionData,
-    group_id: int,
+    group_ids: Iterable[int],
     environment_id: int,
     project_id: int,
-) -> bool:
+) -> set[int]:
     """
-    Checks if a specific condition instance has passed. Handles both the count
-    and percent comparison type conditions.
+    Returns the groups for which a specific condition instance has passed.
+    Handles both the count and percent comparison type conditions, evaluating
+    the condition for all groups at once.
     """
     unique_queries = generate_unique_queries(condition_data, environment_id)
-    try:
-        query_values = [
-            condition_group_results[unique_query][group_id] for unique_query in unique_queries
-        ]
-    except KeyError:
-        metrics.incr("delayed_processing.missing_query_result")
+    query_results = [condition_group_results.get(unique_query) for unique_query in unique_queries]
+    is_percent = condition_data.get("comparisonType") == ComparisonType.PERCENT
+    target_value = float(condition_data["value"])
+
+    passing_group_ids: set[int] = set()
+    missing_group_ids: list[int] = []
+    for group_id in group_ids:
+        try:
+            query_values = [results[group_id] for results in query_results]  # type: ignore[index]
+        except (KeyError, TypeError):
+            missing_group_ids.append(group_id)
+            continue
+
+        calculated_value = query_values[0]
+        if is_percent:
+            calculated_value = percent_increase(calculated_value, query_values[1])
+
+        if calculated_value > target_value:
+            passing_group_ids.add(group_id)
+
+    if missing_group_ids:
+        metrics.incr("delayed_processing.missing_query_result", amount=len(missing_group_ids))
         logger.info(
             "delayed_processing.missing_query_result",
             extra={
                 "condition_data": condition_data,
                 "project_id": project_id,
-                "group_id": group_id,
+                "group_ids": missing_group_ids,
             },
         )
-        return False
 
-    calculated_value = query_values[0]
-    if condition_data.get("comparisonType") == ComparisonType.PERCENT:
-        calculated_value = percent_increase(calculated_value, query_values[1])
+    return passing_group_ids
 
-    target_value = float(condition_data["value"])
 
-    return calculated_value > target_value
+def passes_comparison(
+    condition_group_results: dict[UniqueConditionQuery, dict[int, int | float]],
+    condition_data: EventFrequencyConditionData,
+    group_id: int,
+    environment_id: int,
+    project_id: int,
+) -> bool:
+    """
+    Checks if a specific condition instance has passed for a single group.
+    """
+    return group_id in get_passing_groups(
+        condition_group_results, condition_data, [group_id], environment_id, project_id
+    )
 
 
 def get_rules_to_fire(
@@ -465,23 +491,39 @@ def get_rules_to_fire(
     rules_to_fire = defaultdict(set)
     for alert_rule, slow_conditions in rules_to_slow_conditions.items():
         action_match = alert_rule.data.get("action_match", "any")
-        for group_id in rules_to_groups[alert_rule.id]:
-            conditions_matched = 0
+        group_ids = rules_to_groups[alert_rule.id]
+        # Each condition is only evaluated for the groups it can still change
+        # the outcome for.
+        if action_match == "any":
+            matched: set[int] = set()
             for slow_condition in slow_conditions:
-                if passes_comparison(
+                remaining = group_ids - matched
+                if not remaining:
+                    break
+                matched |= get_passing_groups(
                     condition_group_results,
                     slow_condition,
-                    group_id,
+                    remaining,
                     alert_rule.environment_id,
                     project_id,
-                ):
-                    if action_match == "any":
-                        rules_to_fire[alert_rule].add(group_id)
-                        break
-                    elif action_match == "all":
-                        conditions_matched += 1
-            if action_match == "all" and conditions_matched == len(slow_conditions):
-                rules_to_fire[alert_rule].add(group_id)
+                )
+        elif action_match == "all":
+            matched = set(group_ids)
+            for slow_condition in slow_conditions:
+                if not matched:
+                    break
+                matched = get_passing_groups(
+                    condition_group_results,
+                    slow_condition,
+                    matched,
+                    alert_rule.environment_id,
+                    project_id,
+                )
+        else:
+            continue
+
+        if matched:
+            rules_to_fire[alert_rule].update(matched)
     return rules_to_fire
 
 
@@ -516,6 +558,9 @@ def fire_rules(
                 },
             )
         group_id_to_group = {group.id: group for group in group_to_groupevent.keys()}
+        group_to_rule_statuses = bulk_get_rule_statuses(
+            alert_rules, list(group_id_to_group.values()), project
+        )
         for rule, group_ids in rules_to_fire.items():
             with tracker.track(f"rule_{rule.id}"):
                 frequency = rule.data.get("frequency") or Rule.DEFAULT_FREQUENCY
@@ -534,8 +579,7 @@ def fire_rules(
                         )
                         continue
 
-                    rule_statuses = bulk_get_rule_status(alert_rules, group, project)
-                    status = rule_statuses[rule.id]
+                    status = group_to_rule_statuses[group.id][rule.id]
                     if status.last_active and status.last_active > freq_offset:
                         logger.info(
                             "delayed_processing.last_active",
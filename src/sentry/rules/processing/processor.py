@@ -90,55 +90,84 @@ def build_rule_status_cache_key(rule_id: int, group_id: int) -> str:
 def bulk_get_rule_status(
     rules: Sequence[Rule], group: Group, project: Project
 ) -> Mapping[int, GroupRuleStatus]:
-    keys = [build_rule_status_cache_key(rule.id, group.id) for rule in rules]
-    cache_results: Mapping[str, GroupRuleStatus] = cache.get_many(keys)
-    missing_rule_ids: set[int] = set()
-    rule_statuses: MutableMapping[int, GroupRuleStatus] = {}
-    for key, rule in zip(keys, rules):
+    return bulk_get_rule_statuses(rules, [group], project)[group.id]
+
+
+def bulk_get_rule_statuses(
+    rules: Sequence[Rule], groups: Sequence[Group], project: Project
+) -> Mapping[int, Mapping[int, GroupRuleStatus]]:
+    """
+    Fetches the statuses of every rule for every group, keyed by group id and then
+    rule id. All lookups share a single cache round trip, and missing statuses are
+    fetched or created with one set of queries for all groups.
+    """
+    keys = {
+        build_rule_status_cache_key(rule.id, group.id): (group.id, rule.id)
+        for group in groups
+        for rule in rules
+    }
+    cache_results: Mapping[str, GroupRuleStatus] = cache.get_many(list(keys))
+    missing: set[tuple[int, int]] = set()
+    rule_statuses: dict[int, MutableMapping[int, GroupRuleStatus]] = {
+        group.id: {} for group in groups
+    }
+    for key, (group_id, rule_id) in keys.items():
         rule_status = cache_results.get(key)
         if not rule_status:
-            missing_rule_ids.add(rule.id)
+            missing.add((group_id, rule_id))
         else:
-            rule_statuses[rule.id] = rule_status
+            rule_statuses[group_id][rule_id] = rule_status
+
+    def fetch_missing() -> list[GroupRuleStatus]:
+        # Filtering on both columns can match more pairs than we asked for, those are
+        # ignored.
+        statuses = GroupRuleStatus.objects.filter(
+            group_id__in={group_id for group_id, _ in missing},
+            rule_id__in={rule_id for _, rule_id in missing},
+        )
+        fetched = []
+        for status in statuses:
+            if (status.group_id, status.rule_id) in missing:
+                rule_statuses[status.group_id][status.rule_id] = status
+                missing.remove((status.group_id, status.rule_id))
+                fetched.append(status)
+        return fetched
 
-    if missing_rule_ids:
+    if missing:
         # If not cached, attempt to fetch status from the database
-        statuses = GroupRuleStatus.objects.filter(group=group, rule_id__in=missing_rule_ids)
-        to_cache: list[GroupRuleStatus] = list()
-        for status in statuses:
-            rule_statuses[status.rule_id] = status
-            missing_rule_ids.remove(status.rule_id)
-            to_cache.append(status)
+        to_cache = fetch_missing()
 
         # We might need to create some statuses if they don't already exist
-        if missing_rule_ids:
+        if missing:
             # We use `ignore_conflicts=True` here to avoid race conditions where the statuses
             # might be created between when we queried above and attempt to create the rows now.
             GroupRuleStatus.objects.bulk_create(
                 [
-                    GroupRuleStatus(rule_id=rule_id, group=group, project=project)
-                    for rule_id in missing_rule_ids
+                    GroupRuleStatus(rule_id=rule_id, group_id=group_id, project=project)
+                    for group_id, rule_id in missing
                 ],
                 ignore_conflicts=True,
             )
             # Using `ignore_conflicts=True` prevents the pk from being set on the model
             # instances. Re-query the database to fetch the rows, they should all exist at this
             # point.
-            statuses = GroupRuleStatus.objects.filter(group=group, rule_id__in=missing_rule_ids)
-            for status in statuses:
-                rule_statuses[status.rule_id] = status
-                missing_rule_ids.remove(status.rule_id)
-                to_cache.append(status)
+            to_cache.extend(fetch_missing())
 
-            if missing_rule_ids:
+            if missing:
                 # Shouldn't happen, but log just in case
                 logger.error(
                     "Failed to fetch some GroupRuleStatuses in RuleProcessor",
-                    extra={"missing_rule_ids": missing_rule_ids, "group_id": group.id},
+                    extra={
+                        "missing_rule_ids": {rule_id for _, rule_id in missing},
+                        "group_ids": {group_id for group_id, _ in missing},
+                    },
                 )
         if to_cache:
             cache.set_many(
-                {build_rule_status_cache_key(item.rule_id, group.id): item for item in to_cache}
+                {
+                    build_rule_status_cache_key(item.rule_id, item.group_id): item
+                    for item in to_cache
+                }
             )
 
     return rule_statuses
@@ -385,6 +414,11 @@ class RuleProcessor:
             .update(last_active=now)
         )
 
+        # Later events of the same group in a batch share this status, so they skip
+        # the rule at the frequency check instead of evaluating its conditions again.
+        # If nothing was updated another event fired the rule within the window.
+        status.last_active = now
+
         if not updated:
             return
 
@@ -440,3 +474,49 @@ class RuleProcessor:
                 self.apply_rule(rule, rule_statuses[rule.id])
 
         return self.grouped_futures.values()
+
+
+def bulk_apply_rules(
+    processors: Sequence[RuleProcessor],
+) -> list[Collection[tuple[Callable[[GroupEvent, Sequence[RuleFuture]], None], list[RuleFuture]]]]:
+    """
+    Applies the rules of a batch of events of a single project, returning the
+    futures of each processor in the same order as `RuleProcessor.apply` would.
+
+    Rules and snoozes are loaded once for the batch and all rule statuses are
+    fetched with one cache round trip. Events are processed in order and share
+    the rule statuses of their group, so once a rule fires for a group its
+    conditions aren't evaluated again for the rest of the batch.
+    """
+    if not processors:
+        return []
+
+    project = processors[0].project
+    if any(rp.project.id != project.id for rp in processors):
+        raise ValueError("All events of a batch must belong to the same project")
+
+    # we should only apply rules on unresolved issues
+    active = [rp for rp in processors if rp.group.is_unresolved()]
+    rules: Sequence[Rule] = active[0].get_rules() if active else []
+    snoozed_rules: set[int] = set()
+    rule_statuses: Mapping[int, Mapping[int, GroupRuleStatus]] = {}
+    if rules:
+        snoozed_rules = set(
+            RuleSnooze.objects.filter(rule__in=rules, user_id=None).values_list("rule", flat=True)
+        )
+        groups = {rp.group.id: rp.group for rp in active}
+        rule_statuses = bulk_get_rule_statuses(rules, list(groups.values()), project)
+
+    metrics.distribution("rules.processing.batch_size", len(processors))
+    results: list[
+        Collection[tuple[Callable[[GroupEvent, Sequence[RuleFuture]], None], list[RuleFuture]]]
+    ] = []
+    for rp in processors:
+        rp.grouped_futures.clear()
+        if rp.group.id in rule_statuses and rp.group.is_unresolved():
+            for rule in rules:
+                if rule.id not in snoozed_rules:
+                    rp.apply_rule(rule, rule_statuses[rp.group.id][rule.id])
+        results.append(rp.grouped_futures.values())
+
+    return results
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import os
+import queue
 import time
-from collections.abc import Callable
-from datetime import timedelta
+from collections import defaultdict, deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from multiprocessing import JoinableQueue as Queue
 from multiprocessing import Process
-from typing import Any, Final, Literal, TypeAlias
+from multiprocessing import Queue as ResultQueue
+from typing import Any, Final, Literal, NamedTuple, TypeAlias
 from uuid import uuid4
 
 import click
@@ -37,12 +41,38 @@ def get_project(value: str) -> int | None:
 # an identity on an object() isn't guaranteed to work between parent
 # and child proc
 _STOP_WORKER: Final = "91650ec271ae4b3e8a67cdc909d80f8c"
+
+
+class BulkDeleteRange(NamedTuple):
+    """A `[min_id, max_id)` slice of a BulkDeleteQuery, run by a cleanup worker"""
+
+    model_name: str
+    dtfield: str
+    order_by: str | None
+    cutoff: datetime
+    project_id: int | None
+    min_id: int
+    max_id: int
+
+
+class BulkDeleteResult(NamedTuple):
+    model_name: str
+    min_id: int
+    max_id: int
+    rows: int
+    failed: bool
+
+
 _WorkQueue: TypeAlias = (
-    "Queue[Literal['91650ec271ae4b3e8a67cdc909d80f8c'] | tuple[str, tuple[int, ...]]]"
+    "Queue[Literal['91650ec271ae4b3e8a67cdc909d80f8c'] | tuple[str, tuple[int, ...]]"
+    " | BulkDeleteRange]"
 )
+_ResultQueue: TypeAlias = "ResultQueue[BulkDeleteResult]"
 
 API_TOKEN_TTL_IN_DAYS = 30
 
+BULK_DELETE_CHUNK_SIZE = 10000
+
 
 def debug_output(msg: str) -> None:
     if os.environ.get("SENTRY_CLEANUP_SILENT", None):
@@ -50,7 +80,7 @@ def debug_output(msg: str) -> None:
     click.echo(msg)
 
 
-def multiprocess_worker(task_queue: _WorkQueue) -> None:
+def multiprocess_worker(task_queue: _WorkQueue, result_queue: _ResultQueue | None = None) -> None:
     # Configure within each Process
     import logging
 
@@ -63,6 +93,7 @@ def multiprocess_worker(task_queue: _WorkQueue) -> None:
     configure()
 
     from sentry import deletions, models, similarity
+    from sentry.db.deletion import BulkDeleteQuery
 
     skip_models = [
         # Handled by other parts of cleanup
@@ -82,6 +113,28 @@ def multiprocess_worker(task_queue: _WorkQueue) -> None:
 
             return
 
+        if isinstance(j, BulkDeleteRange):
+            rows = 0
+            failed = False
+            try:
+                rows = BulkDeleteQuery(
+                    model=import_string(j.model_name),
+                    dtfield=j.dtfield,
+                    order_by=j.order_by,
+                    project_id=j.project_id,
+                    cutoff=j.cutoff,
+                ).execute(chunk_size=BULK_DELETE_CHUNK_SIZE, id_range=(j.min_id, j.max_id))
+            except Exception as e:
+                failed = True
+                logger.exception(e)
+            finally:
+                if result_queue is not None:
+                    result_queue.put(
+                        BulkDeleteResult(j.model_name, j.min_id, j.max_id, rows, failed)
+                    )
+                task_queue.task_done()
+            continue
+
         model_name, chunk = j
         model = import_string(model_name)
         try:
@@ -123,6 +176,26 @@ def multiprocess_worker(task_queue: _WorkQueue) -> None:
     is_flag=True,
     help="Send the duration of this command to internal metrics.",
 )
+@click.option(
+    "--max-per-model",
+    type=int,
+    default=2,
+    show_default=True,
+    help="The maximum number of workers running bulk deletes against the same table.",
+)
+@click.option(
+    "--id-range-size",
+    type=int,
+    default=1_000_000,
+    show_default=True,
+    help="The number of ids covered by each bulk delete chunk.",
+)
+@click.option(
+    "--progress-file",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="Record completed bulk delete chunks in this file. A run interrupted with the same file resumes where it stopped.",
+)
 @log_options()
 def cleanup(
     days: int,
@@ -132,6 +205,9 @@ def cleanup(
     model: tuple[str, ...],
     router: str | None,
     timed: bool,
+    max_per_model: int,
+    id_range_size: int,
+    progress_file: str | None,
 ) -> None:
     """Delete a portion of trailing data based on creation date.
 
@@ -144,6 +220,9 @@ def cleanup(
     if concurrency < 1:
         click.echo("Error: Minimum concurrency is 1", err=True)
         raise click.Abort()
+    if max_per_model < 1 or id_range_size < 1:
+        click.echo("Error: --max-per-model and --id-range-size must be at least 1", err=True)
+        raise click.Abort()
 
     os.environ["_SENTRY_CLEANUP"] = "1"
     if silent:
@@ -154,8 +233,9 @@ def cleanup(
 
     pool = []
     task_queue: _WorkQueue = Queue(1000)
+    result_queue: _ResultQueue = ResultQueue()
     for _ in range(concurrency):
-        p = Process(target=multiprocess_worker, args=(task_queue,))
+        p = Process(target=multiprocess_worker, args=(task_queue, result_queue))
         p.daemon = True
         p.start()
         pool.append(p)
@@ -209,14 +289,32 @@ def cleanup(
         exported_data(is_filtered, silent)
 
         project_id = None
+        nodestore_cleanup = None
         if SiloMode.get_current_mode() != SiloMode.CONTROL:
             if project:
                 remove_cross_project_models(deletes)
                 project_id = get_project_id_or_fail(project)
             else:
-                remove_old_nodestore_values(days)
-
-        run_bulk_query_deletes(bulk_query_deletes, is_filtered, days, project, project_id)
+                # NodeStore cleanup doesn't depend on anything below, so let it run
+                # alongside the database deletes.
+                nodestore_executor = ThreadPoolExecutor(max_workers=1)
+                nodestore_cleanup = nodestore_executor.submit(remove_old_nodestore_values, days)
+                nodestore_executor.shutdown(wait=False)
+
+        progress = CleanupProgress(progress_file, days, project_id)
+        run_bulk_query_deletes(
+            bulk_query_deletes,
+            is_filtered,
+            days,
+            project,
+            project_id,
+            task_queue=task_queue,
+            result_queue=result_queue,
+            pool=pool,
+            progress=progress,
+            max_per_model=max_per_model,
+            id_range_size=id_range_size,
+        )
 
         debug_output("Running bulk deletes in DELETES")
         for model_tp, dtfield, order_by in deletes:
@@ -235,10 +333,14 @@ def cleanup(
                     order_by=order_by,
                 )
 
+                rows = 0
+                model_start = time.monotonic()
                 for chunk in q.iterator(chunk_size=100):
                     task_queue.put((imp, chunk))
+                    rows += len(chunk)
 
                 task_queue.join()
+                report_throughput(imp, rows, time.monotonic() - model_start)
 
         project_deletion_query, to_delete_by_project = prepare_deletes_by_project(
             project, project_id, is_filtered
@@ -270,8 +372,14 @@ def cleanup(
 
         task_queue.join()
 
+        if nodestore_cleanup is not None:
+            nodestore_cleanup.result()
+
         remove_file_blobs(is_filtered, silent)
 
+        # Everything completed, the next run should start from scratch.
+        progress.clear()
+
     finally:
         # Shut down our pool
         for _ in pool:
@@ -426,30 +534,209 @@ def generate_bulk_query_deletes() -> list[tuple[type[Model], str, str | None]]:
     return BULK_QUERY_DELETES
 
 
+def report_throughput(model_name: str, rows: int, seconds: float) -> None:
+    from sentry.utils import metrics
+
+    rate = rows / seconds if seconds > 0 else 0.0
+    debug_output(f">> {model_name}: deleted {rows} rows in {seconds:.1f}s ({rate:.1f} rows/sec)")
+    metrics.incr("cleanup.deleted_rows", amount=rows, tags={"model": model_name}, sample_rate=1.0)
+    metrics.distribution(
+        "cleanup.rows_per_second", rate, tags={"model": model_name}, sample_rate=1.0
+    )
+
+
+class CleanupProgress:
+    """
+    Bulk delete ranges that have been planned and completed, saved to a JSON file
+    after every range so an interrupted cleanup can resume.
+
+    A resumed run reuses the cutoff and ranges of the interrupted one, so the
+    remaining ranges delete the same rows it would have. Progress is only resumed
+    for the same `--days` and project.
+    """
+
+    def __init__(self, path: str | None, days: int, project_id: int | None) -> None:
+        from sentry.utils import json
+
+        self.path = path
+        self.days = days
+        self.project_id = project_id
+        self.models: dict[str, dict[str, Any]] = {}
+
+        if path and os.path.exists(path):
+            with open(path) as f:
+                state = json.load(f)
+            if state.get("days") == days and state.get("project_id") == project_id:
+                self.models = state["models"]
+                debug_output(f"Resuming cleanup progress from {path}")
+
+    def get(
+        self, model_name: str
+    ) -> tuple[datetime, list[tuple[int, int]], set[tuple[int, int]]] | None:
+        """Return the cutoff, all ranges and completed ranges recorded for a model"""
+        entry = self.models.get(model_name)
+        if entry is None:
+            return None
+        return (
+            datetime.fromisoformat(entry["cutoff"]),
+            [(min_id, max_id) for min_id, max_id in entry["ranges"]],
+            {(min_id, max_id) for min_id, max_id in entry["completed"]},
+        )
+
+    def start(self, model_name: str, cutoff: datetime, ranges: list[tuple[int, int]]) -> None:
+        self.models[model_name] = {
+            "cutoff": cutoff.isoformat(),
+            "ranges": ranges,
+            "completed": [],
+        }
+        self.save()
+
+    def complete(self, model_name: str, min_id: int, max_id: int) -> None:
+        self.models[model_name]["completed"].append((min_id, max_id))
+        self.save()
+
+    def save(self) -> None:
+        from sentry.utils import json
+
+        if not self.path:
+            return
+        state = {"days": self.days, "project_id": self.project_id, "models": self.models}
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        self.models = {}
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def split_id_range(min_id: int, max_id: int, range_size: int) -> list[tuple[int, int]]:
+    """Split the inclusive `[min_id, max_id]` into half open ranges of `range_size` ids"""
+    return [
+        (start, min(start + range_size, max_id + 1))
+        for start in range(min_id, max_id + 1, range_size)
+    ]
+
+
+def plan_bulk_delete_ranges(
+    model_tp: type[Model],
+    dtfield: str,
+    order_by: str | None,
+    days: int,
+    project_id: int | None,
+    progress: CleanupProgress,
+    id_range_size: int,
+) -> list[BulkDeleteRange]:
+    from sentry.db.deletion import BulkDeleteQuery
+
+    model_name = ".".join((model_tp.__module__, model_tp.__name__))
+    resumed = progress.get(model_name)
+    if resumed is not None:
+        cutoff, ranges, completed = resumed
+    else:
+        query = BulkDeleteQuery(model=model_tp, dtfield=dtfield, days=days, project_id=project_id)
+        cutoff = query.get_cutoff()
+        assert cutoff is not None
+        bounds = query.get_id_bounds()
+        ranges = split_id_range(*bounds, id_range_size) if bounds is not None else []
+        completed = set()
+        progress.start(model_name, cutoff, ranges)
+
+    return [
+        BulkDeleteRange(model_name, dtfield, order_by, cutoff, project_id, min_id, max_id)
+        for min_id, max_id in ranges
+        if (min_id, max_id) not in completed
+    ]
+
+
+def run_bulk_delete_ranges(
+    pending: dict[str, deque[BulkDeleteRange]],
+    task_queue: _WorkQueue,
+    result_queue: _ResultQueue,
+    pool: Sequence[Process],
+    progress: CleanupProgress,
+    max_per_model: int,
+) -> None:
+    """
+    Hand bulk delete ranges to the worker pool, with at most `max_per_model` ranges of
+    the same table in flight, and report throughput as each model completes.
+
+    Failed ranges are logged by the worker and left out of the progress file, so a
+    resumed run retries them.
+    """
+    in_flight: dict[str, int] = defaultdict(int)
+    total_in_flight = 0
+    rows: dict[str, int] = defaultdict(int)
+    started: dict[str, float] = {}
+
+    while total_in_flight or any(pending.values()):
+        # Hand out ranges round robin, so that one large table doesn't occupy every
+        # worker while the others wait.
+        submitted = True
+        while submitted and total_in_flight < len(pool):
+            submitted = False
+            for model_name, ranges in pending.items():
+                if total_in_flight >= len(pool):
+                    break
+                if ranges and in_flight[model_name] < max_per_model:
+                    task_queue.put(ranges.popleft())
+                    started.setdefault(model_name, time.monotonic())
+                    in_flight[model_name] += 1
+                    total_in_flight += 1
+                    submitted = True
+
+        try:
+            result = result_queue.get(timeout=60)
+        except queue.Empty:
+            if not all(p.is_alive() for p in pool):
+                raise click.ClickException("A cleanup worker exited unexpectedly")
+            continue
+
+        in_flight[result.model_name] -= 1
+        total_in_flight -= 1
+        if not result.failed:
+            rows[result.model_name] += result.rows
+            progress.complete(result.model_name, result.min_id, result.max_id)
+
+        if not pending[result.model_name] and not in_flight[result.model_name]:
+            report_throughput(
+                result.model_name,
+                rows[result.model_name],
+                time.monotonic() - started[result.model_name],
+            )
+
+
 def run_bulk_query_deletes(
     bulk_query_deletes: list[tuple[type[Model], str, str | None]],
     is_filtered: Callable[[type[Model]], bool],
     days: int,
     project: str | None,
     project_id: int | None,
+    *,
+    task_queue: _WorkQueue,
+    result_queue: _ResultQueue,
+    pool: Sequence[Process],
+    progress: CleanupProgress,
+    max_per_model: int,
+    id_range_size: int,
 ) -> None:
-    from sentry.db.deletion import BulkDeleteQuery
-
     debug_output("Running bulk query deletes in bulk_query_deletes")
+    pending: dict[str, deque[BulkDeleteRange]] = {}
     for model_tp, dtfield, order_by in bulk_query_deletes:
-        chunk_size = 10000
-
         debug_output(f"Removing {model_tp.__name__} for days={days} project={project or '*'}")
         if is_filtered(model_tp):
             debug_output(">> Skipping %s" % model_tp.__name__)
         else:
-            BulkDeleteQuery(
-                model=model_tp,
-                dtfield=dtfield,
-                days=days,
-                project_id=project_id,
-                order_by=order_by,
-            ).execute(chunk_size=chunk_size)
+            ranges = plan_bulk_delete_ranges(
+                model_tp, dtfield, order_by, days, project_id, progress, id_range_size
+            )
+            debug_output(f">> {len(ranges)} id ranges to delete")
+            if ranges:
+                pending[ranges[0].model_name] = deque(ranges)
+
+    run_bulk_delete_ranges(pending, task_queue, result_queue, pool, progress, max_per_model)
 
 
 def prepare_deletes_by_project(
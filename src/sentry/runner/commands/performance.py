@@ -1,5 +1,8 @@
 #!/usr/bin/env python
 
+import os
+import time
+from collections import defaultdict
 from inspect import isclass
 
 import click
@@ -22,15 +25,22 @@ def performance() -> None:
     "-d", "--detector", "detector_class", help="Limit detection to only one detector class"
 )
 @click.option("-v", "--verbose", count=True)
+@click.option(
+    "--benchmark",
+    is_flag=True,
+    default=False,
+    help="Replay every JSON event in filename (a file or directory) and report CPU time per detector",
+)
 @configuration
-def detect(filename: str, detector_class: str | None, verbose: int) -> None:
+def detect(filename: str, detector_class: str | None, verbose: int, benchmark: bool) -> None:
     """
     Runs performance problem detection on event data in the supplied filename
     using default detector settings with every detector. Filename should be a
-    path to a JSON event data file.
+    path to a JSON event data file, or with --benchmark a directory of them.
     """
     from sentry.utils.performance_issues import performance_detection
     from sentry.utils.performance_issues.base import PerformanceDetector
+    from sentry.utils.performance_issues.span_index import SpanIndex
 
     if detector_class:
         detector_classes = [performance_detection.__dict__[detector_class]]
@@ -43,14 +53,51 @@ def detect(filename: str, detector_class: str | None, verbose: int) -> None:
 
     settings = performance_detection.get_detection_settings()
 
+    if benchmark:
+        if os.path.isdir(filename):
+            paths = sorted(
+                os.path.join(filename, name)
+                for name in os.listdir(filename)
+                if name.endswith(".json")
+            )
+        else:
+            paths = [filename]
+
+        cpu_time: dict[str, float] = defaultdict(float)
+        problem_count: dict[str, int] = defaultdict(int)
+        for path in paths:
+            with open(path) as file:
+                data = json.loads(file.read())
+
+            start = time.process_time()
+            span_index = SpanIndex(data.get("spans") or [])
+            cpu_time[SpanIndex.__name__] += time.process_time() - start
+
+            for cls in detector_classes:
+                start = time.process_time()
+                detector = cls(settings, data)
+                detector.span_index = span_index
+                performance_detection.run_detector_on_data(detector, data)
+                cpu_time[cls.__name__] += time.process_time() - start
+                problem_count[cls.__name__] += len(detector.stored_problems)
+
+        click.echo(f"Replayed {len(paths)} {pluralize(len(paths), 'event,events')}")
+        for name, seconds in sorted(cpu_time.items(), key=lambda item: item[1], reverse=True):
+            problems = f" {problem_count[name]:>6} problems" if name in problem_count else ""
+            click.echo(f"{name:<45} {seconds * 1000:>10.2f} ms{problems}")
+        click.echo(f"{'Total':<45} {sum(cpu_time.values()) * 1000:>10.2f} ms")
+        return
+
     with open(filename) as file:
         data = json.loads(file.read())
         if verbose > 1:
             click.echo(f"Event ID: {data['event_id']}")
 
+        span_index = SpanIndex(data.get("spans") or [])
         detectors = [cls(settings, data) for cls in detector_classes]
 
         for detector in detectors:
+            detector.span_index = span_index
             if verbose > 0:
                 click.echo(f"Detecting using {detector.__class__.__name__}")
 
@@ -314,6 +314,18 @@ def taskworker_scheduler(redis_cluster: str, **options: Any) -> None:
     help="The name of the processing pool being used",
     default="unknown",
 )
+@click.option(
+    "--process-type",
+    help="How child processes are started. forkserver forks children from a preloaded zygote process",
+    type=click.Choice(["spawn", "fork", "forkserver"]),
+    default="spawn",
+)
+@click.option(
+    "--adaptive-prefetch",
+    help="Size the child task queue from observed fetch and task latency instead of always filling it",
+    is_flag=True,
+    default=False,
+)
 @log_options()
 @configuration
 def taskworker(**options: Any) -> None:
@@ -41,17 +41,34 @@ redis.call("hset", main_redirect_key, span_id, set_span_id)
 redis.call("expire", main_redirect_key, set_timeout)
 
 local set_key = string.format("span-buf:s:{%s}:%s", project_and_trace, set_span_id)
+local set_bytes_key = string.format("span-buf:ib:%s", set_key)
+
+-- Moves the byte count of a merged set over to the set it was merged into.
+local function merge_bytes(from_key)
+    local from_bytes_key = string.format("span-buf:ib:%s", from_key)
+    local from_bytes = redis.call("get", from_bytes_key)
+    if from_bytes then
+        redis.call("incrby", set_bytes_key, from_bytes)
+        redis.call("unlink", from_bytes_key)
+    end
+end
+
 if not is_root_span and redis.call("scard", span_key) > 0 then
     redis.call("sunionstore", set_key, set_key, span_key)
     redis.call("unlink", span_key)
+    merge_bytes(span_key)
 end
 
 local parent_key = string.format("span-buf:s:{%s}:%s", project_and_trace, parent_span_id)
 if set_span_id ~= parent_span_id and redis.call("scard", parent_key) > 0 then
     redis.call("sunionstore", set_key, set_key, parent_key)
     redis.call("unlink", parent_key)
+    merge_bytes(parent_key)
 end
 redis.call("expire", set_key, set_timeout)
+if redis.call("exists", set_bytes_key) == 1 then
+    redis.call("expire", set_bytes_key, set_timeout)
+end
 
 local has_root_span_key = string.format("span-buf:hrs:%s", set_key)
 local has_root_span = redis.call("get", has_root_span_key) == "1" or is_root_span
@@ -5,12 +5,15 @@ import functools
 import logging
 import time
 from abc import ABCMeta, abstractmethod
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum, auto
 from hashlib import md5
 from math import floor
+from queue import Full
 from typing import Any, TypedDict, cast
 
 import sentry_sdk
@@ -68,11 +71,40 @@ from sentry.snuba.dataset import Dataset
 from sentry.users.models.user import User
 from sentry.users.services.user.model import RpcUser
 from sentry.utils import json, metrics, snuba
+from sentry.utils.concurrent import ThreadedExecutor
 from sentry.utils.cursors import Cursor, CursorResult
-from sentry.utils.snuba import SnubaQueryParams, aliased_query_params, bulk_raw_query
+from sentry.utils.snuba import (
+    ResultSet,
+    SnubaQueryParams,
+    aliased_query_params,
+    bulk_raw_query,
+    prepare_bulk_raw_query,
+    run_snuba_requests,
+)
 
 FIRST_RELEASE_FILTERS = ["first_release", "firstRelease"]
 
+# Sends the Snuba queries of a single search in the background when
+# `snuba.search.concurrent-queries` is enabled. Only the network round-trips
+# run on these workers, everything that touches the database stays on the
+# request thread. The queue is bounded so bursts of searches can't pile up
+# behind the workers, a search that doesn't fit runs its queries inline.
+_search_query_executor = ThreadedExecutor(worker_count=10, maxsize=50)
+
+
+def _submit_search_query[T](fn: Callable[[], T]) -> Future[T]:
+    future = _search_query_executor.submit(fn, block=False)
+    if not (future.done() and isinstance(future.exception(), Full)):
+        return future
+
+    metrics.incr("snuba.search.concurrent_queries.queue_full", skip_internal=False)
+    inline_future: Future[T] = Future()
+    try:
+        inline_future.set_result(fn())
+    except Exception as e:
+        inline_future.set_exception(e)
+    return inline_future
+
 
 class TrendsSortWeights(TypedDict):
     log_level: int
@@ -180,6 +212,21 @@ def group_categories_from_search_filters(
     return group_categories
 
 
+def _record_search_phase(timings: dict[str, float], phase: str, phase_start: float) -> None:
+    duration = time.time() - phase_start
+    timings[phase] = duration * 1000
+    metrics.timing("snuba.search.phase.duration", duration, tags={"phase": phase})
+
+
+@dataclass(frozen=True)
+class PreparedSnubaSearch:
+    # Snuba queries by group category
+    query_params: Mapping[int, SnubaQueryParams]
+    referrer: str
+    sort_field: str
+    get_sample: bool
+
+
 class AbstractQueryExecutor(metaclass=ABCMeta):
     """This class serves as a template for Query Executors.
     We subclass it in order to implement query methods (we use it to implement two classes: joined
@@ -432,6 +479,45 @@ class AbstractQueryExecutor(metaclass=ABCMeta):
             * a sorted list of (group_id, group_score) tuples sorted descending by score,
             * the count of total results (rows) available for this query.
         """
+        return self._run_snuba_search(
+            self._prepare_snuba_search(
+                start=start,
+                end=end,
+                project_ids=project_ids,
+                environment_ids=environment_ids,
+                sort_field=sort_field,
+                organization=organization,
+                cursor=cursor,
+                group_ids=group_ids,
+                limit=limit,
+                offset=offset,
+                get_sample=get_sample,
+                search_filters=search_filters,
+                referrer=referrer,
+                actor=actor,
+                aggregate_kwargs=aggregate_kwargs,
+            )
+        )
+
+    def _prepare_snuba_search(
+        self,
+        start: datetime,
+        end: datetime,
+        project_ids: Sequence[int],
+        environment_ids: Sequence[int] | None,
+        sort_field: str,
+        organization: Organization,
+        cursor: Cursor | None = None,
+        group_ids: Sequence[int] | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        get_sample: bool = False,
+        search_filters: Sequence[SearchFilter] | None = None,
+        referrer: str | None = None,
+        actor: Any | None = None,
+        aggregate_kwargs: TrendsSortWeights | None = None,
+    ) -> PreparedSnubaSearch:
+        """Builds the Snuba queries for :meth:`snuba_search` without running them."""
         filters = {"project_id": project_ids}
 
         environments = None
@@ -498,27 +584,64 @@ class AbstractQueryExecutor(metaclass=ABCMeta):
                 if query_params is not None:
                     query_params_for_categories[gc] = query_params
 
+        return PreparedSnubaSearch(
+            query_params=query_params_for_categories,
+            referrer=referrer,
+            sort_field=sort_field,
+            get_sample=get_sample,
+        )
+
+    def _run_snuba_search(self, prepared: PreparedSnubaSearch) -> tuple[list[tuple[int, Any]], int]:
+        bulk_query_results = self._bulk_query_with_fallback(
+            lambda query_params: bulk_raw_query(query_params, referrer=prepared.referrer),
+            prepared.query_params,
+        )
+        return self._reduce_snuba_search_results(prepared, bulk_query_results)
+
+    def _submit_snuba_search(
+        self, prepared: PreparedSnubaSearch
+    ) -> Future[tuple[list[tuple[int, Any]], int]]:
+        """Runs a prepared search on the search query pool.
+
+        The requests are built on the calling thread since that may hit the
+        database, only sending them happens in the background.
+        """
+        requests = {
+            gc: prepare_bulk_raw_query([query_params], referrer=prepared.referrer)[0]
+            for gc, query_params in prepared.query_params.items()
+        }
+
+        def run() -> tuple[list[tuple[int, Any]], int]:
+            bulk_query_results = self._bulk_query_with_fallback(run_snuba_requests, requests)
+            return self._reduce_snuba_search_results(prepared, bulk_query_results)
+
+        return _submit_search_query(run)
+
+    def _bulk_query_with_fallback[
+        T
+    ](
+        self, query: Callable[[list[T]], ResultSet], queries_for_categories: Mapping[int, T]
+    ) -> ResultSet:
         try:
-            bulk_query_results = bulk_raw_query(
-                list(query_params_for_categories.values()), referrer=referrer
-            )
+            return query(list(queries_for_categories.values()))
         except Exception:
             metrics.incr(
                 "snuba.search.group_category_bulk",
                 tags={
                     GroupCategory(gc_val).name.lower(): True
-                    for gc_val, _ in query_params_for_categories.items()
+                    for gc_val in queries_for_categories.keys()
                 },
             )
             # one of the parallel bulk raw queries failed (maybe the issue platform dataset),
             # we'll fallback to querying for errors only
-            if GroupCategory.ERROR.value in query_params_for_categories.keys():
-                bulk_query_results = bulk_raw_query(
-                    [query_params_for_categories[GroupCategory.ERROR.value]], referrer=referrer
-                )
+            if GroupCategory.ERROR.value in queries_for_categories.keys():
+                return query([queries_for_categories[GroupCategory.ERROR.value]])
             else:
                 raise
 
+    def _reduce_snuba_search_results(
+        self, prepared: PreparedSnubaSearch, bulk_query_results: ResultSet
+    ) -> tuple[list[tuple[int, Any]], int]:
         rows: list[MergeableRow] = []
         total = 0
         row_length = 0
@@ -532,11 +655,10 @@ class AbstractQueryExecutor(metaclass=ABCMeta):
 
         rows.sort(key=lambda row: row["group_id"])
 
-        if not get_sample:
+        if not prepared.get_sample:
             metrics.distribution("snuba.search.num_result_groups", row_length)
 
-        if get_sample:
-            sort_field = "sample"
+        sort_field = "sample" if prepared.get_sample else prepared.sort_field
 
         return [(row["group_id"], row[sort_field]) for row in rows], total  # type: ignore[literal-required]
 
@@ -880,6 +1002,8 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
         # to something that we can send down to Snuba in a `group_id IN (...)`
         # clause.
         max_candidates = options.get("snuba.search.max-pre-snuba-candidates")
+        timings: dict[str, float] = {}
+        phase_start = time.time()
 
         with sentry_sdk.start_span(op="snuba_group_query") as span:
             group_ids = list(
@@ -888,6 +1012,7 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
             span.set_data("Max Candidates", max_candidates)
             span.set_data("Result Size", len(group_ids))
         metrics.distribution("snuba.search.num_candidates", len(group_ids))
+        _record_search_phase(timings, "candidates", phase_start)
         too_many_candidates = False
         if not group_ids:
             # no matches could possibly be found from this point on
@@ -912,26 +1037,51 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
         chunk_limit = limit
         offset = 0
         num_chunks = 0
-        hits = self.calculate_hits(
-            group_ids,
-            too_many_candidates,
-            sort_field,
-            projects,
-            retention_window_start,
-            group_queryset,
-            environments,
-            sort_by,
-            limit,
-            cursor,
-            count_hits,
-            paginator_options,
-            search_filters,
-            start,
-            end,
-            actor,
-        )
-        if count_hits and hits == 0:
-            return self.empty_result
+        concurrent_queries = options.get("snuba.search.concurrent-queries")
+        speculative_chunks = options.get("snuba.search.speculative-chunks")
+        hits_future: Future[tuple[list[tuple[int, Any]], int]] | None = None
+        phase_start = time.time()
+        if concurrent_queries:
+            # The hits sample is sent now and collected after the first chunk
+            # came back, so both Snuba round-trips overlap.
+            hits = None
+            hits_sample = self._prepare_hits_sample(
+                group_ids,
+                too_many_candidates,
+                sort_field,
+                projects,
+                environments,
+                cursor,
+                count_hits,
+                search_filters,
+                start,
+                end,
+                actor,
+            )
+            if hits_sample is not None:
+                hits_future = self._submit_snuba_search(hits_sample)
+        else:
+            hits = self.calculate_hits(
+                group_ids,
+                too_many_candidates,
+                sort_field,
+                projects,
+                retention_window_start,
+                group_queryset,
+                environments,
+                sort_by,
+                limit,
+                cursor,
+                count_hits,
+                paginator_options,
+                search_filters,
+                start,
+                end,
+                actor,
+            )
+            _record_search_phase(timings, "hits", phase_start)
+            if count_hits and hits == 0:
+                return self.empty_result
 
         paginator_results = self.empty_result
         result_groups = []
@@ -940,6 +1090,7 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
         max_time = options.get("snuba.search.max-total-chunk-time-seconds")
         time_start = time.time()
         more_results = False
+        next_chunk: Future[tuple[list[tuple[int, Any]], int]] | None = None
 
         # Do smaller searches in chunks until we have enough results
         # to answer the query (or hit the end of possible results). We do
@@ -956,8 +1107,7 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
             # but if we have group_ids always query for at least that many items
             chunk_limit = max(chunk_limit, len(group_ids))
 
-            # {group_id: group_score, ...}
-            snuba_groups, total = self.snuba_search(
+            chunk_kwargs = dict(
                 start=start,
                 end=end,
                 project_ids=[p.id for p in projects],
@@ -966,21 +1116,49 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
                 sort_field=sort_field,
                 cursor=cursor,
                 group_ids=group_ids,
-                limit=chunk_limit,
-                offset=offset,
                 search_filters=search_filters,
                 referrer=referrer,
                 actor=actor,
                 aggregate_kwargs=aggregate_kwargs,
             )
+
+            # {group_id: group_score, ...}
+            if next_chunk is not None:
+                snuba_groups, total = next_chunk.result()
+                next_chunk = None
+            else:
+                snuba_groups, total = self.snuba_search(
+                    limit=chunk_limit, offset=offset, **chunk_kwargs
+                )
             metrics.distribution("snuba.search.num_snuba_results", len(snuba_groups))
             count = len(snuba_groups)
             more_results = count >= limit and (offset + limit) < total
             offset += len(snuba_groups)
 
+            if hits_future is not None:
+                hits = self._collect_hits(
+                    hits_future, group_queryset, max_time - (time.time() - time_start)
+                )
+                hits_future = None
+                _record_search_phase(timings, "hits", phase_start)
+                if count_hits and hits == 0:
+                    return self.empty_result
+
             if not snuba_groups:
                 break
 
+            if speculative_chunks and not group_ids and more_results:
+                # Post-filtering below only touches Postgres, so the next chunk
+                # (sized the same way the next iteration would) can already be
+                # fetched from Snuba. It is discarded if we end up not needing it.
+                next_chunk = self._submit_snuba_search(
+                    self._prepare_snuba_search(
+                        limit=min(int(chunk_limit * chunk_growth), max_chunk_size),
+                        offset=offset,
+                        **chunk_kwargs,
+                    )
+                )
+
             if group_ids:
                 # pre-filtered candidates were passed down to Snuba, so we're
                 # finished with filtering and these are the only results. Note
@@ -1023,6 +1201,12 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
             if group_ids or len(paginator_results.results) >= limit or not more_results:
                 break
 
+        if hits_future is not None:
+            hits_future.cancel()
+        if next_chunk is not None:
+            next_chunk.cancel()
+        _record_search_phase(timings, "chunks", time_start)
+
         # HACK: We're using the SequencePaginator to mask the complexities of going
         # back and forth between two databases. This causes a problem with pagination
         # because we're 'lying' to the SequencePaginator (it thinks it has the entire
@@ -1046,6 +1230,7 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
 
         groups = Group.objects.in_bulk(paginator_results.results)
         paginator_results.results = [groups[k] for k in paginator_results.results if k in groups]
+        paginator_results.timings = timings
 
         metrics.timing(
             "snuba.search.query",
@@ -1054,6 +1239,25 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
         )
         return paginator_results
 
+    def _collect_hits(
+        self,
+        hits_future: Future[tuple[list[tuple[int, Any]], int]],
+        group_queryset: Query,
+        timeout: float,
+    ) -> int | None:
+        """
+        Waits for a hits sample submitted by :meth:`_submit_snuba_search` for
+        at most the remaining time budget of the search. Hits are left
+        uncalculated if the sample doesn't arrive in time.
+        """
+        try:
+            snuba_groups, snuba_total = hits_future.result(timeout=max(timeout, 0))
+        except FutureTimeoutError:
+            hits_future.cancel()
+            metrics.incr("snuba.search.hits_timeout", skip_internal=False)
+            return None
+        return self._hits_from_sample(group_queryset, snuba_groups, snuba_total)
+
     def calculate_hits(
         self,
         group_ids: Sequence[int],
@@ -1078,6 +1282,42 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
         It will return 0 if hits were calculated and there are none.
         It will return None if hits were not calculated.
         """
+        prepared = self._prepare_hits_sample(
+            group_ids,
+            too_many_candidates,
+            sort_field,
+            projects,
+            environments,
+            cursor,
+            count_hits,
+            search_filters,
+            start,
+            end,
+            actor,
+        )
+        if prepared is None:
+            return None
+        snuba_groups, snuba_total = self._run_snuba_search(prepared)
+        return self._hits_from_sample(group_queryset, snuba_groups, snuba_total)
+
+    def _prepare_hits_sample(
+        self,
+        group_ids: Sequence[int],
+        too_many_candidates: bool,
+        sort_field: str,
+        projects: Sequence[Project],
+        environments: Sequence[Environment] | None,
+        cursor: Cursor | None,
+        count_hits: bool,
+        search_filters: Sequence[SearchFilter] | None,
+        start: datetime,
+        end: datetime,
+        actor: Any | None = None,
+    ) -> PreparedSnubaSearch | None:
+        """
+        Builds the Snuba sample query used to estimate hits, or returns None if
+        hits are not estimated from a sample.
+        """
         if count_hits is False:
             return None
         elif too_many_candidates or cursor is not None:
@@ -1130,21 +1370,23 @@ class PostgresSnubaQueryExecutor(AbstractQueryExecutor):
             if not too_many_candidates:
                 kwargs["group_ids"] = group_ids
 
-            snuba_groups, snuba_total = self.snuba_search(**kwargs)
-            snuba_count = len(snuba_groups)
-            if snuba_count == 0:
-                # Maybe check for 0 hits and return EMPTY_RESULT in ::query? self.empty_result
-                return 0
-            else:
-                filtered_count = group_queryset.filter(
-                    id__in=[gid for gid, _ in snuba_groups]
-                ).count()
-
-                hit_ratio = filtered_count / float(snuba_count)
-                hits = int(hit_ratio * snuba_total)
-                return hits
+            return self._prepare_snuba_search(**kwargs)
         return None
 
+    def _hits_from_sample(
+        self, group_queryset: Query, snuba_groups: Sequence[tuple[int, Any]], snuba_total: int
+    ) -> int:
+        snuba_count = len(snuba_groups)
+        if snuba_count == 0:
+            # Maybe check for 0 hits and return EMPTY_RESULT in ::query? self.empty_result
+            return 0
+        else:
+            filtered_count = group_queryset.filter(id__in=[gid for gid, _ in snuba_groups]).count()
+
+            hit_ratio = filtered_count / float(snuba_count)
+            hits = int(hit_ratio * snuba_total)
+            return hits
+
 
 class InvalidQueryForExecutor(Exception):
     pass
@@ -7,6 +7,7 @@ from typing import Any
 from sentry import options
 from sentry.ratelimits.sliding_windows import (
     GrantedQuota,
+    LocalSyncSlidingWindowRateLimiter,
     Quota,
     RedisSlidingWindowRateLimiter,
     RequestedQuota,
@@ -96,9 +97,13 @@ class RateLimitState:
 
 
 class WritesLimiter:
-    def __init__(self, namespace: str, **options: Mapping[str, str]) -> None:
+    def __init__(self, namespace: str, **cluster_options: Mapping[str, str]) -> None:
         self.namespace = namespace
-        self.rate_limiter: RedisSlidingWindowRateLimiter = RedisSlidingWindowRateLimiter(**options)
+        self.rate_limiter: RedisSlidingWindowRateLimiter
+        if options.get("sentry-metrics.writes-limiter.local-sync"):
+            self.rate_limiter = LocalSyncSlidingWindowRateLimiter(**cluster_options)
+        else:
+            self.rate_limiter = RedisSlidingWindowRateLimiter(**cluster_options)
 
     def _build_quota_key(self, use_case_id: UseCaseID, org_id: OrgId | None = None) -> str:
         if org_id is not None:
@@ -59,16 +59,26 @@ Glossary for types of keys:
     * span-buf:q:* -- the priority queue, used to determine which segments are ready to be flushed.
     * span-buf:hrs:* -- simple bool key to flag a segment as "has root span" (HRS)
     * span-buf:sr:* -- redirect mappings so that each incoming span ID can be mapped to the right span-buf:s: set.
+    * span-buf:ib:* -- the number of payload bytes stored in the corresponding span-buf:s: set, merged alongside the sets.
+
+Span payloads can optionally be stored zstd-compressed (see
+`SpanPayloadCodec`), using a dictionary trained from sample spans with
+`train_compression_dict`. Compressed and uncompressed payloads can be mixed
+within a segment, readers detect zstd frames by their magic number.
 """
 
 from __future__ import annotations
 
 import itertools
 import logging
+import random
+import time
+from collections import defaultdict
 from collections.abc import Generator, MutableMapping, Sequence
 from typing import Any, NamedTuple
 
 import rapidjson
+import zstandard
 from django.conf import settings
 from django.utils.functional import cached_property
 from sentry_redis_tools.clients import RedisCluster, StrictRedis
@@ -108,6 +118,53 @@ def get_redis_client() -> RedisCluster[bytes] | StrictRedis[bytes]:
 
 add_buffer_script = redis.load_redis_script("spans/add-buffer.lua")
 
+# Every zstd frame starts with this magic number, while span payloads are JSON
+# objects. This allows compressed and uncompressed payloads to coexist.
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Number of random segments per shard whose size is sampled for byte
+# accounting in `record_stored_segments`, and the minimum number of seconds
+# between two samples.
+BYTE_ACCOUNTING_SAMPLE_SIZE = 20
+BYTE_ACCOUNTING_INTERVAL_SECS = 10
+
+
+def train_compression_dict(samples: Sequence[bytes], dict_size: int = 112640) -> bytes:
+    """
+    Trains a zstd dictionary from sample span payloads, to be passed as
+    `compression_dict` to `SpansBuffer`. Writers and readers need to use the
+    same dictionary.
+    """
+    return zstandard.train_dictionary(dict_size, list(samples)).as_bytes()
+
+
+class SpanPayloadCodec:
+    """
+    Compresses span payloads before they are stored in the segment sets.
+
+    :param level: The zstd compression level, or 0 to store payloads as-is.
+    :param compression_dict: An optional shared dictionary, see
+        `train_compression_dict`.
+    """
+
+    def __init__(self, level: int = 0, compression_dict: bytes | None = None):
+        dict_data = zstandard.ZstdCompressionDict(compression_dict) if compression_dict else None
+        self.level = level
+        self._compressor = (
+            zstandard.ZstdCompressor(level=level, dict_data=dict_data) if level > 0 else None
+        )
+        self._decompressor = zstandard.ZstdDecompressor(dict_data=dict_data)
+
+    def encode(self, payload: bytes) -> bytes:
+        if self._compressor is None:
+            return payload
+        return self._compressor.compress(payload)
+
+    def decode(self, payload: bytes) -> bytes:
+        if payload.startswith(ZSTD_MAGIC):
+            return self._decompressor.decompress(payload)
+        return payload
+
 
 # NamedTuples are faster to construct than dataclasses
 class Span(NamedTuple):
@@ -148,6 +205,8 @@ class SpansBuffer:
         max_segment_bytes: int = 10 * 1024 * 1024,  # 10 MiB
         max_segment_spans: int = 1000,
         redis_ttl: int = 3600,
+        compression_level: int = 0,
+        compression_dict: bytes | None = None,
     ):
         self.assigned_shards = list(assigned_shards)
         self.span_buffer_timeout_secs = span_buffer_timeout_secs
@@ -156,12 +215,19 @@ class SpansBuffer:
         self.max_segment_bytes = max_segment_bytes
         self.max_segment_spans = max_segment_spans
         self.redis_ttl = redis_ttl
+        self.compression_level = compression_level
+        self.compression_dict = compression_dict
         self.add_buffer_sha: str | None = None
+        self._last_byte_accounting: float | None = None
 
     @cached_property
     def client(self) -> RedisCluster[bytes] | StrictRedis[bytes]:
         return get_redis_client()
 
+    @cached_property
+    def codec(self) -> SpanPayloadCodec:
+        return SpanPayloadCodec(self.compression_level, self.compression_dict)
+
     # make it pickleable
     def __reduce__(self):
         return (
@@ -170,7 +236,12 @@ class SpansBuffer:
                 self.assigned_shards,
                 self.span_buffer_timeout_secs,
                 self.span_buffer_root_timeout_secs,
+                self.segment_page_size,
+                self.max_segment_bytes,
+                self.max_segment_spans,
                 self.redis_ttl,
+                self.compression_level,
+                self.compression_dict,
             ),
         )
 
@@ -187,15 +258,32 @@ class SpansBuffer:
         min_redirect_depth = float("inf")
         max_redirect_depth = float("-inf")
 
+        raw_bytes = 0
+
         with metrics.timer("spans.buffer.process_spans.push_payloads"):
             trees = self._group_by_parent(spans)
 
+            added: list[tuple[str, int]] = []
             with self.client.pipeline(transaction=False) as p:
                 for (project_and_trace, parent_span_id), subsegment in trees.items():
                     set_key = f"span-buf:s:{{{project_and_trace}}}:{parent_span_id}"
-                    p.sadd(set_key, *[span.payload for span in subsegment])
+                    for span in subsegment:
+                        payload = self.codec.encode(span.payload)
+                        # One SADD per payload so that only payloads which were
+                        # not already in the set are counted below.
+                        p.sadd(set_key, payload)
+                        added.append((set_key, len(payload)))
+                        raw_bytes += len(span.payload)
 
-                p.execute()
+                results = p.execute()
+
+            # Bytes are tracked next to the set and merged along with it in
+            # add-buffer.lua, they are written before the script runs below.
+            added_bytes: dict[str, int] = defaultdict(int)
+            for (set_key, payload_bytes), is_new in zip(added, results):
+                if is_new:
+                    added_bytes[set_key] += payload_bytes
+            stored_bytes = sum(added_bytes.values())
 
         with metrics.timer("spans.buffer.process_spans.insert_spans"):
             # Workaround to make `evalsha` work in pipelines. We load ensure the
@@ -204,6 +292,10 @@ class SpansBuffer:
             add_buffer_sha = self._ensure_script()
 
             with self.client.pipeline(transaction=False) as p:
+                for set_key, subsegment_bytes in added_bytes.items():
+                    p.incrby(f"span-buf:ib:{set_key}", subsegment_bytes)
+                    p.expire(f"span-buf:ib:{set_key}", self.redis_ttl)
+
                 for (project_and_trace, parent_span_id), subsegment in trees.items():
                     for span in subsegment:
                         p.execute_command(
@@ -223,7 +315,8 @@ class SpansBuffer:
                         ]
                         queue_keys.append(self._get_queue_key(shard))
 
-                results = p.execute()
+                # Skip the INCRBY and EXPIRE results of the byte counters.
+                results = p.execute()[2 * len(added_bytes) :]
 
         with metrics.timer("spans.buffer.process_spans.update_queue"):
             queue_deletes: dict[bytes, set[bytes]] = {}
@@ -270,6 +363,8 @@ class SpansBuffer:
                 p.execute()
 
         metrics.timing("spans.buffer.process_spans.num_spans", len(spans))
+        metrics.timing("spans.buffer.process_spans.raw_bytes", raw_bytes)
+        metrics.timing("spans.buffer.process_spans.stored_bytes", stored_bytes)
         metrics.timing("spans.buffer.process_spans.num_is_root_spans", is_root_span_count)
         metrics.timing("spans.buffer.process_spans.num_has_root_spans", has_root_span_count)
         metrics.gauge("spans.buffer.min_redirect_depth", min_redirect_depth)
@@ -334,6 +429,66 @@ class SpansBuffer:
                 tags={"shard_i": shard_i},
             )
 
+        now = time.monotonic()
+        if (
+            self._last_byte_accounting is None
+            or now - self._last_byte_accounting >= BYTE_ACCOUNTING_INTERVAL_SECS
+        ):
+            self._last_byte_accounting = now
+            self._record_stored_segment_bytes(result)
+
+    def _record_stored_segment_bytes(self, queue_sizes: list[int]):
+        """
+        Estimates the bytes held by each shard from the sizes of a few random
+        segments in its queue.
+        """
+        with metrics.timer("spans.buffer.get_stored_segment_bytes"):
+            with self.client.pipeline(transaction=False) as p:
+                sample_sizes = []
+                for shard, queue_size in zip(self.assigned_shards, queue_sizes):
+                    key = self._get_queue_key(shard)
+                    indexes = random.sample(
+                        range(queue_size), min(queue_size, BYTE_ACCOUNTING_SAMPLE_SIZE)
+                    )
+                    for index in indexes:
+                        p.zrange(key, index, index)
+                    sample_sizes.append(len(indexes))
+
+                ranges = iter(p.execute())
+
+            # Segments can be flushed between the round trips, those are
+            # skipped or sampled as 0 bytes.
+            sampled_keys = [
+                [keys[0] for keys in itertools.islice(ranges, sample_size) if keys]
+                for sample_size in sample_sizes
+            ]
+
+            # Byte counters share the hashtag of their segment, so they can't
+            # be fetched with a single MGET on redis-cluster.
+            with self.client.pipeline(transaction=False) as p:
+                for shard_keys in sampled_keys:
+                    for segment_key in shard_keys:
+                        p.get(b"span-buf:ib:" + segment_key)
+
+                byte_counts = iter(p.execute())
+
+        for shard_i, queue_size, shard_keys in zip(self.assigned_shards, queue_sizes, sampled_keys):
+            if not shard_keys:
+                continue
+
+            shard_bytes = [int(next(byte_counts) or 0) for _ in shard_keys]
+            avg_segment_bytes = sum(shard_bytes) / len(shard_bytes)
+            metrics.timing(
+                "spans.buffer.flush_segments.avg_segment_bytes",
+                avg_segment_bytes,
+                tags={"shard_i": shard_i},
+            )
+            metrics.timing(
+                "spans.buffer.flush_segments.queue_bytes",
+                int(avg_segment_bytes * queue_size),
+                tags={"shard_i": shard_i},
+            )
+
     def get_memory_info(self) -> Generator[ServiceMemory]:
         return iter_cluster_memory_usage(self.client)
 
@@ -433,7 +588,8 @@ class SpansBuffer:
 
                 results = p.execute()
 
-            for key, (cursor, spans) in zip(current_keys, results):
+            for key, (cursor, stored_spans) in zip(current_keys, results):
+                spans = [self.codec.decode(span) for span in stored_spans]
                 sizes[key] += sum(len(span) for span in spans)
                 if sizes[key] > self.max_segment_bytes:
                     metrics.incr("spans.buffer.flush_segments.segment_size_exceeded")
@@ -474,6 +630,7 @@ class SpansBuffer:
                 for segment_key, flushed_segment in segment_keys.items():
                     hrs_key = b"span-buf:hrs:" + segment_key
                     p.delete(hrs_key)
+                    p.delete(b"span-buf:ib:" + segment_key)
                     p.unlink(segment_key)
 
                     project_id, trace_id, _ = parse_segment_key(segment_key)
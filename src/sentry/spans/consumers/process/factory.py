@@ -10,7 +10,9 @@ from arroyo.processing.strategies.batching import BatchStep, ValuesBatch
 from arroyo.processing.strategies.commit import CommitOffsets
 from arroyo.processing.strategies.run_task import RunTask
 from arroyo.types import Commit, FilteredPayload, Message, Partition
+from django.conf import settings
 
+from sentry import options
 from sentry.spans.buffer import Span, SpansBuffer
 from sentry.spans.consumers.process.flusher import SpanFlusher
 from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessing
@@ -18,6 +20,15 @@ from sentry.utils.arroyo import MultiprocessingPool, run_task_with_multiprocessi
 logger = logging.getLogger(__name__)
 
 
+def _load_compression_dict() -> bytes | None:
+    path = settings.SENTRY_SPAN_BUFFER_COMPRESSION_DICT
+    if not path:
+        return None
+
+    with open(path, "rb") as f:
+        return f.read()
+
+
 class ProcessSpansStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
     """
     1. Process spans and push them to redis
@@ -61,7 +72,11 @@ class ProcessSpansStrategyFactory(ProcessingStrategyFactory[KafkaPayload]):
     ) -> ProcessingStrategy[KafkaPayload]:
         committer = CommitOffsets(commit)
 
-        buffer = SpansBuffer(assigned_shards=[p.index for p in partitions])
+        buffer = SpansBuffer(
+            assigned_shards=[p.index for p in partitions],
+            compression_level=options.get("standalone-spans.buffer.compression.level"),
+            compression_dict=_load_compression_dict(),
+        )
 
         # patch onto self just for testing
         flusher: ProcessingStrategy[FilteredPayload | int]
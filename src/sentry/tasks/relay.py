@@ -131,22 +131,7 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
         # it could be possible that refrequent invalidations cause the task to take excessive time
         # to complete.
         for organization in Organization.objects.filter(id=organization_id):
-            for project in Project.objects.filter(organization_id=organization_id):
-                project.set_cached_field_value("organization", organization)
-                for key in ProjectKey.objects.filter(project_id=project.id):
-                    key.set_cached_field_value("project", project)
-                    # If we find the config in the cache it means it was active.  As such we want to
-                    # recalculate it.  If the config was not there at all, we leave it and avoid the
-                    # cost of re-computation.
-                    if projectconfig_cache.backend.get(key.public_key) is not None:
-                        configs[key.public_key] = compute_projectkey_config(key)
-                        action = "recompute"
-                    else:
-                        action = "not-cached"
-                    metrics.incr(
-                        "relay.projectconfig_cache.invalidation.recompute",
-                        tags={"action": action, "scope": "organization"},
-                    )
+            configs.update(compute_organization_configs(organization))
     elif project_id:
         for project in Project.objects.filter(id=project_id):
             for key in ProjectKey.objects.filter(project_id=project_id):
@@ -185,9 +170,59 @@ def compute_configs(organization_id=None, project_id=None, public_key=None):
     return configs
 
 
-def compute_projectkey_config(key):
+def compute_organization_configs(organization):
+    """Computes the configs of all cached project keys of an organization.
+
+    Projects and keys are loaded with one query each and the cache is checked for all keys in
+    a single round-trip.  Inputs shared by all projects of the organization (trusted relays,
+    organization features, performance profiles, event retention) are computed only once.
+
+    :returns: A dict mapping the public keys of all cached project keys to their config.
+    """
+    from sentry.models.project import Project
+    from sentry.models.projectkey import ProjectKey
+    from sentry.relay.config import get_organization_config_inputs
+
+    configs = {}
+    with metrics.timer("relay.config.compute_organization_configs.duration"):
+        projects = {
+            project.id: project
+            for project in Project.objects.filter(organization_id=organization.id)
+        }
+        if not projects:
+            return configs
+        keys = list(ProjectKey.objects.filter(project_id__in=projects.keys()))
+        # If we find the config in the cache it means it was active.  As such we want to
+        # recalculate it.  If the config was not there at all, we leave it and avoid the
+        # cost of re-computation.
+        cached = projectconfig_cache.backend.exists_many([key.public_key for key in keys])
+
+        organization_inputs = None
+        for key in keys:
+            project = projects[key.project_id]
+            project.set_cached_field_value("organization", organization)
+            key.set_cached_field_value("project", project)
+            if key.public_key in cached:
+                if organization_inputs is None:
+                    organization_inputs = get_organization_config_inputs(organization)
+                configs[key.public_key] = compute_projectkey_config(key, organization_inputs)
+                action = "recompute"
+            else:
+                action = "not-cached"
+            metrics.incr(
+                "relay.projectconfig_cache.invalidation.recompute",
+                tags={"action": action, "scope": "organization"},
+            )
+
+    metrics.distribution("relay.config.compute_organization_configs.count", len(configs))
+    return configs
+
+
+def compute_projectkey_config(key, organization_inputs=None):
     """Computes a single config for the given :class:`ProjectKey`.
 
+    :param organization_inputs: Optional pre-computed organization-wide inputs, see
+        :func:`sentry.relay.config.get_organization_config_inputs`.
     :returns: A dict with the project config.
     """
     from sentry.models.projectkey import ProjectKeyStatus
@@ -196,7 +231,9 @@ def compute_projectkey_config(key):
     if key.status != ProjectKeyStatus.ACTIVE:
         return {"disabled": True}
     else:
-        return get_project_config(key.project, project_keys=[key]).to_dict()
+        return get_project_config(
+            key.project, project_keys=[key], organization_inputs=organization_inputs
+        ).to_dict()
 
 
 @instrumented_task(
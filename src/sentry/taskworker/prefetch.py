@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import math
+import threading
+
+EWMA_WEIGHT = 0.2
+"""Weight given to each new sample in the moving averages."""
+
+CPU_SATURATED = 0.9
+"""Child CPU utilization above which we consider task execution to be CPU bound."""
+
+
+class AdaptivePrefetch:
+    """
+    Decide how many activations a worker should hold in its local child task queue.
+
+    Holding too few activations leaves child processes idle while the next fetch
+    round-trips to the broker. Holding too many leaves activations waiting locally
+    where no other worker can pick them up, and brings them closer to their
+    processing deadline.
+
+    The target depth follows Little's law: enough activations to keep every child
+    busy for the duration of one fetch. When children are CPU saturated, extra
+    buffering cannot increase throughput, so the depth is capped at one activation
+    per child.
+
+    When disabled the target is always `max_depth`, which matches filling the
+    queue whenever it has space.
+    """
+
+    def __init__(self, concurrency: int, max_depth: int, enabled: bool = False) -> None:
+        self.concurrency = max(concurrency, 1)
+        self.max_depth = max(max_depth, 1)
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._fetch_duration: float | None = None
+        self._execution_duration: float | None = None
+        self._queue_wait: float | None = None
+        self._cpu_utilization: float | None = None
+
+    @staticmethod
+    def _ewma(current: float | None, sample: float) -> float:
+        if current is None:
+            return sample
+        return current + EWMA_WEIGHT * (sample - current)
+
+    def record_fetch(self, duration: float) -> None:
+        with self._lock:
+            self._fetch_duration = self._ewma(self._fetch_duration, duration)
+
+    def record_execution(self, queue_wait: float, duration: float, cpu_time: float) -> None:
+        with self._lock:
+            if queue_wait >= 0:
+                self._queue_wait = self._ewma(self._queue_wait, queue_wait)
+            if duration > 0:
+                self._execution_duration = self._ewma(self._execution_duration, duration)
+                self._cpu_utilization = self._ewma(
+                    self._cpu_utilization, min(cpu_time / duration, 1.0)
+                )
+
+    @property
+    def cpu_utilization(self) -> float | None:
+        return self._cpu_utilization
+
+    def target_depth(self) -> int:
+        if not self.enabled:
+            return self.max_depth
+
+        with self._lock:
+            fetch_duration = self._fetch_duration
+            execution_duration = self._execution_duration
+            queue_wait = self._queue_wait
+            cpu_utilization = self._cpu_utilization
+
+        if fetch_duration is None or not execution_duration:
+            return self.max_depth
+
+        depth = math.ceil(self.concurrency * fetch_duration / execution_duration) + 1
+        if (
+            cpu_utilization is not None
+            and cpu_utilization >= CPU_SATURATED
+            and queue_wait is not None
+            and queue_wait > execution_duration
+        ):
+            depth = min(depth, self.concurrency)
+
+        return max(1, min(depth, self.max_depth))
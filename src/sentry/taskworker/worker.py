@@ -7,7 +7,7 @@ import queue
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
-from multiprocessing.context import ForkContext, SpawnContext
+from multiprocessing.context import ForkContext, ForkServerContext, SpawnContext
 from multiprocessing.process import BaseProcess
 from typing import Any
 
@@ -17,7 +17,8 @@ from sentry_protos.taskbroker.v1.taskbroker_pb2 import FetchNextTask, TaskActiva
 
 from sentry.taskworker.client import TaskworkerClient
 from sentry.taskworker.constants import DEFAULT_REBALANCE_AFTER, DEFAULT_WORKER_QUEUE_SIZE
-from sentry.taskworker.workerchild import ProcessingResult, child_process
+from sentry.taskworker.prefetch import AdaptivePrefetch
+from sentry.taskworker.workerchild import ZYGOTE_MODULE, ProcessingResult, child_process
 from sentry.utils import metrics
 
 logger = logging.getLogger("sentry.taskworker.worker")
@@ -34,7 +35,7 @@ class TaskWorker:
     Taskworkers can be run with `sentry run taskworker`
     """
 
-    mp_context: ForkContext | SpawnContext
+    mp_context: ForkContext | ForkServerContext | SpawnContext
 
     def __init__(
         self,
@@ -48,6 +49,7 @@ class TaskWorker:
         rebalance_after: int = DEFAULT_REBALANCE_AFTER,
         processing_pool_name: str | None = None,
         process_type: str = "spawn",
+        adaptive_prefetch: bool = False,
         **options: dict[str, Any],
     ) -> None:
         self.options = options
@@ -59,6 +61,11 @@ class TaskWorker:
             self.mp_context = multiprocessing.get_context("fork")
         elif process_type == "spawn":
             self.mp_context = multiprocessing.get_context("spawn")
+        elif process_type == "forkserver":
+            # Children are forked from a server process that has already configured
+            # django and imported task modules. See sentry.taskworker.zygote
+            self.mp_context = multiprocessing.get_context("forkserver")
+            self.mp_context.set_forkserver_preload([ZYGOTE_MODULE])
         else:
             raise ValueError(f"Invalid process type: {process_type}")
         self._process_type = process_type
@@ -79,6 +86,11 @@ class TaskWorker:
         self._setstatus_backoff_seconds = 0
 
         self._processing_pool_name: str = processing_pool_name or "unknown"
+        self._prefetch = AdaptivePrefetch(
+            concurrency=concurrency,
+            max_depth=child_tasks_queue_maxsize,
+            enabled=adaptive_prefetch,
+        )
 
     def __del__(self) -> None:
         self.shutdown()
@@ -105,7 +117,29 @@ class TaskWorker:
 
     def run_once(self) -> None:
         """Access point for tests to run a single worker loop"""
-        self._add_task()
+        # Fill the child task queue up to the prefetch target. The broker hands out
+        # one activation per call, so this is a loop of fetches.
+        while self._add_task():
+            pass
+
+    def _child_tasks_full(self) -> bool:
+        """
+        Whether the child task queue has reached its prefetch target.
+        """
+        if self._child_tasks.full():
+            return True
+        try:
+            return self._child_tasks.qsize() >= self._prefetch.target_depth()
+        except NotImplementedError:
+            # qsize() is not available on macOS, fall back to the queue bound.
+            return False
+
+    def _record_stage(self, stage: str, duration: float) -> None:
+        metrics.distribution(
+            "taskworker.worker.stage.duration",
+            duration,
+            tags={"stage": stage, "processing_pool": self._processing_pool_name},
+        )
 
     def shutdown(self) -> None:
         """
@@ -141,7 +175,7 @@ class TaskWorker:
         """
         Add a task to child tasks queue. Returns False if no new task was fetched.
         """
-        if self._child_tasks.full():
+        if self._child_tasks_full():
             return False
 
         task = self.fetch_task()
@@ -206,10 +240,11 @@ class TaskWorker:
                 time.monotonic() - task_received,
                 tags={"processing_pool": self._processing_pool_name},
             )
+        self._record_execution(result, task_received)
 
         if fetch:
             fetch_next = None
-            if not self._child_tasks.full():
+            if not self._child_tasks_full():
                 fetch_next = FetchNextTask(namespace=self._namespace)
 
             next_task = self._send_update_task(result, fetch_next)
@@ -230,6 +265,32 @@ class TaskWorker:
         self._send_update_task(result, fetch_next=None)
         return True
 
+    def _record_execution(self, result: ProcessingResult, task_received: float | None) -> None:
+        """
+        Record queue wait and execution time reported by a child, and feed them
+        into the prefetch target.
+        """
+        if not result.dequeued_at:
+            return
+        queue_wait = -1.0
+        if task_received is not None:
+            queue_wait = result.dequeued_at - task_received
+            self._record_stage("queue_wait", queue_wait)
+        self._record_stage("execute", result.execution_duration)
+        self._prefetch.record_execution(queue_wait, result.execution_duration, result.cpu_time)
+
+        if result.execution_duration > 0:
+            metrics.distribution(
+                "taskworker.worker.child_cpu_utilization",
+                result.cpu_time / result.execution_duration,
+                tags={"processing_pool": self._processing_pool_name},
+            )
+        metrics.gauge(
+            "taskworker.worker.prefetch_target",
+            self._prefetch.target_depth(),
+            tags={"processing_pool": self._processing_pool_name},
+        )
+
     def _send_update_task(
         self, result: ProcessingResult, fetch_next: FetchNextTask | None
     ) -> TaskActivation | None:
@@ -247,11 +308,13 @@ class TaskWorker:
         # Use the shutdown_event as a sleep mechanism
         self._shutdown_event.wait(self._setstatus_backoff_seconds)
         try:
+            start_time = time.monotonic()
             next_task = self.client.update_task(
                 task_id=result.task_id,
                 status=result.status,
                 fetch_next_task=fetch_next,
             )
+            self._record_stage("result_send", time.monotonic() - start_time)
             self._setstatus_backoff_seconds = 0
             return next_task
         except grpc.RpcError as e:
@@ -282,6 +345,7 @@ class TaskWorker:
                             self._max_child_task_count,
                             self._processing_pool_name,
                             self._process_type,
+                            time.monotonic(),
                         ),
                     )
                     process.start()
@@ -298,7 +362,9 @@ class TaskWorker:
         # Use the shutdown_event as a sleep mechanism
         self._shutdown_event.wait(self._gettask_backoff_seconds)
         try:
+            start_time = time.monotonic()
             activation = self.client.get_task(self._namespace)
+            fetch_duration = time.monotonic() - start_time
         except grpc.RpcError as e:
             logger.info(
                 "taskworker.fetch_task.failed",
@@ -321,6 +387,8 @@ class TaskWorker:
             self._gettask_backoff_seconds = min(self._gettask_backoff_seconds + 1, 10)
             return None
 
+        self._record_stage("fetch", fetch_duration)
+        self._prefetch.record_fetch(fetch_duration)
         self._gettask_backoff_seconds = 0
         self._task_receive_timing[activation.id] = time.monotonic()
         return activation
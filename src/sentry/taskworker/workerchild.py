@@ -5,6 +5,7 @@ import dataclasses
 import logging
 import queue
 import signal
+import sys
 import time
 from collections.abc import Callable, Generator
 from multiprocessing.synchronize import Event
@@ -28,6 +29,8 @@ logger = logging.getLogger("sentry.taskworker.worker")
 
 AT_MOST_ONCE_TIMEOUT = 60 * 60 * 24  # 1 day
 
+ZYGOTE_MODULE = "sentry.taskworker.zygote"
+
 
 class ProcessingDeadlineExceeded(BaseException):
     pass
@@ -39,6 +42,10 @@ class ProcessingResult:
 
     task_id: str
     status: TaskActivationStatus.ValueType
+    dequeued_at: float = 0.0
+    """time.monotonic() when the child took the activation off the queue"""
+    execution_duration: float = 0.0
+    cpu_time: float = 0.0
 
 
 def child_worker_init(process_type: str) -> None:
@@ -47,10 +54,18 @@ def child_worker_init(process_type: str) -> None:
     Child worker processes are spawned and don't inherit db
     connections or configuration from the parent process.
     """
+    if process_type == "forkserver" and ZYGOTE_MODULE not in sys.modules:
+        # multiprocessing.forkserver ignores ImportErrors raised by preload modules,
+        # children of a zygote that failed to load would run without configuration.
+        raise RuntimeError(
+            f"{ZYGOTE_MODULE} was not preloaded by the forkserver, import it to see why"
+        )
+
     from django.conf import settings
 
     from sentry.runner import configure
 
+    # Forked children inherit configuration from the worker or the zygote.
     if process_type == "spawn":
         configure()
 
@@ -101,6 +116,7 @@ def child_process(
     max_task_count: int | None,
     processing_pool_name: str,
     process_type: str,
+    spawned_at: float | None = None,
 ) -> None:
     """
     The entrypoint for spawned worker children.
@@ -108,6 +124,9 @@ def child_process(
     Any import that could pull in django needs to be put inside this functiona
     and not the module root. If modules that include django are imported at
     the module level the wrong django settings will be used.
+
+    `spawned_at` is the parent's time.monotonic() when the child was started,
+    used to measure startup cost per process type.
     """
     child_worker_init(process_type)
 
@@ -119,7 +138,32 @@ def child_process(
     from sentry.taskworker.state import clear_current_task, current_task, set_current_task
     from sentry.taskworker.task import Task
     from sentry.utils import metrics
-    from sentry.utils.memory import track_memory_usage
+    from sentry.utils.memory import get_shared_memory_usage, track_memory_usage
+
+    if spawned_at is not None:
+        metrics.distribution(
+            "taskworker.worker.child.startup_duration",
+            time.monotonic() - spawned_at,
+            tags={"process_type": process_type, "processing_pool": processing_pool_name},
+        )
+
+    def record_first_task() -> None:
+        tags = {"process_type": process_type, "processing_pool": processing_pool_name}
+        if spawned_at is not None:
+            metrics.distribution(
+                "taskworker.worker.child.first_task_duration",
+                time.monotonic() - spawned_at,
+                tags=tags,
+            )
+        memory = get_shared_memory_usage()
+        if memory is not None:
+            shared, private = memory
+            metrics.distribution(
+                "taskworker.worker.child.shared_memory", shared, unit="byte", tags=tags
+            )
+            metrics.distribution(
+                "taskworker.worker.child.private_memory", private, unit="byte", tags=tags
+            )
 
     def _get_known_task(activation: TaskActivation) -> Task[Any, Any] | None:
         if not taskregistry.contains(activation.namespace):
@@ -179,6 +223,7 @@ def child_process(
 
             try:
                 activation = child_tasks.get(timeout=1.0)
+                dequeued_at = time.monotonic()
             except queue.Empty:
                 metrics.incr(
                     "taskworker.worker.child_task_queue_empty",
@@ -197,7 +242,11 @@ def child_process(
                     },
                 )
                 processed_tasks.put(
-                    ProcessingResult(task_id=activation.id, status=TASK_ACTIVATION_STATUS_FAILURE)
+                    ProcessingResult(
+                        task_id=activation.id,
+                        status=TASK_ACTIVATION_STATUS_FAILURE,
+                        dequeued_at=dequeued_at,
+                    )
                 )
                 continue
 
@@ -228,6 +277,7 @@ def child_process(
             next_state = TASK_ACTIVATION_STATUS_FAILURE
             # Use time.time() so we can measure against activation.received_at
             execution_start_time = time.time()
+            cpu_start_time = time.process_time()
             try:
                 with timeout_alarm(activation.processing_deadline_duration, handle_alarm):
                     _execute_activation(task_func, activation)
@@ -266,16 +316,25 @@ def child_process(
 
             clear_current_task()
             processed_task_count += 1
+            if processed_task_count == 1:
+                record_first_task()
 
             # Get completion time before pushing to queue, so we can measure queue append time
             execution_complete_time = time.time()
+            result = ProcessingResult(
+                task_id=activation.id,
+                status=next_state,
+                dequeued_at=dequeued_at,
+                execution_duration=execution_complete_time - execution_start_time,
+                cpu_time=time.process_time() - cpu_start_time,
+            )
             with metrics.timer(
                 "taskworker.worker.processed_tasks.put.duration",
                 tags={
                     "processing_pool": processing_pool_name,
                 },
             ):
-                processed_tasks.put(ProcessingResult(task_id=activation.id, status=next_state))
+                processed_tasks.put(result)
 
             record_task_execution(
                 activation,
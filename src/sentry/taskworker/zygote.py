@@ -0,0 +1,58 @@
+"""
+Preload module for the taskworker forkserver, aka the zygote.
+
+When a TaskWorker runs with `process_type="forkserver"`, multiprocessing starts a
+single server process that imports this module once and forks every child from
+it. Children start with django configured, every task namespace imported and
+static registries populated, and share those pages with the server copy-on-write.
+Recycling a child after `max_child_task_count` is then a fork instead of a full
+application boot.
+
+Importing this module configures django. Only the forkserver should import it.
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import time
+
+from sentry.taskworker.workerchild import child_worker_init
+
+logger = logging.getLogger("sentry.taskworker.worker")
+
+
+def warm() -> int:
+    """
+    Configure django and import every task namespace. Returns the number of
+    registered tasks.
+    """
+    # Same initialization a spawned child does, but only once per worker.
+    child_worker_init("spawn")
+
+    from django.core.cache import caches
+    from django.db import connections
+
+    from sentry.taskworker.registry import taskregistry
+
+    task_count = sum(
+        len(namespace._registered_tasks) for namespace in taskregistry._namespaces.values()
+    )
+
+    # Connections can't be shared across forks, children open their own.
+    connections.close_all()
+    caches.close_all()
+
+    # Move everything loaded so far into the permanent generation so garbage
+    # collection in children doesn't write to (and un-share) these pages.
+    gc.freeze()
+
+    return task_count
+
+
+_start = time.monotonic()
+_task_count = warm()
+logger.info(
+    "taskworker.zygote.ready",
+    extra={"duration": time.monotonic() - _start, "task_count": _task_count},
+)
@@ -1,7 +1,7 @@
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, TypedDict, TypeVar
+from typing import Any, Generic, NamedTuple, TypedDict, TypeVar
 
 from django.conf import settings
 from django.utils import timezone
@@ -23,6 +23,20 @@ class IncrMultiOptions(TypedDict):
     count: int
 
 
+class TSDBRangeMatrix(NamedTuple, Generic[TSDBKey]):
+    """
+    A dense (keys x buckets) view of a range query: ``values[i][j]`` is the
+    count of ``keys[i]`` in the rollup bucket starting at ``timestamps[j]``.
+    """
+
+    keys: list[TSDBKey]
+    timestamps: list[int]
+    values: list[list[int]]
+
+    def to_series(self) -> dict[TSDBKey, list[tuple[int, int]]]:
+        return {key: list(zip(self.timestamps, row)) for key, row in zip(self.keys, self.values)}
+
+
 class TSDBModel(Enum):
     internal = 0
 
@@ -115,6 +129,7 @@ class BaseTSDB(Service):
     __read_methods__ = frozenset(
         [
             "get_range",
+            "get_range_matrix",
             "get_sums",
             "get_timeseries_sums",
             "get_distinct_counts_series",
@@ -437,6 +452,43 @@ class BaseTSDB(Service):
         """
         raise NotImplementedError
 
+    def get_range_matrix(
+        self,
+        model: TSDBModel,
+        keys: Sequence[TSDBKey],
+        start: datetime,
+        end: datetime,
+        rollup: int | None = None,
+        environment_id: int | None = None,
+        tenant_ids: dict[str, str | int] | None = None,
+    ) -> TSDBRangeMatrix[TSDBKey]:
+        """
+        Bulk variant of ``get_range`` for many keys at once, returning a
+        ``TSDBRangeMatrix`` instead of a nested mapping.
+
+        >>> now = timezone.now()
+        >>> get_range_matrix(TSDBModel.group, group_ids,
+        >>>                  start=now - timedelta(days=90),
+        >>>                  end=now, rollup=ONE_DAY)
+        """
+        rollup, series = self.get_optimal_rollup_series(start, end, rollup)
+        range_set = self.get_range(
+            model,
+            keys,
+            start,
+            end,
+            rollup,
+            environment_ids=[environment_id] if environment_id is not None else None,
+            tenant_ids=tenant_ids,
+        )
+
+        values = []
+        for key in keys:
+            points = dict(range_set.get(key, []))
+            values.append([int(points.get(timestamp, 0)) for timestamp in series])
+
+        return TSDBRangeMatrix(keys=list(keys), timestamps=series, values=values)
+
     def get_timeseries_sums(
         self,
         model: TSDBModel,
@@ -20,6 +20,7 @@ from sentry.tsdb.base import (
     TSDBItem,
     TSDBKey,
     TSDBModel,
+    TSDBRangeMatrix,
 )
 from sentry.utils.dates import to_datetime
 from sentry.utils.redis import check_cluster_versions, get_cluster_from_options, load_redis_script
@@ -197,6 +198,23 @@ class RedisTSDB(BaseTSDB):
 
         Returns a 2-tuple that contains the hash key and the hash field.
         """
+        vnode, hash_field = self._get_counter_vnode_and_field(key, environment_id)
+
+        return self._make_counter_hash_key(model, rollup, timestamp, vnode), hash_field
+
+    def _make_counter_hash_key(
+        self, model: TSDBModel, rollup: int, timestamp: float | datetime, vnode: int
+    ) -> str:
+        return "{prefix}{model}:{epoch}:{vnode}".format(
+            prefix=self.prefix,
+            model=model.value,
+            epoch=self.normalize_to_rollup(timestamp, rollup),
+            vnode=vnode,
+        )
+
+    def _get_counter_vnode_and_field(
+        self, key: int | str | bytes, environment_id: int | None
+    ) -> tuple[int, str | int]:
         model_key = self.get_model_key(key)
 
         if isinstance(model_key, int):
@@ -204,15 +222,7 @@ class RedisTSDB(BaseTSDB):
         else:
             vnode = _crc32(force_bytes(model_key)) % self.vnodes
 
-        return (
-            "{prefix}{model}:{epoch}:{vnode}".format(
-                prefix=self.prefix,
-                model=model.value,
-                epoch=self.normalize_to_rollup(timestamp, rollup),
-                vnode=vnode,
-            ),
-            self.add_environment_parameter(model_key, environment_id),
-        )
+        return vnode, self.add_environment_parameter(model_key, environment_id)
 
     def get_model_key(self, key: int | str | bytes) -> int | str:
         # We specialize integers so that a pure int-map can be optimized by
@@ -337,31 +347,53 @@ class RedisTSDB(BaseTSDB):
             raise NotImplementedError
         environment_id = environment_ids[0] if environment_ids else None
 
+        return self.get_range_matrix(
+            model, keys, start, end, rollup, environment_id=environment_id
+        ).to_series()
+
+    def get_range_matrix(
+        self,
+        model: TSDBModel,
+        keys: Sequence[TSDBKey],
+        start: datetime,
+        end: datetime,
+        rollup: int | None = None,
+        environment_id: int | None = None,
+        tenant_ids: dict[str, str | int] | None = None,
+    ) -> TSDBRangeMatrix[TSDBKey]:
+        """
+        Fetches every (key, bucket) counter with one ``HMGET`` per counter
+        hash. Since all keys sharing a vnode live in the same hash for a given
+        bucket, this needs at most ``len(series) * vnodes`` commands no matter
+        how many keys are requested, and ``cluster.map`` batches them into one
+        pipeline per host.
+        """
         self.validate_arguments([model], [environment_id])
 
         rollup, series = self.get_optimal_rollup_series(start, end, rollup)
-        _series = [to_datetime(item) for item in series]
 
-        results = []
+        # hash key -> [(row, column, hash field), ...]
+        hash_fields: dict[str, list[tuple[int, int, str | int]]] = defaultdict(list)
+        for row, key in enumerate(keys):
+            vnode, hash_field = self._get_counter_vnode_and_field(key, environment_id)
+            for column, timestamp in enumerate(series):
+                hash_key = self._make_counter_hash_key(model, rollup, timestamp, vnode)
+                hash_fields[hash_key].append((row, column, hash_field))
+
         cluster, _ = self.get_cluster(environment_id)
         with cluster.map() as client:
-            for key in keys:
-                for timestamp in _series:
-                    hash_key, hash_field = self.make_counter_key(
-                        model, rollup, timestamp, key, environment_id
-                    )
-                    results.append(
-                        (int(timestamp.timestamp()), key, client.hget(hash_key, hash_field))
-                    )
-
-        results_by_key: dict[TSDBKey, dict[int, int]] = defaultdict(dict)
-        for epoch, key, count in results:
-            results_by_key[key][epoch] = int(count.value or 0)
-
-        output = {}
-        for key, points in results_by_key.items():
-            output[key] = sorted(points.items())
-        return output
+            responses = {
+                hash_key: client.hmget(hash_key, [hash_field for _, _, hash_field in fields])
+                for hash_key, fields in hash_fields.items()
+            }
+
+        values = [[0] * len(series) for _ in keys]
+        for hash_key, fields in hash_fields.items():
+            for (row, column, _), count in zip(fields, responses[hash_key].value):
+                if count is not None:
+                    values[row][column] = int(count)
+
+        return TSDBRangeMatrix(keys=list(keys), timestamps=series, values=values)
 
     def merge(
         self,
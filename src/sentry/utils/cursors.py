@@ -93,6 +93,8 @@ class CursorResult(Sequence[T]):
         self.prev = prev
         self.hits = hits
         self.max_hits = max_hits
+        # Durations in milliseconds of the phases that produced this result, by name
+        self.timings: dict[str, float] = {}
 
     def __len__(self) -> int:
         return len(self.results)
@@ -8,6 +8,28 @@ def get_rss_usage():
     return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
 
 
+def get_shared_memory_usage() -> tuple[int, int] | None:
+    """
+    Return (shared, private) resident bytes for the current process, or None
+    when /proc/self/smaps_rollup isn't available (non-linux).
+
+    Shared pages are those also mapped by another process, such as pages inherited
+    from a parent over fork that neither side has written to.
+    """
+    shared = private = 0
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in ("Shared_Clean", "Shared_Dirty"):
+                    shared += int(value.split()[0]) * 1024
+                elif name in ("Private_Clean", "Private_Dirty"):
+                    private += int(value.split()[0]) * 1024
+    except (OSError, ValueError, IndexError):
+        return None
+    return shared, private
+
+
 @contextmanager
 def track_memory_usage(metric, **kwargs):
     before = get_rss_usage()
@@ -6,7 +6,7 @@ import re
 from abc import ABC, abstractmethod
 from datetime import timedelta
 from enum import Enum
-from typing import Any, ClassVar, TypedDict
+from typing import TYPE_CHECKING, Any, ClassVar, TypedDict
 from urllib.parse import parse_qs, urlparse
 
 from sentry import options
@@ -15,6 +15,9 @@ from sentry.models.project import Project
 
 from .types import PerformanceProblemsMap, Span
 
+if TYPE_CHECKING:
+    from .span_index import SpanIndex
+
 
 class DetectorType(Enum):
     SLOW_DB_QUERY = "slow_db_query"
@@ -63,6 +66,23 @@ class PerformanceDetector(ABC):
     def __init__(self, settings: dict[DetectorType, Any], event: dict[str, Any]) -> None:
         self.settings = settings[self.settings_key]
         self._event = event
+        self._span_index: SpanIndex | None = None
+
+    @property
+    def span_index(self) -> SpanIndex:
+        """
+        Precomputed span data for the event. `_detect_performance_problems` shares one
+        index between all detectors, a detector run on its own builds its own.
+        """
+        if self._span_index is None:
+            from .span_index import SpanIndex
+
+            self._span_index = SpanIndex(self._event.get("spans") or [])
+        return self._span_index
+
+    @span_index.setter
+    def span_index(self, span_index: SpanIndex) -> None:
+        self._span_index = span_index
 
     def find_span_prefix(self, settings, span_op: str):
         allowed_span_ops = settings.get("allowed_span_ops", [])
@@ -76,7 +96,7 @@ class PerformanceDetector(ABC):
         if not op or not span_id:
             return None
 
-        span_duration = get_span_duration(span)
+        span_duration = self.span_index.duration(span)
         for setting in self.settings:
             op_prefix = self.find_span_prefix(setting, op)
             if op_prefix:
@@ -17,7 +17,6 @@ from sentry.utils.performance_issues.base import (
     get_notification_attachment_body,
     get_span_evidence_value,
     get_url_from_span,
-    parameterize_url,
     parameterize_url_with_result,
 )
 from sentry.utils.performance_issues.detectors.utils import get_total_span_duration
@@ -206,7 +205,7 @@ class NPlusOneAPICallsExperimentalDetector(PerformanceDetector):
             return {"query_params": [], "path_params": []}
 
         parameterized_urls = [
-            parameterize_url_with_result(get_url_from_span(span)) for span in self.spans
+            parameterize_url_with_result(self.span_index.url(span)) for span in self.spans
         ]
         path_params = [param["path_params"] for param in parameterized_urls]
         query_dict: dict[str, list[str]] = defaultdict(list)
@@ -233,19 +232,19 @@ class NPlusOneAPICallsExperimentalDetector(PerformanceDetector):
         }
 
     def _get_parameterized_url(self, span: Span) -> str:
-        return parameterize_url(get_url_from_span(span))
+        return self.span_index.parameterized_url(span)
 
     def _get_path_prefix(self, repeating_span: Span) -> str:
         if not repeating_span:
             return ""
 
-        url = get_url_from_span(repeating_span)
+        url = self.span_index.url(repeating_span)
         parsed_url = urlparse(url)
         return parsed_url.path or ""
 
     def _fingerprint(self) -> str | None:
-        first_url = get_url_from_span(self.spans[0])
-        parameterized_first_url = parameterize_url(first_url)
+        first_url = self.span_index.url(self.spans[0])
+        parameterized_first_url = self.span_index.parameterized_url(self.spans[0])
 
         # Check if we parameterized the URL at all. If not, do not attempt
         # fingerprinting. Unparameterized URLs run too high a risk of
@@ -21,7 +21,6 @@ from sentry.utils.performance_issues.base import (
     get_notification_attachment_body,
     get_span_evidence_value,
     get_url_from_span,
-    parameterize_url,
 )
 from sentry.utils.performance_issues.detectors.utils import get_total_span_duration
 from sentry.utils.performance_issues.performance_problem import PerformanceProblem
@@ -201,7 +200,7 @@ class NPlusOneAPICallsDetector(PerformanceDetector):
         if not self.spans or len(self.spans) == 0:
             return []
 
-        urls = [get_url_from_span(span) for span in self.spans]
+        urls = [self.span_index.url(span) for span in self.spans]
 
         all_parameters: Mapping[str, list[str]] = defaultdict(list)
 
@@ -220,13 +219,13 @@ class NPlusOneAPICallsDetector(PerformanceDetector):
         if not repeating_span:
             return ""
 
-        url = get_url_from_span(repeating_span)
+        url = self.span_index.url(repeating_span)
         parsed_url = urlparse(url)
         return parsed_url.path or ""
 
     def _fingerprint(self) -> str | None:
-        first_url = get_url_from_span(self.spans[0])
-        parameterized_first_url = parameterize_url(first_url)
+        first_url = self.span_index.url(self.spans[0])
+        parameterized_first_url = self.span_index.parameterized_url(self.spans[0])
 
         # Check if we parameterized the URL at all. If not, do not attempt
         # fingerprinting. Unparameterized URLs run too high a risk of
@@ -12,7 +12,6 @@ from sentry.models.project import Project
 from ..base import (
     DetectorType,
     PerformanceDetector,
-    fingerprint_span,
     get_notification_attachment_body,
     get_span_evidence_value,
 )
@@ -48,7 +47,7 @@ class SlowDBQueryDetector(PerformanceDetector):
         op, span_id, op_prefix, span_duration, settings = settings_for_span
         duration_threshold = settings.get("duration_threshold")
 
-        fingerprint = fingerprint_span(span)
+        fingerprint = self.span_index.fingerprint(span)
 
         if not fingerprint:
             return
@@ -41,6 +41,7 @@ from .detectors.render_blocking_asset_span_detector import RenderBlockingAssetSp
 from .detectors.slow_db_query_detector import SlowDBQueryDetector
 from .detectors.uncompressed_asset_detector import UncompressedAssetSpanDetector
 from .performance_problem import PerformanceProblem
+from .span_index import SpanIndex
 
 INTEGRATIONS_OF_INTEREST = [
     "django",
@@ -370,11 +371,7 @@ def _detect_performance_problems(
         data = {**data, "spans": flatten_tree(tree, segment_id)}
 
     with sentry_sdk.start_span(op="initialize", name="PerformanceDetector"):
-        detectors: list[PerformanceDetector] = [
-            detector_class(detection_settings, data)
-            for detector_class in DETECTOR_CLASSES
-            if detector_class.is_detection_allowed_for_system()
-        ]
+        detectors = build_detectors(detection_settings, data, DETECTOR_CLASSES)
 
     for detector in detectors:
         with sentry_sdk.start_span(
@@ -421,6 +418,26 @@ def _detect_performance_problems(
     return list(unique_problems)
 
 
+def build_detectors(
+    detection_settings: dict[DetectorType, Any],
+    data: dict[str, Any],
+    detector_classes: Sequence[type[PerformanceDetector]],
+) -> list[PerformanceDetector]:
+    """
+    Instantiate the detectors allowed on this system for an event. All of them share a
+    single SpanIndex so per-span values are only computed once.
+    """
+    span_index = SpanIndex(data.get("spans") or [])
+    detectors: list[PerformanceDetector] = []
+    for detector_class in detector_classes:
+        if not detector_class.is_detection_allowed_for_system():
+            continue
+        detector = detector_class(detection_settings, data)
+        detector.span_index = span_index
+        detectors.append(detector)
+    return detectors
+
+
 def run_detector_on_data(detector: PerformanceDetector, data: dict[str, Any]) -> None:
     if not detector.is_event_eligible(data):
         return
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from datetime import timedelta
+from typing import Any, TypeVar
+
+from .base import fingerprint_span, get_span_duration, get_url_from_span, parameterize_url
+from .types import Span
+
+T = TypeVar("T")
+
+_MISSING: Any = object()
+
+
+class SpanIndex:
+    """
+    Per-event span data shared by every detector that runs over the event.
+
+    Values (durations, fingerprints, URLs) are computed the first time a detector
+    asks for them and reused by the others, spans no detector looks at cost nothing.
+
+    Spans are looked up by identity, so the index has to be built from the same
+    span list the detectors are visiting. Lookups for a span that isn't in the
+    index fall back to computing the value directly.
+    """
+
+    def __init__(self, spans: Sequence[Span]) -> None:
+        self.spans = spans
+        self._positions = {id(span): i for i, span in enumerate(spans)}
+
+        self._durations: list[Any] = [_MISSING] * len(spans)
+        self._fingerprints: list[Any] = [_MISSING] * len(spans)
+        self._urls: list[Any] = [_MISSING] * len(spans)
+        self._parameterized_urls: list[Any] = [_MISSING] * len(spans)
+
+    def position(self, span: Span) -> int | None:
+        return self._positions.get(id(span))
+
+    def _memoized(self, column: list[Any], span: Span, compute: Callable[[Span], T]) -> T:
+        position = self.position(span)
+        if position is None:
+            return compute(span)
+        value = column[position]
+        if value is _MISSING:
+            value = column[position] = compute(span)
+        return value
+
+    def duration(self, span: Span) -> timedelta:
+        """See `get_span_duration`"""
+        return self._memoized(self._durations, span, get_span_duration)
+
+    def fingerprint(self, span: Span) -> str | None:
+        """See `fingerprint_span`"""
+        return self._memoized(self._fingerprints, span, fingerprint_span)
+
+    def url(self, span: Span) -> str:
+        """See `get_url_from_span`"""
+        return self._memoized(self._urls, span, get_url_from_span)
+
+    def parameterized_url(self, span: Span) -> str:
+        """The span URL with path and query parameters replaced, see `parameterize_url`"""
+        return self._memoized(
+            self._parameterized_urls, span, lambda span: parameterize_url(self.url(span))
+        )
@@ -1063,8 +1063,21 @@ def bulk_raw_query(
     Used to make queries using the (very) old JSON format for Snuba queries. Queries submitted here
     will be converted to SnQL queries before being sent to Snuba.
     """
+    snuba_requests = prepare_bulk_raw_query(snuba_param_list, referrer=referrer)
+    return _apply_cache_and_build_results(snuba_requests, use_cache=use_cache)
+
+
+def prepare_bulk_raw_query(
+    snuba_param_list: Sequence[SnubaQueryParams],
+    referrer: str | None = None,
+) -> list[SnubaRequest]:
+    """
+    Converts queries in the old JSON format to SnQL requests without sending them. Preparing
+    the requests may hit the database, sending them with :func:`run_snuba_requests` does not,
+    so only the latter is safe to run on a worker thread.
+    """
     params = [_prepare_query_params(param, referrer) for param in snuba_param_list]
-    snuba_requests = [
+    return [
         SnubaRequest(
             request=json_to_snql(query, query["dataset"]),
             referrer=referrer,
@@ -1073,6 +1086,12 @@ def bulk_raw_query(
         )
         for query, forward, reverse in params
     ]
+
+
+def run_snuba_requests(
+    snuba_requests: Sequence[SnubaRequest], use_cache: bool | None = False
+) -> ResultSet:
+    """Sends requests created by :func:`prepare_bulk_raw_query` to Snuba."""
     return _apply_cache_and_build_results(snuba_requests, use_cache=use_cache)
 
 
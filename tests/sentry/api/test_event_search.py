@@ -15,8 +15,13 @@ from sentry.api.event_search import (
     SearchFilter,
     SearchKey,
     SearchValue,
+    SearchVisitor,
+    _IdentityKey,
+    _parse_search_query_cached,
+    _parse_simple_search_query,
     _RecursiveList,
     default_config,
+    event_search_grammar,
     flatten,
     parse_search_query,
     translate_wildcard_as_clickhouse_pattern,
@@ -31,6 +36,12 @@ fixture_path = "fixtures/search-syntax"
 abs_fixtures_path = os.path.join(MODULE_ROOT, os.pardir, os.pardir, fixture_path)
 
 
+@pytest.fixture(autouse=True)
+def clear_parse_cache():
+    # Some tests patch the field types used while parsing.
+    _parse_search_query_cached.cache_clear()
+
+
 def register_fixture_tests(cls, skipped):
     """
     Registers test fixtures onto a class with a run_test_case method
@@ -1055,3 +1066,83 @@ def test_translate_wildcard_as_clickhouse_pattern(pattern, clickhouse):
 def test_invalid_translate_wildcard_as_clickhouse_pattern(pattern):
     with pytest.raises(InvalidSearchQuery):
         assert translate_wildcard_as_clickhouse_pattern(pattern)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "",
+        "   ",
+        "foo",
+        "foo  bar baz",
+        "environment:production release:frontend@abc",
+        "!user.email:foo@example.com some free text",
+        "url:http://example.com/a?b=c transaction:/api/0/*",
+        "key:a:b key:a[b] order android",
+        "foo key:value bar",
+    ],
+)
+def test_simple_query_fast_path(query):
+    visitor = SearchVisitor(default_config)
+    assert parse_search_query(query) == visitor.visit(event_search_grammar.parse(query))
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "foo OR bar",
+        "(foo)",
+        'key:"quoted value"',
+        "has:key",
+        "is:unresolved",
+        "key:>5",
+        "key:[a, b]",
+        "key:-24h",
+        "project_id:123",
+        "error.handled:true",
+        "count():>5",
+    ],
+)
+def test_simple_query_fast_path_fallback(query):
+    visitor = SearchVisitor(default_config)
+    assert _parse_simple_search_query(query, visitor) is None
+    assert parse_search_query(query) == visitor.visit(event_search_grammar.parse(query))
+
+
+def test_parse_cache():
+    first = parse_search_query("environment:production foo")
+    first.append("AND")
+    assert parse_search_query("environment:production foo") == first[:-1]
+    assert _parse_search_query_cached.cache_info().hits == 1
+
+    # Other configs and callers with their own field types are not served from the cache.
+    config = SearchConfig.create_from(default_config, wildcard_free_text=True)
+    assert parse_search_query("environment:production foo", config=config)[1] == SearchFilter(
+        key=SearchKey(name="message"), operator="=", value=SearchValue(raw_value="*foo*")
+    )
+    parse_search_query("environment:production foo", get_field_type=lambda _: None)
+    assert _parse_search_query_cached.cache_info().hits == 1
+
+
+def test_parse_cache_relative_dates():
+    now = timezone.now()
+    with freeze_time(now):
+        assert parse_search_query("time:-1d")[0].value.raw_value == now - timedelta(days=1)
+    with freeze_time(now + timedelta(hours=1)):
+        assert parse_search_query("time:-1d")[0].value.raw_value == now - timedelta(hours=23)
+
+
+def test_parse_cache_relative_aggregate_dates():
+    now = timezone.now()
+    with freeze_time(now):
+        assert parse_search_query("last_seen():-1d")[0].value.raw_value == now - timedelta(days=1)
+    with freeze_time(now + timedelta(hours=1)):
+        assert parse_search_query("last_seen():-1d")[0].value.raw_value == now - timedelta(hours=23)
+    # the cache only remembers that the query must be parsed again
+    assert _parse_search_query_cached("last_seen():-1d", _IdentityKey(default_config)) is None
+
+    # absolute dates do not depend on the current time
+    first = parse_search_query("last_seen():>2025-01-01")
+    hits = _parse_search_query_cached.cache_info().hits
+    assert parse_search_query("last_seen():>2025-01-01") == first
+    assert _parse_search_query_cached.cache_info().hits == hits + 1
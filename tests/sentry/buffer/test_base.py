@@ -4,7 +4,7 @@ from unittest import mock
 from django.utils import timezone
 from pytest import raises
 
-from sentry.buffer.base import Buffer, BufferField
+from sentry.buffer.base import Buffer, BufferedIncr, BufferField
 from sentry.models.group import Group
 from sentry.models.organization import Organization
 from sentry.models.project import Project
@@ -73,6 +73,49 @@ class BufferTest(TestCase):
         release_project_ = ReleaseProject.objects.get(id=release_project.id)
         assert release_project_.new_groups == 1
 
+    def test_process_many_updates_counters_in_bulk(self):
+        org = Organization.objects.create(slug="test-org")
+        project = Project.objects.create(organization=org, slug="test-project")
+        releases = [
+            Release.objects.create(organization=org, version=f"release-{i}") for i in range(3)
+        ]
+        release_projects = [
+            ReleaseProject.objects.create(project=project, release=release)
+            for release in releases[:2]
+        ]
+
+        items = [
+            BufferedIncr(
+                model=ReleaseProject,
+                columns={"new_groups": i + 1},
+                filters={"project_id": project.id, "release_id": release.id},
+            )
+            for i, release in enumerate(releases)
+        ]
+        # One multi-row update, the missing row falls back to create_or_update.
+        assert self.buf.process_many(items) == 1
+
+        for i, release_project in enumerate(release_projects):
+            release_project.refresh_from_db()
+            assert release_project.new_groups == i + 1
+        assert ReleaseProject.objects.get(project=project, release=releases[2]).new_groups == 3
+
+    def test_process_many_falls_back_for_groups(self):
+        group = Group.objects.create(project=Project(id=1))
+        the_date = timezone.now() + timedelta(days=5)
+        items = [
+            BufferedIncr(
+                model=Group,
+                columns={"times_seen": 2},
+                filters={"id": group.id},
+                extra={"last_seen": the_date},
+            )
+        ]
+        assert self.buf.process_many(items) == 0
+        reload = Group.objects.get(id=group.id)
+        assert reload.times_seen == group.times_seen + 2
+        assert reload.last_seen == the_date
+
     @mock.patch("sentry.models.Group.objects.create_or_update")
     def test_signal_only(self, create_or_update):
         group = Group.objects.create(project=Project(id=1))
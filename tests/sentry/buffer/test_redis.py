@@ -22,6 +22,7 @@ from sentry.models.project import Project
 from sentry.rules.processing.buffer_processing import process_buffer
 from sentry.rules.processing.processor import PROJECT_ID_BUFFER_LIST_KEY
 from sentry.testutils.helpers.datetime import freeze_time
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.utils import json
 from sentry.utils.redis import get_cluster_routing_client
@@ -380,6 +381,67 @@ class TestRedisBuffer:
         self.buf.process("foo")
         process.assert_called_once_with(mock.Mock, {"times_seen": 1}, {"pk": 1}, {}, True)
 
+    @mock.patch("sentry.buffer.base.Buffer.process_many", return_value=1)
+    def test_process_bulk_flush(self, process_many):
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        keys = ["b:k:sentry.group:a", "b:k:sentry.group:b"]
+        for i, key in enumerate(keys):
+            client.hmset(
+                key,
+                {
+                    "f": f'{{"pk": ["i","{i}"]}}',
+                    "i+times_seen": str(i + 1),
+                    "m": "sentry.models.Group",
+                },
+            )
+            client.zadd(self.buf.pending_key, {key: 1})
+
+        with override_options({"buffer.bulk-flush.enabled": True}):
+            self.buf.process(batch_keys=[*keys, "b:k:sentry.group:missing"])
+
+        (items,) = process_many.call_args[0]
+        assert sorted(
+            ((item.model, item.columns, item.filters) for item in items),
+            key=lambda item: item[2]["pk"],
+        ) == [
+            (Group, {"times_seen": 1}, {"pk": 0}),
+            (Group, {"times_seen": 2}, {"pk": 1}),
+        ]
+        for key in keys:
+            assert not client.exists(key)
+            assert not client.exists(self.buf._make_lock_key(key))
+            assert client.zscore(self.buf.pending_key, key) is None
+
+    @mock.patch("sentry.buffer.base.Buffer.process_many", return_value=1)
+    def test_process_bulk_flush_cluster_slots(self, process_many):
+        if not self.buf.is_redis_cluster:
+            pytest.skip("hash slots only apply to RedisCluster")
+
+        client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
+        # Enough keys to be spread over many hash slots.
+        keys = [f"b:k:sentry.group:{i}" for i in range(50)]
+        slots = {self.buf.cluster.connection_pool.nodes.keyslot(key) for key in keys}
+        assert len(slots) > 1
+        for i, key in enumerate(keys):
+            client.hmset(
+                key,
+                {
+                    "f": f'{{"pk": ["i","{i}"]}}',
+                    "i+times_seen": "1",
+                    "m": "sentry.models.Group",
+                },
+            )
+            client.zadd(self.buf.pending_key, {key: 1})
+
+        with override_options({"buffer.bulk-flush.enabled": True}):
+            self.buf.process(batch_keys=keys)
+
+        (items,) = process_many.call_args[0]
+        assert len(items) == len(keys)
+        for key in keys:
+            assert not client.exists(key)
+            assert client.zscore(self.buf.pending_key, key) is None
+
     @mock.patch("sentry.buffer.redis.RedisBuffer._make_key", mock.Mock(return_value="foo"))
     def test_get_hash_length(self):
         client = get_cluster_routing_client(self.buf.cluster, self.buf.is_redis_cluster)
@@ -638,3 +700,48 @@ class TestRedisBuffer:
 )
 def test_dump_value(value):
     assert RedisBuffer._load_value(json.loads(json.dumps(RedisBuffer._dump_value(value)))) == value
+
+
+@django_db_all
+@mock.patch("sentry.buffer.base.Buffer.process_many", return_value=1)
+def test_process_bulk_flush_releases_locks_on_rb_hosts(process_many, set_sentry_option):
+    # Two hosts on the same server, so lock keys and the keys they protect
+    # can be routed to different hosts.
+    value = copy.deepcopy(options.get("redis.clusters"))
+    db = value["default"]["hosts"][0]["db"]
+    value["default"]["is_redis_cluster"] = False
+    value["default"]["hosts"] = {0: {"db": db}, 1: {"db": db + 1}}
+    set_sentry_option("redis.clusters", value)
+    buf = RedisBuffer()
+    router = buf.cluster.get_router()
+
+    keys = [f"b:k:sentry.group:{i}" for i in range(20)]
+    assert any(
+        router.get_host_for_key(key) != router.get_host_for_key(buf._make_lock_key(key))
+        for key in keys
+    )
+
+    client = get_cluster_routing_client(buf.cluster, False)
+    try:
+        for i, key in enumerate(keys):
+            client.hmset(
+                key,
+                {
+                    "f": f'{{"pk": ["i","{i}"]}}',
+                    "i+times_seen": "1",
+                    "m": "sentry.models.Group",
+                },
+            )
+            client.zadd(buf.pending_key, {key: 1})
+
+        with override_options({"buffer.bulk-flush.enabled": True}):
+            buf.process(batch_keys=keys)
+
+        (items,) = process_many.call_args[0]
+        assert len(items) == len(keys)
+        for key in keys:
+            assert not client.exists(key)
+            assert not client.exists(buf._make_lock_key(key))
+    finally:
+        for host_id in (0, 1):
+            buf.cluster.get_local_client(host_id).flushdb()
@@ -41,6 +41,38 @@ class BulkDeleteQueryTest(TestCase):
         assert not Group.objects.filter(id=group1_2.id).exists()
         assert Group.objects.filter(id=group1_3.id).exists()
 
+    def test_id_range(self):
+        now = timezone.now()
+        project = self.create_project()
+        groups = [
+            self.create_group(project, create_open_period=False, last_seen=now - timedelta(days=2))
+            for _ in range(3)
+        ]
+        recent = self.create_group(project, create_open_period=False, last_seen=now)
+        query = BulkDeleteQuery(model=Group, dtfield="last_seen", days=1)
+
+        assert query.get_id_bounds() == (groups[0].id, groups[2].id)
+
+        deleted = query.execute(id_range=(groups[0].id, groups[2].id))
+        assert deleted == 2
+        assert not Group.objects.filter(id__in=[groups[0].id, groups[1].id]).exists()
+        assert Group.objects.filter(id=groups[2].id).exists()
+        assert Group.objects.filter(id=recent.id).exists()
+
+    def test_cutoff(self):
+        now = timezone.now()
+        project = self.create_project()
+        group = self.create_group(
+            project, create_open_period=False, last_seen=now - timedelta(days=2)
+        )
+        query = BulkDeleteQuery(
+            model=Group, dtfield="last_seen", days=1, cutoff=now - timedelta(days=3)
+        )
+
+        assert query.get_id_bounds() is None
+        assert query.execute() == 0
+        assert Group.objects.filter(id=group.id).exists()
+
 
 class BulkDeleteQueryIteratorTestCase(TransactionTestCase):
     def test_iteration(self):
@@ -1,6 +1,7 @@
 import time
 import uuid
 from functools import cached_property
+from unittest import mock
 
 import pytest
 
@@ -87,6 +88,17 @@ class RedisBackendTestCase(TestCase):
         with backend.digest("timeline", 0) as records:
             assert {record.key for record in records} == {"record:1", "record:2"}
 
+    def test_map_partitions(self):
+        backend = RedisBackend(partition_concurrency=2)
+
+        def fn(host):
+            if host == 1:
+                raise Exception("Host unavailable.")
+            return host * 10
+
+        with mock.patch.object(backend.cluster, "hosts", {0: None, 1: None, 2: None}):
+            assert dict(backend._map_partitions("schedule", fn)) == {0: 0, 1: None, 2: 20}
+
     def test_maintenance_failure_recovery_with_capacity(self):
         backend = RedisBackend(capacity=10, truncation_chance=0.0)
 
@@ -1150,3 +1150,46 @@ class AssembleStacktraceComponentTest(TestCase):
 
             assert stacktrace_component2.contributes is False
             assert stacktrace_component2.hint is None
+
+
+def test_from_base64_string_is_cached():
+    enhancements_str = Enhancements.from_rules_text("function:playFetch +app").base64_string
+
+    enhancements = Enhancements.from_base64_string(enhancements_str)
+    assert Enhancements.from_base64_string(enhancements_str) is enhancements
+    assert Enhancements.from_base64_string(enhancements_str.encode("ascii")) is enhancements
+
+
+def test_create_match_frame_reuses_static_values():
+    frame = {
+        "function": "Foo.bar",
+        "module": "foo.Bar",
+        "package": "C:\\Foo\\Bar.dll",
+        "abs_path": "Foo\\Bar.java",
+        "in_app": False,
+        "data": {"category": "telemetry", "orig_in_app": 1},
+    }
+
+    match_frame = create_match_frame(frame, "java")
+    assert match_frame == {
+        "category": b"telemetry",
+        "family": b"other",
+        "function": b"Foo.bar",
+        "in_app": False,
+        "orig_in_app": 1,
+        "module": b"foo.Bar",
+        "package": b"c:/foo/bar.dll",
+        "path": b"foo/bar.java",
+    }
+
+    # Values which the enhancer updates are not cached
+    updated_frame = {**frame, "in_app": True, "data": {"category": "ui"}}
+    assert create_match_frame(updated_frame, "java") == {
+        **match_frame,
+        "category": b"ui",
+        "in_app": True,
+        "orig_in_app": None,
+    }
+
+    # Frames with unhashable values still work
+    assert create_match_frame({**frame, "module": ["foo"]}, "java")["module"] == ["foo"]
@@ -4,6 +4,7 @@ import pytest
 
 from sentry.grouping.parameterization import (
     ParameterizationRegexExperiment,
+    ParameterizationResultCache,
     Parameterizer,
     UniqueIdExperiment,
 )
@@ -306,3 +307,54 @@ def test_fail_parameterize(name, input, expected, parameterizer):
 )
 def test_too_aggressive_parameterize(name, input, expected, parameterizer):
     assert expected == parameterizer.parameterize_all(input), f"Case {name} Failed"
+
+
+def test_parameterize_with_result_cache():
+    cache = ParameterizationResultCache(maxsize=10)
+    input_str = "user 1234 logged in from 127.0.0.1 with id 7b71cae4b0b34e3f8ab4e0b3"
+
+    uncached = Parameterizer(regex_pattern_keys=("ip", "int"), experiments=(UniqueIdExperiment,))
+    expected = uncached.parameterize_all(input_str)
+
+    with mock.patch.object(
+        Parameterizer,
+        "parametrize_w_regex",
+        side_effect=Parameterizer.parametrize_w_regex,
+        autospec=True,
+    ) as parametrize_w_regex:
+        for _ in range(3):
+            parameterizer = Parameterizer(
+                regex_pattern_keys=("ip", "int"),
+                experiments=(UniqueIdExperiment,),
+                result_cache=cache,
+            )
+            assert parameterizer.parameterize_all(input_str) == expected
+            assert parameterizer.matches_counter == uncached.matches_counter
+            assert (
+                parameterizer.get_successful_experiments() == uncached.get_successful_experiments()
+            )
+
+    assert parametrize_w_regex.call_count == 1
+
+    # Whether or not an experiment runs is part of the cache key
+    parameterizer = Parameterizer(
+        regex_pattern_keys=("ip", "int"),
+        experiments=(UniqueIdExperiment,),
+        result_cache=cache,
+    )
+    assert parameterizer.parameterize_all(input_str, lambda _: False) == (
+        "user <int> logged in from <ip> with id 7b71cae4b0b34e3f8ab4e0b3"
+    )
+    assert parameterizer.get_successful_experiments() == []
+
+
+def test_parameterize_with_result_cache_skips_long_content():
+    cache = ParameterizationResultCache(maxsize=10, max_content_length=20)
+    parameterizer = Parameterizer(regex_pattern_keys=("int",), result_cache=cache)
+
+    assert parameterizer.parameterize_all("user 1234 logged in") == "user <int> logged in"
+    assert parameterizer.parameterize_all("user 1234 logged in again") == (
+        "user <int> logged in again"
+    )
+    assert parameterizer.matches_counter["int"] == 2
+    assert len(cache._cache) == 1
@@ -10,6 +10,7 @@ from sentry.issues.ownership.grammar import (
     convert_codeowners_syntax,
     convert_schema_to_rules_text,
     dump_schema,
+    get_rule_index,
     load_schema,
     parse_code_owners,
     parse_rules,
@@ -1130,3 +1131,136 @@ def test_convert_schema_to_rules_text() -> None:
         )
         == "path:*.js #frontend m@robenolt.com\nurl:http://google.com/* #backend\npath:src/sentry/* david@sentry.io\ntags.foo:bar tagperson@sentry.io\ntags.foo:bar baz tagperson@sentry.io\nmodule:foo.bar #workflow\nmodule:foo bar meow@sentry.io\n"
     )
+
+
+RULE_INDEX_PATTERNS = [
+    ("path", "*.js"),
+    ("path", "src/*"),
+    ("path", "src/sentry/*"),
+    ("path", "SRC/Sentry/*.PY"),
+    ("path", "*/tests/test_*.py"),
+    ("path", "src\\sentry\\*"),
+    ("path", "/usr/local/src/foo/*"),
+    ("path", "foo/**/test.py"),
+    ("codeowners", "/"),
+    ("codeowners", "*"),
+    ("codeowners", "foo/"),
+    ("codeowners", "/usr/local/src/foo/"),
+    ("codeowners", "/usr/local/src/foo/**"),
+    ("codeowners", "foo/*/test.py"),
+    ("codeowners", "foo/**/test.py"),
+    ("codeowners", "test.?y"),
+    ("codeowners", "test.*"),
+    ("codeowners", "\\filename"),
+    ("codeowners", "docs/getting-started.md"),
+    ("codeowners", "[Ff]oo/bar"),
+    ("url", "*example.com*"),
+    ("module", "foo.bar"),
+    ("tags.foo", "bar"),
+]
+
+RULE_INDEX_PATHS = [
+    "foo/test.py",
+    "foo/bar/test.py",
+    "foo/bar/baz/test.py",
+    "bar/foo/test.jy",
+    "foo/\\",
+    "foo/subdir/\\/backslash_dir",
+    "/usr/local/src/foo/test.py",
+    "/usr/local/src/foo/subdir/baz.py",
+    "src/sentry/models.py",
+    "Src/Sentry/Models.py",
+    "src\\sentry\\models.py",
+    "app/tests/test_views.py",
+    "./docs/getting-started.md",
+    "static/app/index.js",
+    "Foo/bar",
+    "test.",
+]
+
+
+@pytest.mark.parametrize("path", RULE_INDEX_PATHS)
+def test_rule_index_candidates(path: str) -> None:
+    schema = dump_schema(
+        [
+            Rule(Matcher(type, pattern), [Owner("team", "team")])
+            for type, pattern in RULE_INDEX_PATTERNS
+        ]
+    )
+    rules = load_schema(schema)
+    data = {
+        "stacktrace": {"frames": [{"filename": path}, {"abs_path": f"/srv/{path}"}]},
+        "request": {"url": "https://example.com/"},
+        "tags": [["foo", "bar"]],
+    }
+    munged_data = Matcher.munge_if_needed(data)
+
+    candidates = get_rule_index(schema).candidates(munged_data)
+    matching = [i for i, rule in enumerate(rules) if rule.test(data, munged_data)]
+
+    assert candidates == sorted(set(candidates))
+    # The index may only rule out rules that cannot match
+    assert set(matching) <= set(candidates)
+    # ...and does rule out unrelated ones
+    assert len(candidates) < len(rules)
+
+
+def test_rule_index_is_cached() -> None:
+    schema = dump_schema(parse_rules(fixture_data))
+    assert get_rule_index(schema) is get_rule_index({**schema})
+
+    with pytest.raises(RuntimeError):
+        get_rule_index({**schema, "$version": 2})
+
+
+@pytest.mark.parametrize(
+    "frames",
+    [
+        [{"filename": "src/sentry/models.py"}],
+        [{"filename": "static/app/components/button.tsx"}, {"abs_path": "/srv/docs/index.md"}],
+        [{"filename": "src/components/Button.js", "in_app": True}],
+        [{"filename": "src/components/Button.js", "in_app": False}],
+        [{"filename": "app/tests/test_views.py"}, {"filename": "frontend/index.ts"}],
+        [{"abs_path": "/usr/local/lib/python/site.py"}],
+        [],
+    ],
+)
+def test_rule_index_matches_full_scan(frames: list[dict[str, Any]]) -> None:
+    schema = dump_schema(
+        [
+            Rule(Matcher(type, pattern), [Owner("team", f"team-{i}")])
+            for i, (type, pattern) in enumerate(
+                [
+                    ("path", "src/sentry/*"),
+                    ("path", "*.js"),
+                    ("path", "**/components/*"),
+                    ("path", "*"),
+                    ("codeowners", "/src/components/"),
+                    ("codeowners", "docs/*.md"),
+                    ("codeowners", "**/tests/"),
+                    ("codeowners", "frontend/*.ts"),
+                    ("codeowners", "*.py"),
+                    ("url", "https://example.com/*"),
+                    ("tags.foo", "bar"),
+                    ("module", "foo.bar"),
+                ]
+            )
+        ]
+    )
+    data = {
+        "platform": "python",
+        "stacktrace": {"frames": frames},
+        "request": {"url": "https://example.com/"},
+        "tags": [["foo", "bar"]],
+    }
+    munged_data = Matcher.munge_if_needed(data)
+    rules = load_schema(schema)
+
+    indexed = [
+        owner
+        for i in get_rule_index(schema).candidates(munged_data)
+        if rules[i].test(data, munged_data)
+        for owner in rules[i].owners
+    ]
+    full_scan = [owner for rule in rules if rule.test(data, munged_data) for owner in rule.owners]
+    assert indexed == full_scan
@@ -22,6 +22,7 @@ from sentry.issues.occurrence_consumer import (
     InvalidEventPayloadError,
     _get_kwargs,
     _process_message,
+    check_rate_limits,
     process_occurrence_group,
 )
 from sentry.issues.producer import _prepare_status_change_message
@@ -299,6 +300,19 @@ class IssueOccurrenceProcessMessageTest(IssueOccurrenceTestBase):
         occurrence = result[0]
         assert occurrence is not None
 
+    @mock.patch(
+        "sentry.issues.occurrence_consumer.rate_limiter.check_and_use_quotas",
+        return_value=[MockGranted(granted=2), MockGranted(granted=1)],
+    )
+    def test_check_rate_limits(self, check_and_use_quotas: mock.MagicMock) -> None:
+        keys = [(self.project.id, "a"), (self.project.id, "b"), (self.project.id, "a")] * 2
+        with self.options({"issues.occurrence-consumer.rate-limit.enabled": True}):
+            assert check_rate_limits(keys) == [False, False, False, True, True, True]
+
+        # one request per project and fingerprint
+        (requests,), _ = check_and_use_quotas.call_args
+        assert [request.requested for request in requests] == [4, 2]
+
     def test_occurrence_rate_limit_quota(self) -> None:
         rate_limit_quota = Quota(**options.get("issues.occurrence-consumer.rate-limit.quota"))
         assert rate_limit_quota.window_seconds == 3600
@@ -614,6 +628,40 @@ class ParseEventPayloadTest(IssueOccurrenceTestBase):
             mock_cache_set.assert_has_calls(expected_calls, any_order=True)
             assert mock_process_message.call_count == 2
 
+    def test_group_prefetches_events(self) -> None:
+        event = self.store_event(data={}, project_id=self.project.id)
+        messages = [
+            get_test_message(self.project.id, include_event=False, event_id=event.event_id)
+            for _ in range(2)
+        ]
+        with (
+            self.feature("organizations:profile-file-io-main-thread-ingest"),
+            mock.patch(
+                "sentry.issues.occurrence_consumer.lookup_event", side_effect=AssertionError
+            ),
+        ):
+            process_occurrence_group(messages)
+
+        for message in messages:
+            occurrence = IssueOccurrence.fetch(uuid.UUID(message["id"]).hex, self.project.id)
+            assert occurrence is not None
+            assert occurrence.event_id == event.event_id
+
+    def test_group_skips_rate_limit_for_dropped_occurrences(self) -> None:
+        # the group type of the test message is not released, so without the
+        # feature the occurrence is dropped, as is one of a missing project
+        messages = [get_test_message(self.project.id), get_test_message(self.project.id + 1000)]
+        with (
+            self.options({"issues.occurrence-consumer.rate-limit.enabled": True}),
+            mock.patch(
+                "sentry.issues.occurrence_consumer.check_rate_limits", wraps=check_rate_limits
+            ) as mock_check_rate_limits,
+            mock.patch("sentry.issues.occurrence_consumer._process_message"),
+        ):
+            process_occurrence_group(messages)
+
+        mock_check_rate_limits.assert_called_once_with([])
+
     def test_status_change(self) -> None:
         event = self.store_event(
             data={
@@ -88,3 +88,22 @@ def test_dispatch_mark_unknown(mock_mark_checkin_unknown):
 
     assert mock_mark_checkin_unknown.call_count == 1
     assert mock_mark_checkin_unknown.mock_calls[0] == mock.call(1, ts)
+
+
+@mock.patch("sentry.monitors.consumers.clock_tasks_consumer.metrics")
+@mock.patch("sentry.monitors.consumers.clock_tasks_consumer.mark_environment_missing")
+def test_tick_to_mark_latency(mock_mark_environment_missing, mock_metrics):
+    ts = timezone.now().replace(second=0, microsecond=0)
+
+    consumer = create_consumer()
+    send_task(
+        consumer,
+        ts,
+        {"type": "mark_missing", "ts": ts.timestamp(), "monitor_environment_id": 1},
+    )
+
+    assert mock_metrics.timing.call_count == 1
+    call = mock_metrics.timing.mock_calls[0]
+    assert call.args[0] == "monitors.clock_tasks.tick_to_mark"
+    assert call.args[1] >= 0
+    assert call.kwargs["tags"] == {"type": "mark_missing"}
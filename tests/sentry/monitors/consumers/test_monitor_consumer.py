@@ -19,7 +19,11 @@ from sentry.constants import ObjectStatus
 from sentry.db.models import BoundedPositiveIntegerField
 from sentry.models.environment import Environment
 from sentry.monitors.constants import TIMEOUT, PermitCheckInStatus
-from sentry.monitors.consumers.monitor_consumer import StoreMonitorCheckInStrategyFactory
+from sentry.monitors.consumers.monitor_consumer import (
+    StoreMonitorCheckInStrategyFactory,
+    prefetch_checkin_groups,
+    process_checkin_group,
+)
 from sentry.monitors.models import (
     CheckInStatus,
     Monitor,
@@ -32,6 +36,7 @@ from sentry.monitors.processing_errors.errors import ProcessingErrorsException,
 from sentry.monitors.types import CheckinItem
 from sentry.testutils.asserts import assert_org_audit_log_exists
 from sentry.testutils.cases import TestCase
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.outbox import outbox_runner
 from sentry.utils import json
 from sentry.utils.outcomes import Outcome
@@ -249,6 +254,118 @@ class MonitorConsumerTest(TestCase):
         # The last group is monitor_2 but with a diff environment
         assert group_3[0].payload.get("environment") == "test"
 
+    @override_options({"crons.consumer.prefetch-checkin-groups": True})
+    def test_parallel_prefetch(self) -> None:
+        factory = StoreMonitorCheckInStrategyFactory(
+            mode="batched-parallel",
+            max_batch_size=4,
+            max_workers=1,
+        )
+        commit = mock.Mock()
+        consumer = factory.create_with_partitions(commit, {self.partition: 0})
+
+        monitor_1 = self._create_monitor(slug="my-monitor-1")
+        monitor_2 = self._create_monitor(slug="my-monitor-2")
+        monitor_env_1 = MonitorEnvironment.objects.ensure_environment(
+            self.project, monitor_1, "production"
+        )
+
+        with mock.patch(
+            "sentry.monitors.models.MonitorEnvironmentManager.ensure_environment",
+            wraps=MonitorEnvironment.objects.ensure_environment,
+        ) as ensure_environment:
+            self.send_checkin(monitor_1.slug, consumer=consumer)
+            guid_1 = self.guid
+            self.send_checkin(monitor_1.slug, consumer=consumer)
+            guid_2 = self.guid
+            self.send_checkin(monitor_2.slug, consumer=consumer)
+            guid_3 = self.guid
+            self.send_checkin(monitor_2.slug, environment="test", consumer=consumer)
+            guid_4 = self.guid
+
+            # Send one more check-in to cause the batch to be processed
+            self.send_checkin(monitor_1.slug, consumer=consumer)
+
+        # Only the first check-in of monitor_1 found its monitor environment
+        # through the prefetched environment, everything else had to look up
+        # or create theirs.
+        assert ensure_environment.call_count == 3
+
+        checkin_1 = MonitorCheckIn.objects.get(guid=guid_1)
+        checkin_2 = MonitorCheckIn.objects.get(guid=guid_2)
+        assert checkin_1.monitor_environment_id == monitor_env_1.id
+        assert checkin_2.monitor_environment_id == monitor_env_1.id
+        assert checkin_1.status == CheckInStatus.OK
+
+        checkin_3 = MonitorCheckIn.objects.get(guid=guid_3)
+        checkin_4 = MonitorCheckIn.objects.get(guid=guid_4)
+        assert checkin_3.monitor_id == monitor_2.id
+        assert checkin_3.monitor_environment.get_environment().name == "production"
+        assert checkin_4.monitor_environment.get_environment().name == "test"
+
+        monitor_env_1.refresh_from_db()
+        assert monitor_env_1.status == MonitorStatus.OK
+        assert monitor_env_1.last_checkin == checkin_2.date_added
+
+    def test_prefetch_checkin_groups(self) -> None:
+        monitor = self._create_monitor(slug="my-monitor")
+        monitor_env = MonitorEnvironment.objects.ensure_environment(
+            self.project, monitor, "production"
+        )
+
+        def make_item(slug: str, environment: str | None = None) -> CheckinItem:
+            payload: Any = {"monitor_slug": slug, "status": "ok", "check_in_id": uuid.uuid4().hex}
+            if environment:
+                payload["environment"] = environment
+            return CheckinItem(
+                ts=datetime.now(),
+                partition=0,
+                message={
+                    "message_type": "check_in",
+                    "start_time": datetime.now().timestamp(),
+                    "project_id": self.project.id,
+                    "payload": json.dumps(payload).encode(),
+                    "sdk": "test/1.0",
+                    "retention_days": 90,
+                },
+                payload=payload,
+            )
+
+        items = [
+            make_item("my-monitor"),
+            make_item("my-monitor", "staging"),
+            make_item("unknown-monitor"),
+        ]
+        prefetched = prefetch_checkin_groups({item.processing_key: [item] for item in items})
+
+        production = prefetched[items[0].processing_key]
+        assert production.project.id == self.project.id
+        assert production.monitor is not None
+        assert production.monitor.id == monitor.id
+        assert production.environment is not None
+        assert production.environment.id == monitor_env.environment_id
+
+        # Each group gets its own instance of a shared monitor
+        staging = prefetched[items[1].processing_key]
+        assert staging.monitor is not None
+        assert staging.monitor.id == monitor.id
+        assert staging.monitor is not production.monitor
+        assert staging.environment is None
+
+        unknown = prefetched[items[2].processing_key]
+        assert unknown.monitor is None
+        assert unknown.environment is not None
+        assert unknown.environment.id == production.environment.id
+
+        # The monitor environment is read when the check-in is processed, so
+        # changes made while the group was queued are seen.
+        next_checkin = datetime.now(UTC).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        MonitorEnvironment.objects.filter(id=monitor_env.id).update(next_checkin=next_checkin)
+        process_checkin_group([items[0]], production)
+
+        checkin = MonitorCheckIn.objects.get(monitor_environment=monitor_env)
+        assert checkin.expected_time == next_checkin
+
     def test_passing(self) -> None:
         monitor = self._create_monitor(slug="my-monitor")
         self.send_checkin(monitor.slug)
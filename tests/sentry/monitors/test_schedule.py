@@ -1,7 +1,15 @@
 from datetime import datetime, timezone
+from unittest import mock
 from zoneinfo import ZoneInfo
 
-from sentry.monitors.schedule import get_next_schedule, get_prev_schedule
+from cronsim import CronSim
+
+from sentry.monitors.schedule import (
+    _get_crontab_schedule,
+    _get_next_interval_schedule,
+    get_next_schedule,
+    get_prev_schedule,
+)
 from sentry.monitors.types import CrontabSchedule, IntervalSchedule
 
 
@@ -74,3 +82,43 @@ def test_get_prev_schedule():
 
     # 2 hour interval: (start = 1:30) 5:35 -> 5:30
     assert get_prev_schedule(start_ts, t(5, 35), IntervalSchedule(2, "hour")) == t(5, 30)
+
+
+def test_schedule_cache():
+    _get_crontab_schedule.cache_clear()
+    schedule = CrontabSchedule("0 12 * * *")
+    reference_ts = t(5, 30)
+
+    with mock.patch("sentry.monitors.schedule.CronSim", wraps=CronSim) as mock_cronsim:
+        assert get_next_schedule(reference_ts, schedule) == t(12, 0)
+        assert get_next_schedule(reference_ts, CrontabSchedule("0 12 * * *")) == t(12, 0)
+        assert mock_cronsim.call_count == 1
+
+        # The same instant in a different timezone is computed separately
+        new_york = ZoneInfo("America/New_York")
+        assert get_next_schedule(reference_ts.astimezone(new_york), schedule) == datetime(
+            2019, 1, 1, 12, 0, 0, tzinfo=new_york
+        )
+        assert mock_cronsim.call_count == 2
+
+        # So are the previous schedules
+        assert get_prev_schedule(reference_ts, reference_ts, schedule) == datetime(
+            2018, 12, 31, 12, 0, 0, tzinfo=timezone.utc
+        )
+        assert mock_cronsim.call_count == 3
+
+
+def test_schedule_cache_truncates_reference():
+    _get_crontab_schedule.cache_clear()
+    _get_next_interval_schedule.cache_clear()
+    crontab = CrontabSchedule("0 12 * * *")
+    interval = IntervalSchedule(interval=2, unit="hour")
+
+    # References within the same minute share a cache entry
+    for second in (0, 15, 59):
+        reference_ts = t(5, 30).replace(second=second, microsecond=second * 1000)
+        assert get_next_schedule(reference_ts, crontab) == t(12, 0)
+        assert get_next_schedule(reference_ts, interval) == t(7, 30)
+
+    assert _get_crontab_schedule.cache_info().misses == 1
+    assert _get_next_interval_schedule.cache_info().misses == 1
@@ -0,0 +1,76 @@
+from unittest import mock
+
+import pytest
+
+from sentry.nodestore.base import NodeBytesCache, NodeStorage
+
+
+def test_node_bytes_cache_evicts_by_size():
+    cache = NodeBytesCache(max_bytes=10)
+    cache.set("a", b"aaaa")
+    cache.set("b", b"bbbb")
+    assert cache.size == 8
+
+    # touching "a" makes "b" the least recently used entry
+    assert cache.get("a") == b"aaaa"
+    cache.set("c", b"cccc")
+
+    assert cache.get("b") is None
+    assert cache.get_many(["a", "b", "c"]) == {"a": b"aaaa", "c": b"cccc"}
+    assert cache.size == 8
+
+
+def test_node_bytes_cache_replaces_and_skips_oversized():
+    cache = NodeBytesCache(max_bytes=10)
+    cache.set_many({"a": b"aaaa", "b": None})
+    cache.set("a", b"aa")
+    assert cache.size == 2
+
+    cache.set("big", b"x" * 11)
+    assert cache.get("big") is None
+    assert cache.get("a") == b"aa"
+
+    cache.delete_many(["a", "missing"])
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+@mock.patch("sentry.nodestore.base.time.monotonic")
+def test_node_bytes_cache_expires_entries(monotonic):
+    cache = NodeBytesCache(max_bytes=10, ttl=5)
+    monotonic.return_value = 100
+    cache.set("a", b"aaaa")
+    monotonic.return_value = 103
+    cache.set("b", b"bbbb")
+
+    monotonic.return_value = 105
+    assert cache.get_many(["a", "b"]) == {"a": b"aaaa", "b": b"bbbb"}
+
+    # reading an entry does not extend its lifetime
+    monotonic.return_value = 106
+    assert cache.get("a") is None
+    assert cache.get("b") == b"bbbb"
+    assert cache.size == 4
+
+
+@pytest.mark.parametrize(
+    ("subkey", "expected"),
+    [
+        (None, {"foo": "a"}),
+        ("unprocessed", {"foo": "b"}),
+        ("other", {"foo": "c"}),
+        ("missing", None),
+    ],
+)
+def test_decode(subkey, expected):
+    ns = NodeStorage()
+    value = ns._encode({None: {"foo": "a"}, "unprocessed": {"foo": "b"}, "other": {"foo": "c"}})
+
+    assert ns._decode(value, subkey=subkey) == expected
+
+
+def test_decode_empty():
+    ns = NodeStorage()
+    assert ns._decode(None, subkey=None) is None
+    assert ns._decode(b"", subkey=None) is None
+    assert ns._decode(b'{"foo":"a"}', subkey="other") is None
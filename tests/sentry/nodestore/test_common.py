@@ -4,9 +4,11 @@ Testsuite of backend-independent nodestore tests. Add your backend to the
 """
 
 from contextlib import nullcontext
+from unittest import mock
 
 import pytest
 
+from sentry.nodestore.base import json_loads
 from sentry.nodestore.django.backend import DjangoNodeStorage
 from sentry.testutils.helpers import override_options
 from tests.sentry.nodestore.bigtable.test_backend import (
@@ -112,3 +114,70 @@ def test_set_subkeys(ns):
     ns.delete("node_1")
     assert ns.get("node_1") is None
     assert ns.get("node_1", subkey="other") is None
+
+
+@override_options(
+    {
+        "nodestore.set-subkeys.enable-set-cache-item": False,
+        "nodestore.local-cache.max-bytes": 1024 * 1024,
+    }
+)
+def test_local_cache(ns):
+    ns.local_cache.clear()
+    try:
+        ns.set_subkeys("node_1", {None: {"foo": "a"}, "other": {"foo": "b"}})
+        ns.set("node_2", {"foo": "c"})
+
+        with (
+            mock.patch.object(ns, "_get_bytes", side_effect=AssertionError) as get_bytes,
+            mock.patch.object(ns, "_get_bytes_multi", side_effect=AssertionError),
+        ):
+            assert ns.get("node_1") == {"foo": "a"}
+            assert ns.get("node_1", subkey="other") == {"foo": "b"}
+            assert ns.get_multi(["node_1", "node_2"]) == {
+                "node_1": {"foo": "a"},
+                "node_2": {"foo": "c"},
+            }
+            assert ns.get_multi(["node_1", "node_2"], subkey="other") == {
+                "node_1": {"foo": "b"},
+                "node_2": None,
+            }
+            assert get_bytes.call_count == 0
+
+        # only the missing id is read from the backend
+        ns.local_cache.delete_many(["node_2"])
+        with mock.patch.object(
+            ns, "_get_bytes_multi", wraps=ns._get_bytes_multi
+        ) as get_bytes_multi:
+            assert ns.get_multi(["node_1", "node_2"]) == {
+                "node_1": {"foo": "a"},
+                "node_2": {"foo": "c"},
+            }
+            get_bytes_multi.assert_called_once_with(["node_2"])
+        assert ns.local_cache.get("node_2") is not None
+
+        # raw reads go through the same tier
+        ns.local_cache.delete_many(["node_2"])
+        assert ns.get_bytes("node_2") == ns.local_cache.get("node_2")
+        with mock.patch.object(ns, "_get_bytes", side_effect=AssertionError):
+            assert ns.get_bytes("node_2") is not None
+
+        ns.delete("node_1")
+        assert ns.local_cache.get("node_1") is None
+        assert ns.get("node_1") is None
+    finally:
+        ns.local_cache.clear()
+
+
+@override_options({"nodestore.set-subkeys.enable-set-cache-item": False})
+def test_get_multi_subkey(ns):
+    ns.set_subkeys("node_1", {None: {"foo": "a"}, "other": {"foo": "b"}})
+    ns.set("node_2", {"foo": "c"})
+
+    with mock.patch("sentry.nodestore.base.json_loads", wraps=json_loads) as loads:
+        assert ns.get_multi(["node_1", "node_2"], subkey="other") == {
+            "node_1": {"foo": "b"},
+            "node_2": None,
+        }
+        # only the subkey line is decoded, never the main payload
+        loads.assert_called_once_with(b'{"foo":"b"}')
@@ -5,6 +5,7 @@ import pytest
 from sentry.ratelimits.cardinality import (
     GrantedQuota,
     Quota,
+    RedisBloomCardinalityLimiter,
     RedisCardinalityLimiter,
     RequestedQuota,
 )
@@ -227,3 +228,64 @@ def test_regression_mixed_order(limiter: RedisCardinalityLimiter):
     # there used to be a bug where anything after 10 (i.e. 5) was dropped as
     # well (due to a wrong `break` somewhere in a loop)
     assert helper.add_values([0, 1, 2, 3, 4, 6, 7, 8, 9, 10, 5]) == [0, 1, 2, 3, 4, 6, 7, 8, 9, 5]
+
+
+def test_bloom_basic():
+    limiter = RedisBloomCardinalityLimiter()
+    quota = Quota(window_seconds=3600, granularity_seconds=60, limit=1000)
+    timestamp = 3600
+
+    def add_values(prefix: str, values: Sequence[int]) -> Collection[int]:
+        request = RequestedQuota(prefix=prefix, unit_hashes=values, quota=quota)
+        new_timestamp, grants = limiter.check_within_quotas([request], timestamp=timestamp)
+        limiter.use_quotas(grants, new_timestamp)
+        (grant,) = grants
+        return grant.granted_unit_hashes
+
+    granted: list[int] = []
+    for i in range(0, 3000, 100):
+        granted.extend(add_values("bloom", list(range(i, i + 100))))
+
+    # 1% false positives on ~2000 rejected hashes, plus estimation error
+    assert 950 <= len(granted) <= 1060
+
+    # hashes that were admitted are never rejected afterwards
+    for i in range(0, len(granted), 100):
+        assert list(add_values("bloom", granted[i : i + 100])) == granted[i : i + 100]
+
+    # prefixes don't share state
+    assert len(add_values("bloom-other", list(range(100)))) == 100
+
+    # an hour later, the window has moved past all admitted hashes
+    timestamp += 3600
+    assert len(add_values("bloom", list(range(5000, 5100)))) == 100
+
+
+def test_bloom_limit_change():
+    limiter = RedisBloomCardinalityLimiter()
+    timestamp = 3600
+
+    def add_values(limit: int, values: Sequence[int]) -> Collection[int]:
+        quota = Quota(window_seconds=3600, granularity_seconds=60, limit=limit)
+        request = RequestedQuota(prefix="bloom-resize", unit_hashes=values, quota=quota)
+        new_timestamp, grants = limiter.check_within_quotas([request], timestamp=timestamp)
+        limiter.use_quotas(grants, new_timestamp)
+        (grant,) = grants
+        return grant.granted_unit_hashes
+
+    assert len(add_values(100, list(range(100)))) == 100
+    assert len(add_values(100, list(range(100, 200)))) < 10
+
+    # a filter sized for a different limit does not read the bits set with
+    # the old number of bits and hash functions
+    assert len(add_values(200, list(range(100, 200)))) == 100
+
+
+def test_bloom_filter_size():
+    limiter = RedisBloomCardinalityLimiter(error_rate=0.01)
+    num_bits, num_hashes = limiter._get_filter_size(
+        Quota(window_seconds=3600, granularity_seconds=600, limit=10000)
+    )
+    # ~12KB per bucket, vs. a key per hash plus sets of all hashes
+    assert num_bits == 95851
+    assert num_hashes == 7
@@ -1,7 +1,10 @@
+from unittest import mock
+
 import pytest
 
 from sentry.ratelimits.sliding_windows import (
     GrantedQuota,
+    LocalSyncSlidingWindowRateLimiter,
     Quota,
     RedisSlidingWindowRateLimiter,
     RequestedQuota,
@@ -71,3 +74,95 @@ def test_basic(limiter):
         )
 
         assert resp == [GrantedQuota(prefix="foo", granted=0, reached_quotas=quotas)]
+
+
+def test_local_sync_without_error_budget():
+    # Without an error budget every check is synced, which makes a single
+    # process exact.
+    limiter = LocalSyncSlidingWindowRateLimiter(error_budget=0)
+    quotas = [Quota(window_seconds=10, granularity_seconds=1, limit=10)]
+
+    for timestamp in range(10):
+        resp = limiter.check_and_use_quotas(
+            [RequestedQuota(prefix="local-exact", requested=1, quotas=quotas)],
+            timestamp=TIMESTAMP_OFFSET + timestamp,
+        )
+        assert resp == [GrantedQuota(prefix="local-exact", granted=1, reached_quotas=[])]
+
+    resp = limiter.check_and_use_quotas(
+        [RequestedQuota(prefix="local-exact", requested=1, quotas=quotas)],
+        timestamp=TIMESTAMP_OFFSET + 9,
+    )
+    assert resp == [GrantedQuota(prefix="local-exact", granted=0, reached_quotas=quotas)]
+
+
+def test_local_sync_alternating_prefixes():
+    limiter = LocalSyncSlidingWindowRateLimiter(sync_interval_ms=3600 * 1000, sync_units=1000)
+    quotas = [Quota(window_seconds=10, granularity_seconds=1, limit=1000)]
+
+    with mock.patch.object(
+        LocalSyncSlidingWindowRateLimiter,
+        "_sync",
+        autospec=True,
+        side_effect=LocalSyncSlidingWindowRateLimiter._sync,
+    ) as sync:
+        for _ in range(20):
+            for prefix in ("local-org-1", "local-org-2"):
+                (grant,) = limiter.check_and_use_quotas(
+                    [RequestedQuota(prefix=prefix, requested=1, quotas=quotas)],
+                    timestamp=TIMESTAMP_OFFSET,
+                )
+                assert grant.granted == 1
+
+    # only the first check of each prefix needs to fetch its counters
+    assert sync.call_count == 2
+
+    # counters are dropped once their granules left the window
+    request = RequestedQuota(prefix="local-org-1", requested=1, quotas=quotas)
+    limiter.check_and_use_quotas([request], timestamp=TIMESTAMP_OFFSET + 100)
+    assert set(limiter._remote) == set(
+        limiter._get_keys(request, quotas[0], TIMESTAMP_OFFSET + 100)
+    )
+
+
+def test_local_sync_accuracy():
+    num_limiters = 4
+    error_budget = 0.1
+    quotas = [Quota(window_seconds=10, granularity_seconds=1, limit=100)]
+    requests = [RequestedQuota(prefix="local-accuracy", requested=1, quotas=quotas)]
+
+    limiters = [
+        LocalSyncSlidingWindowRateLimiter(
+            sync_interval_ms=3600 * 1000, sync_units=1000, error_budget=error_budget
+        )
+        for _ in range(num_limiters)
+    ]
+
+    checks = granted = 0
+    with mock.patch.object(
+        LocalSyncSlidingWindowRateLimiter,
+        "_sync",
+        autospec=True,
+        side_effect=LocalSyncSlidingWindowRateLimiter._sync,
+    ) as sync:
+        while True:
+            round_granted = 0
+            for limiter in limiters:
+                checks += 1
+                (grant,) = limiter.check_and_use_quotas(requests, timestamp=TIMESTAMP_OFFSET)
+                round_granted += grant.granted
+            granted += round_granted
+            if not round_granted:
+                break
+
+    # Each process can overshoot by its unsynced error budget at most.
+    assert 100 <= granted <= 100 * (1 + error_budget * num_limiters)
+    assert sync.call_count * 5 < checks
+
+    # No usage is lost once buffered usage is flushed.
+    for limiter in limiters:
+        limiter.flush()
+    _, grants = RedisSlidingWindowRateLimiter().check_within_quotas(
+        requests, timestamp=TIMESTAMP_OFFSET
+    )
+    assert grants[0].granted == 0
@@ -20,7 +20,12 @@ from sentry.dynamic_sampling.rules.base import NEW_MODEL_THRESHOLD_IN_MINUTES
 from sentry.models.projectkey import ProjectKey
 from sentry.models.projectteam import ProjectTeam
 from sentry.models.transaction_threshold import TransactionMetric
-from sentry.relay.config import ProjectConfig, TransactionNameRule, get_project_config
+from sentry.relay.config import (
+    ProjectConfig,
+    TransactionNameRule,
+    get_organization_config_inputs,
+    get_project_config,
+)
 from sentry.snuba.dataset import Dataset
 from sentry.testutils.factories import Factories
 from sentry.testutils.helpers import Feature
@@ -223,6 +228,32 @@ def test_project_config_exposed_features(default_project):
     assert cfg_features == ["organizations:profiling"]
 
 
+@django_db_all
+@region_silo_test
+@mock.patch("sentry.relay.config.EXPOSABLE_FEATURES", ["organizations:profiling"])
+def test_project_config_with_organization_inputs(default_project):
+    default_project.organization.update_option(
+        "sentry:trusted-relays", [{"public_key": "abc", "name": "relay"}]
+    )
+
+    with Feature({"organizations:profiling": True}):
+        organization_inputs = get_organization_config_inputs(default_project.organization)
+        expected = get_project_config(default_project).to_dict()
+        with mock.patch("sentry.quotas.backend.get_event_retention") as get_event_retention:
+            cfg = get_project_config(
+                default_project, organization_inputs=organization_inputs
+            ).to_dict()
+
+    # Organization-wide inputs are not computed again per project.
+    assert get_event_retention.call_count == 0
+    _validate_project_config(cfg["config"])
+    for key in ("rev", "lastFetch", "lastChange"):
+        del cfg[key], expected[key]
+    assert cfg == expected
+    assert cfg["config"]["trustedRelays"] == ["abc"]
+    assert cfg["config"]["features"] == ["organizations:profiling"]
+
+
 @django_db_all
 @region_silo_test
 @mock.patch("sentry.relay.config.EXPOSABLE_FEATURES", ["badprefix:custom-inbound-filters"])
@@ -1,6 +1,7 @@
 from unittest import mock
 
 from sentry.relay.projectconfig_cache import redis
+from sentry.testutils.helpers.options import override_options
 from sentry.testutils.pytest.fixtures import django_db_all
 from sentry.utils import metrics
 
@@ -34,3 +35,77 @@ def test_read_write():
 
     assert cache.get_rev(dsn1) == "my_rev_123"
     assert cache.get_rev(dsn2) is None
+
+
+@django_db_all
+def test_exists_many():
+    cache = redis.RedisProjectConfigCache()
+    cache.set_many({"a": {"foo": "bar"}, "c": {"disabled": True}})
+
+    assert cache.exists_many(["a", "b", "c"]) == {"a", "c"}
+    assert cache.exists_many([]) == set()
+
+
+@django_db_all
+def test_skip_unchanged(monkeypatch):
+    cache = redis.RedisProjectConfigCache()
+    incr_mock = mock.Mock()
+    monkeypatch.setattr(metrics, "incr", incr_mock)
+
+    with override_options({"relay.projectconfig-cache.skip-unchanged": True}):
+        cache.set_many({"a": {"my-value": "foo", "rev": "rev1"}, "b": {"my-value": "bar"}})
+        cache.set_many({"a": {"my-value": "foo", "rev": "rev2"}, "b": {"my-value": "baz"}})
+
+    # The unchanged config keeps its revision, the changed one is rewritten.
+    assert cache.get("a") == {"my-value": "foo", "rev": "rev1"}
+    assert cache.get_rev("a") == "rev1"
+    assert cache.get("b") == {"my-value": "baz"}
+    assert (
+        mock.call("relay.projectconfig_cache.write", amount=1, tags={"action": "unchanged"})
+        in incr_mock.call_args_list
+    )
+
+    # A deleted config is written again even if its content did not change.
+    cache.delete_many(["a"])
+    with override_options({"relay.projectconfig-cache.skip-unchanged": True}):
+        cache.set_many({"a": {"my-value": "foo", "rev": "rev3"}})
+    assert cache.get_rev("a") == "rev3"
+
+
+def test_serialize_content_is_stable():
+    # Set order and key order vary between processes, the content hash must not.
+    domains = [f"https://{i}.example.com" for i in range(20)]
+    a = {"rev": "rev1", "config": {"allowedDomains": set(domains), "trustedRelays": []}}
+    b = {"config": {"trustedRelays": [], "allowedDomains": set(reversed(domains))}, "rev": "rev2"}
+    assert redis._serialize_content(a) == redis._serialize_content(b)
+    assert redis._serialize_content(a) != redis._serialize_content({"config": {}})
+
+
+@django_db_all
+def test_skip_unchanged_after_disabled():
+    cache = redis.RedisProjectConfigCache()
+
+    with override_options({"relay.projectconfig-cache.skip-unchanged": True}):
+        cache.set_many({"a": {"my-value": "foo", "rev": "rev1"}})
+    cache.set_many({"a": {"my-value": "bar", "rev": "rev2"}})
+    with override_options({"relay.projectconfig-cache.skip-unchanged": True}):
+        cache.set_many({"a": {"my-value": "foo", "rev": "rev3"}})
+
+    assert cache.get("a") == {"my-value": "foo", "rev": "rev3"}
+
+
+@django_db_all
+def test_compression_dictionary(tmp_path):
+    samples = [{"config": {"features": ["a", "b"], "id": i}, "slug": f"p{i}"} for i in range(500)]
+    path = tmp_path / "projectconfig.dict"
+    path.write_bytes(redis.train_compression_dictionary(samples, dict_size=2048))
+
+    plain_cache = redis.RedisProjectConfigCache()
+    cache = redis.RedisProjectConfigCache(compression_dictionary=str(path))
+
+    plain_cache.set_many({"a": {"my-value": "foo"}})
+    cache.set_many({"b": {"my-value": "bar"}})
+
+    # Values written without the dictionary remain readable.
+    assert cache.get("a") == {"my-value": "foo"}
+    assert cache.get("b") == {"my-value": "bar"}
@@ -194,6 +194,28 @@ class StorageProjectReplayRecordingSegmentIndexTestCase(
         assert response.get("Content-Type") == "application/json"
         assert close_streaming_response(response) == b"[[]]"
 
+    def test_blob_does_not_exist_between_segments(self):
+        """Assert missing blobs are separated from the segments around them."""
+        self.save_recording_segment(0, b'[{"test":"hello 0"}]')
+        self.store_replays(
+            mock_replay(
+                datetime.datetime.now() - datetime.timedelta(seconds=22),
+                self.project.id,
+                self.replay_id,
+                segment_id=1,
+                retention_days=30,
+            )
+        )
+        self.save_recording_segment(2, b'[{"test":"hello 2"}]')
+
+        with self.feature("organizations:session-replay"):
+            response = self.client.get(self.url + "?download=true")
+
+        assert response.status_code == 200
+        assert (
+            close_streaming_response(response) == b'[[{"test":"hello 0"}],[],[{"test":"hello 2"}]]'
+        )
+
     def test_missing_segment_meta(self):
         """Assert missing segment meta returns no blob data."""
         metadata = RecordingSegmentStorageMeta(
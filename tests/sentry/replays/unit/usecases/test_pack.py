@@ -1,4 +1,9 @@
-from sentry.replays.usecases.pack import HEADER_OFFSET, Encoding, pack, unpack
+from sentry.replays.usecases.pack import HEADER_OFFSET, Encoding, pack, unpack, unpack_rrweb_stream
+
+
+def _chunked(data: bytes, size: int) -> list[memoryview]:
+    view = memoryview(data)
+    return [view[i : i + size] for i in range(0, len(data), size)]
 
 
 def test_pack_rrweb():
@@ -26,3 +31,20 @@ def test_unpack_rrweb_video():
     x = b"\x00" * 1_000_000
     y = b"\xff" * 1_000_000
     assert unpack(pack(x, y)) == (y, x)
+
+
+def test_unpack_rrweb_stream():
+    for size in (1, 2, 3, 1024):
+        assert b"".join(unpack_rrweb_stream(_chunked(pack(b"hello", None), size))) == b"hello"
+        assert b"".join(unpack_rrweb_stream(_chunked(pack(b"hello", b"world"), size))) == b"hello"
+        assert b"".join(unpack_rrweb_stream(_chunked(b"[hello]", size))) == b"[hello]"
+
+    x = b"\x00" * 1_000_000
+    y = b"\xff" * 1_000_000
+    chunks = list(unpack_rrweb_stream(_chunked(pack(x, y), 4096)))
+    assert b"".join(chunks) == x
+    assert all(isinstance(chunk, memoryview) for chunk in chunks)
+
+
+def test_unpack_rrweb_stream_empty_rrweb():
+    assert b"".join(unpack_rrweb_stream(_chunked(pack(b"", b"world"), 2))) == b""
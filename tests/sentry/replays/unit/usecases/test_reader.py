@@ -0,0 +1,26 @@
+import zlib
+
+import pytest
+
+from sentry.replays.usecases.reader import decompress, iter_decompress
+
+
+def test_iter_decompress():
+    data = b"[" + b"a" * 100_000 + b"]"
+
+    chunks = list(iter_decompress(zlib.compress(data), chunk_size=1024))
+    assert b"".join(chunks) == data
+    assert max(len(chunk) for chunk in chunks) == 1024
+
+
+def test_iter_decompress_not_compressed():
+    data = b'[{"test":"hello"}]'
+
+    chunks = list(iter_decompress(data, chunk_size=4))
+    assert b"".join(chunks) == data == decompress(data)
+    assert all(chunk.obj is data for chunk in chunks)
+
+
+def test_iter_decompress_truncated():
+    with pytest.raises(zlib.error):
+        list(iter_decompress(zlib.compress(b"[" + b"a" * 1000 + b"]")[:-4]))
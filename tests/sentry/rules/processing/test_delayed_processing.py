@@ -30,6 +30,7 @@ from sentry.rules.processing.delayed_processing import (
     get_condition_group_results,
     get_condition_query_groups,
     get_group_to_groupevent,
+    get_passing_groups,
     get_rules_to_fire,
     get_rules_to_groups,
     get_slow_conditions,
@@ -446,15 +447,22 @@ class GetRulesToFireTest(TestCase):
         self.rules_to_groups[self.rule1.id].add(self.group1.id)
         self.rules_to_groups[self.rule1.id].add(self.group2.id)
 
-        # Mock passes_comparison function
-        self.patcher = patch("sentry.rules.processing.delayed_processing.passes_comparison")
-        self.mock_passes_comparison = self.patcher.start()
+        # Mock get_passing_groups function
+        self.patcher = patch("sentry.rules.processing.delayed_processing.get_passing_groups")
+        self.mock_get_passing_groups = self.patcher.start()
 
     def tearDown(self):
         self.patcher.stop()
 
+    def set_passes(self, passes: bool) -> None:
+        self.mock_get_passing_groups.side_effect = (
+            lambda results, condition, group_ids, environment_id, project_id: (
+                set(group_ids) if passes else set()
+            )
+        )
+
     def test_comparison(self):
-        self.mock_passes_comparison.return_value = True
+        self.set_passes(True)
 
         result = get_rules_to_fire(
             self.condition_group_results,
@@ -466,7 +474,7 @@ class GetRulesToFireTest(TestCase):
         assert result[self.rule1] == {self.group1.id, self.group2.id}
 
     def test_comparison_fail_all(self):
-        self.mock_passes_comparison.return_value = False
+        self.set_passes(False)
 
         result = get_rules_to_fire(
             self.condition_group_results,
@@ -479,7 +487,7 @@ class GetRulesToFireTest(TestCase):
 
     def test_comparison_any(self):
         self.rule1.data["action_match"] = "any"
-        self.mock_passes_comparison.return_value = True
+        self.set_passes(True)
 
         result = get_rules_to_fire(
             self.condition_group_results,
@@ -492,7 +500,7 @@ class GetRulesToFireTest(TestCase):
 
     def test_comparison_any_fail(self):
         self.rule1.data["action_match"] = "any"
-        self.mock_passes_comparison.return_value = False
+        self.set_passes(False)
 
         result = get_rules_to_fire(
             self.condition_group_results,
@@ -507,8 +515,8 @@ class GetRulesToFireTest(TestCase):
         result = get_rules_to_fire({}, defaultdict(list), defaultdict(set), self.project.id)
         assert len(result) == 0
 
-    @patch("sentry.rules.processing.delayed_processing.passes_comparison", return_value=True)
-    def test_multiple_rules_and_groups(self, mock_passes):
+    def test_multiple_rules_and_groups(self):
+        self.set_passes(True)
         rule2 = self.create_project_rule(
             project=self.project,
             condition_data=[TEST_RULE_SLOW_CONDITION],
@@ -529,6 +537,27 @@ class GetRulesToFireTest(TestCase):
         assert result[rule2] == {self.group2.id}
 
 
+class GetPassingGroupsTest(TestCase):
+    def test_percent_comparison(self):
+        environment = self.create_environment()
+        condition_data: EventFrequencyConditionData = {
+            **TEST_RULE_SLOW_CONDITION,
+            "comparisonType": ComparisonType.PERCENT,
+            "comparisonInterval": "15m",
+            "value": 50,
+        }
+        present_query, offset_query = generate_unique_queries(condition_data, environment.id)
+        condition_group_results: dict[UniqueConditionQuery, dict[int, int | float]] = {
+            present_query: {1: 4, 2: 2},
+            offset_query: {1: 2, 2: 2},
+        }
+
+        # group 3 has no results and doesn't pass
+        assert get_passing_groups(
+            condition_group_results, condition_data, {1, 2, 3}, environment.id, self.project.id
+        ) == {1}
+
+
 class GetRulesToGroupsTest(TestCase):
     def test_empty_input(self):
         result = get_rules_to_groups({})
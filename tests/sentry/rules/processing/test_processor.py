@@ -3,6 +3,7 @@ from typing import cast
 from unittest import mock
 from unittest.mock import patch
 
+import pytest
 from django.core.cache import cache
 from django.db import DEFAULT_DB_ALIAS, connections
 from django.test.utils import CaptureQueriesContext
@@ -20,7 +21,11 @@ from sentry.notifications.types import ActionTargetType
 from sentry.rules import init_registry
 from sentry.rules.conditions import EventCondition
 from sentry.rules.filters.base import EventFilter
-from sentry.rules.processing.processor import PROJECT_ID_BUFFER_LIST_KEY, RuleProcessor
+from sentry.rules.processing.processor import (
+    PROJECT_ID_BUFFER_LIST_KEY,
+    RuleProcessor,
+    bulk_apply_rules,
+)
 from sentry.testutils.cases import PerformanceIssueTestCase, TestCase
 from sentry.testutils.helpers import install_slack
 from sentry.testutils.helpers.redis import mock_redis_buffer
@@ -515,6 +520,46 @@ class RuleProcessorTest(TestCase, PerformanceIssueTestCase):
             # creates no rows.
             self.run_query_test(rp, 2)
 
+    def test_bulk_apply_rules(self):
+        event = self.store_event(data={}, project_id=self.project.id)
+        same_group_event = event.for_group(cast(Group, event.group))
+        assert same_group_event.group == self.group_event.group
+        event = self.store_event(data={"fingerprint": ["other"]}, project_id=self.project.id)
+        other_group_event = event.for_group(cast(Group, event.group))
+
+        processors = [
+            RuleProcessor(
+                group_event,
+                is_new=True,
+                is_regression=True,
+                is_new_group_environment=True,
+                has_reappeared=True,
+            )
+            for group_event in [self.group_event, same_group_event, other_group_event]
+        ]
+        results = [list(futures) for futures in bulk_apply_rules(processors)]
+
+        # the rule fires once per group, the second event of a group is rate limited
+        assert [len(futures) for futures in results] == [1, 0, 1]
+        assert results[0][0][1][0].rule == self.rule
+        for group in [self.group_event.group, other_group_event.group]:
+            assert RuleFireHistory.objects.filter(rule=self.rule, group=group).count() == 1
+
+    def test_bulk_apply_rules_multiple_projects(self):
+        event = self.store_event(data={}, project_id=self.create_project().id)
+        processors = [
+            RuleProcessor(
+                group_event,
+                is_new=True,
+                is_regression=True,
+                is_new_group_environment=True,
+                has_reappeared=True,
+            )
+            for group_event in [self.group_event, event.for_group(cast(Group, event.group))]
+        ]
+        with pytest.raises(ValueError):
+            bulk_apply_rules(processors)
+
     @patch(
         "sentry.constants._SENTRY_RULES",
         [
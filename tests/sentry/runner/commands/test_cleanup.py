@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from unittest import mock
+
+from sentry.runner.commands.cleanup import (
+    BulkDeleteRange,
+    BulkDeleteResult,
+    CleanupProgress,
+    run_bulk_delete_ranges,
+    split_id_range,
+)
+
+CUTOFF = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeWorkers:
+    """Stands in for both the task and result queues of the cleanup worker pool"""
+
+    def __init__(self, failing: set[int] | None = None) -> None:
+        self.outstanding: list[BulkDeleteRange] = []
+        self.max_in_flight: dict[str, int] = defaultdict(int)
+        self.max_total_in_flight = 0
+        self.failing = failing or set()
+
+    def put(self, item: BulkDeleteRange) -> None:
+        self.outstanding.append(item)
+        in_flight = sum(1 for o in self.outstanding if o.model_name == item.model_name)
+        self.max_in_flight[item.model_name] = max(self.max_in_flight[item.model_name], in_flight)
+        self.max_total_in_flight = max(self.max_total_in_flight, len(self.outstanding))
+
+    def get(self, timeout: float | None = None) -> BulkDeleteResult:
+        item = self.outstanding.pop(0)
+        failed = item.min_id in self.failing
+        rows = 0 if failed else item.max_id - item.min_id
+        return BulkDeleteResult(item.model_name, item.min_id, item.max_id, rows, failed)
+
+
+def make_ranges(model_name: str, ranges: list[tuple[int, int]]) -> deque[BulkDeleteRange]:
+    return deque(
+        BulkDeleteRange(model_name, "date_added", None, CUTOFF, None, min_id, max_id)
+        for min_id, max_id in ranges
+    )
+
+
+def test_split_id_range() -> None:
+    assert split_id_range(1, 1, 10) == [(1, 2)]
+    assert split_id_range(1, 25, 10) == [(1, 11), (11, 21), (21, 26)]
+    assert split_id_range(5, 14, 10) == [(5, 15)]
+
+
+def test_run_bulk_delete_ranges_caps_per_model() -> None:
+    workers = FakeWorkers()
+    progress = CleanupProgress(None, days=30, project_id=None)
+    pending = {
+        "a": make_ranges("a", split_id_range(1, 100, 10)),
+        "b": make_ranges("b", split_id_range(1, 20, 10)),
+    }
+    progress.start("a", CUTOFF, list(split_id_range(1, 100, 10)))
+    progress.start("b", CUTOFF, list(split_id_range(1, 20, 10)))
+    pool = [mock.Mock(is_alive=lambda: True) for _ in range(5)]
+
+    with mock.patch("sentry.runner.commands.cleanup.report_throughput") as mock_report:
+        run_bulk_delete_ranges(pending, workers, workers, pool, progress, max_per_model=2)
+
+    # Five workers, but each table is capped at two.
+    assert workers.max_in_flight == {"a": 2, "b": 2}
+    assert workers.max_total_in_flight == 4
+    assert {call.args[0]: call.args[1] for call in mock_report.call_args_list} == {
+        "a": 100,
+        "b": 20,
+    }
+    assert len(progress.models["a"]["completed"]) == 10
+    assert len(progress.models["b"]["completed"]) == 2
+
+
+def test_progress_resume(tmp_path) -> None:
+    path = str(tmp_path / "cleanup.json")
+    workers = FakeWorkers(failing={11})
+    ranges = split_id_range(1, 30, 10)
+
+    progress = CleanupProgress(path, days=30, project_id=None)
+    progress.start("a", CUTOFF, ranges)
+    pool = [mock.Mock(is_alive=lambda: True)]
+    with mock.patch("sentry.runner.commands.cleanup.report_throughput"):
+        run_bulk_delete_ranges(
+            {"a": make_ranges("a", ranges)}, workers, workers, pool, progress, max_per_model=1
+        )
+
+    # The failed range is retried by the next run with the same cutoff.
+    resumed = CleanupProgress(path, days=30, project_id=None).get("a")
+    assert resumed is not None
+    cutoff, resumed_ranges, completed = resumed
+    assert cutoff == CUTOFF
+    assert resumed_ranges == ranges
+    assert completed == {(1, 11), (21, 31)}
+
+    # Different arguments start from scratch.
+    assert CleanupProgress(path, days=7, project_id=None).get("a") is None
+
+    progress.clear()
+    assert not (tmp_path / "cleanup.json").exists()
@@ -1,3 +1,6 @@
+import threading
+from unittest import mock
+
 import pytest
 from snuba_sdk import Entity
 
@@ -5,9 +8,13 @@ from sentry.api.event_search import SearchFilter, SearchKey, SearchValue
 from sentry.exceptions import InvalidSearchQuery
 from sentry.search.events.constants import TIMESTAMP_FIELDS
 from sentry.search.events.types import SnubaParams
-from sentry.search.snuba.executors import GroupAttributesPostgresSnubaQueryExecutor
+from sentry.search.snuba.executors import (
+    GroupAttributesPostgresSnubaQueryExecutor,
+    _submit_search_query,
+)
 from sentry.testutils.cases import SnubaTestCase, TestCase
 from sentry.testutils.helpers.datetime import before_now
+from sentry.utils.concurrent import ThreadedExecutor
 
 
 class GroupAttributesPostgresSnubaQueryExecutorTest(SnubaTestCase, TestCase):
@@ -56,3 +63,32 @@ class GroupAttributesPostgresSnubaQueryExecutorTest(SnubaTestCase, TestCase):
                         end=self.two_min_ago,
                     ),
                 )
+
+
+def test_submit_search_query_runs_inline_when_queue_is_full() -> None:
+    executor = ThreadedExecutor(worker_count=1, maxsize=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def block() -> bool:
+        started.set()
+        return release.wait(5)
+
+    with (
+        mock.patch("sentry.search.snuba.executors._search_query_executor", executor),
+        mock.patch("sentry.search.snuba.executors.metrics") as mock_metrics,
+    ):
+        # Occupy the worker, then the single queue slot.
+        running = _submit_search_query(block)
+        assert started.wait(5)
+        queued = _submit_search_query(block)
+
+        inline = _submit_search_query(threading.get_ident)
+        assert inline.result(timeout=0) == threading.get_ident()
+        mock_metrics.incr.assert_called_once_with(
+            "snuba.search.concurrent_queries.queue_full", skip_internal=False
+        )
+
+        release.set()
+        assert running.result(timeout=5) is True
+        assert queued.result(timeout=5) is True
@@ -8,7 +8,16 @@ import pytest
 import rapidjson
 from sentry_redis_tools.clients import StrictRedis
 
-from sentry.spans.buffer import FlushedSegment, OutputSpan, SegmentKey, Span, SpansBuffer
+from sentry.spans.buffer import (
+    ZSTD_MAGIC,
+    FlushedSegment,
+    OutputSpan,
+    SegmentKey,
+    Span,
+    SpanPayloadCodec,
+    SpansBuffer,
+    train_compression_dict,
+)
 
 
 def shallow_permutations(spans: list[Span]) -> list[list[Span]]:
@@ -498,3 +507,131 @@ def test_flush_rebalance(buffer: SpansBuffer):
     assert not rv
 
     assert_clean(buffer.client)
+
+
+def test_compressed_payloads(buffer: SpansBuffer):
+    samples = [_payload(f"{i:016x}".encode("ascii")) for i in range(1000)]
+    buffer.compression_level = 3
+    buffer.compression_dict = train_compression_dict(samples, dict_size=1024)
+
+    spans = [
+        Span(
+            payload=_payload(b"a" * 16),
+            trace_id="a" * 32,
+            span_id="a" * 16,
+            parent_span_id=None,
+            project_id=1,
+            is_segment_span=True,
+        ),
+        Span(
+            payload=_payload(b"b" * 16),
+            trace_id="a" * 32,
+            span_id="b" * 16,
+            parent_span_id="a" * 16,
+            project_id=1,
+        ),
+    ]
+
+    process_spans(spans, buffer, now=0)
+    assert_ttls(buffer.client)
+
+    segment_key = _segment_id(1, "a" * 32, "a" * 16)
+    stored = buffer.client.smembers(segment_key)
+    assert all(payload.startswith(ZSTD_MAGIC) for payload in stored)
+    assert int(buffer.client.get(b"span-buf:ib:" + segment_key)) == sum(
+        len(payload) for payload in stored
+    )
+
+    rv = buffer.flush_segments(now=11)
+    _normalize_output(rv)
+    assert rv == {
+        segment_key: FlushedSegment(
+            queue_key=mock.ANY,
+            spans=[
+                _output_segment(b"a" * 16, b"a" * 16, True),
+                _output_segment(b"b" * 16, b"a" * 16, False),
+            ],
+        ),
+    }
+
+    buffer.done_flush_segments(rv)
+    assert_clean(buffer.client)
+
+
+def test_duplicate_payloads_are_not_counted(buffer: SpansBuffer):
+    spans = [
+        Span(
+            payload=_payload(b"a" * 16),
+            trace_id="a" * 32,
+            span_id="a" * 16,
+            parent_span_id=None,
+            project_id=1,
+            is_segment_span=True,
+        ),
+        Span(
+            payload=_payload(b"b" * 16),
+            trace_id="a" * 32,
+            span_id="b" * 16,
+            parent_span_id="a" * 16,
+            project_id=1,
+        ),
+    ]
+
+    # The second batch is a redelivery, SADD dedupes its payloads.
+    process_spans(spans, buffer, now=0)
+    process_spans(spans, buffer, now=0)
+
+    segment_key = _segment_id(1, "a" * 32, "a" * 16)
+    stored = buffer.client.smembers(segment_key)
+    assert len(stored) == 2
+    assert int(buffer.client.get(b"span-buf:ib:" + segment_key)) == sum(
+        len(payload) for payload in stored
+    )
+
+
+def test_codec_reads_uncompressed_payloads():
+    codec = SpanPayloadCodec(level=3)
+    payload = _payload(b"a" * 16)
+
+    assert codec.decode(payload) == payload
+    assert codec.decode(codec.encode(payload)) == payload
+    assert SpanPayloadCodec().decode(codec.encode(payload)) == payload
+
+
+@mock.patch("sentry.spans.buffer.metrics.timing")
+def test_record_stored_segments_bytes(timing, buffer: SpansBuffer):
+    spans = [
+        Span(
+            payload=_payload(b"a" * 16),
+            trace_id="a" * 32,
+            span_id="a" * 16,
+            parent_span_id="b" * 16,
+            project_id=1,
+        ),
+        _SplitBatch(),
+        Span(
+            payload=_payload(b"b" * 16),
+            trace_id="a" * 32,
+            span_id="b" * 16,
+            parent_span_id=None,
+            project_id=1,
+            is_segment_span=True,
+        ),
+    ]
+
+    process_spans(spans, buffer, now=0)
+    buffer.record_stored_segments()
+
+    shard = buffer.assigned_shards[int("a" * 32, 16) % len(buffer.assigned_shards)]
+    timing.assert_any_call(
+        "spans.buffer.flush_segments.avg_segment_bytes",
+        len(_payload(b"a" * 16)) + len(_payload(b"b" * 16)),
+        tags={"shard_i": shard},
+    )
+
+    # segment sizes are only sampled every few seconds
+    timing.reset_mock()
+    buffer.record_stored_segments()
+    assert "spans.buffer.flush_segments.avg_segment_bytes" not in {
+        call.args[0] for call in timing.call_args_list
+    }
@@ -8,6 +8,7 @@ from django.db import router, transaction
 from sentry.db.postgres.transactions import in_test_hide_transaction_boundary
 from sentry.models.options.project_option import ProjectOption
 from sentry.models.projectkey import ProjectKey, ProjectKeyStatus
+from sentry.relay.config import get_organization_config_inputs
 from sentry.relay.projectconfig_cache.redis import RedisProjectConfigCache
 from sentry.relay.projectconfig_debounce_cache.redis import RedisProjectConfigDebounceCache
 from sentry.tasks.relay import (
@@ -84,6 +85,7 @@ def redis_cache(monkeypatch):
     monkeypatch.setattr("sentry.relay.projectconfig_cache.set_many", cache.set_many)
     monkeypatch.setattr("sentry.relay.projectconfig_cache.delete_many", cache.delete_many)
     monkeypatch.setattr("sentry.relay.projectconfig_cache.get", cache.get)
+    monkeypatch.setattr("sentry.relay.projectconfig_cache.exists_many", cache.exists_many)
 
     return cache
 
@@ -454,6 +456,43 @@ class TestInvalidationTask:
             assert new_cfg is not None
             assert new_cfg != cfg
 
+    def test_invalidate_org_shares_organization_inputs(
+        self,
+        monkeypatch,
+        default_project,
+        default_organization,
+        default_projectkey,
+        factories,
+        redis_cache,
+        task_runner,
+        django_cache,
+    ):
+        other_project = factories.create_project(organization=default_organization)
+        other_key = ProjectKey.objects.filter(project_id=other_project.id).get()
+        uncached_key = factories.create_project_key(project=other_project)
+
+        cfg = {"dummy-key": "val"}
+        redis_cache.set_many({default_projectkey.public_key: cfg, other_key.public_key: cfg})
+
+        with (
+            mock.patch(
+                "sentry.relay.config.get_organization_config_inputs",
+                wraps=get_organization_config_inputs,
+            ) as get_inputs,
+            task_runner(),
+        ):
+            schedule_invalidate_project_config(
+                organization_id=default_organization.id, trigger="test"
+            )
+
+        assert get_inputs.call_count == 1
+        for public_key in (default_projectkey.public_key, other_key.public_key):
+            new_cfg = redis_cache.get(public_key)
+            assert new_cfg["disabled"] is False
+            assert new_cfg["organizationId"] == default_organization.id
+        # Keys which were not cached are not computed.
+        assert redis_cache.get(uncached_key.public_key) is None
+
     @mock.patch(
         "sentry.tasks.relay._schedule_invalidate_project_config",
         wraps=_schedule_invalidate_project_config,
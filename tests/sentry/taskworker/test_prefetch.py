@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from sentry.taskworker.prefetch import AdaptivePrefetch
+
+
+def test_target_depth_disabled() -> None:
+    prefetch = AdaptivePrefetch(concurrency=2, max_depth=5)
+    prefetch.record_fetch(1.0)
+    prefetch.record_execution(queue_wait=0.0, duration=0.01, cpu_time=0.0)
+
+    assert prefetch.target_depth() == 5
+
+
+def test_target_depth_without_samples() -> None:
+    prefetch = AdaptivePrefetch(concurrency=2, max_depth=5, enabled=True)
+    assert prefetch.target_depth() == 5
+
+    prefetch.record_fetch(0.05)
+    assert prefetch.target_depth() == 5
+
+
+def test_target_depth_slow_tasks() -> None:
+    prefetch = AdaptivePrefetch(concurrency=4, max_depth=20, enabled=True)
+    prefetch.record_fetch(0.05)
+    prefetch.record_execution(queue_wait=0.0, duration=1.0, cpu_time=0.1)
+
+    # Tasks run much longer than a fetch, one buffered task is enough.
+    assert prefetch.target_depth() == 2
+
+
+def test_target_depth_fast_tasks() -> None:
+    prefetch = AdaptivePrefetch(concurrency=4, max_depth=20, enabled=True)
+    prefetch.record_fetch(0.05)
+    prefetch.record_execution(queue_wait=0.0, duration=0.025, cpu_time=0.0)
+
+    # Four children each complete two tasks during a fetch.
+    assert prefetch.target_depth() == 9
+
+    prefetch.record_fetch(1.0)
+    assert prefetch.target_depth() == 20
+
+
+def test_target_depth_cpu_saturated() -> None:
+    prefetch = AdaptivePrefetch(concurrency=2, max_depth=20, enabled=True)
+    prefetch.record_fetch(0.05)
+    prefetch.record_execution(queue_wait=0.5, duration=0.01, cpu_time=0.01)
+
+    assert prefetch.cpu_utilization == 1.0
+    assert prefetch.target_depth() == 2
+
+
+def test_record_execution_moving_average() -> None:
+    prefetch = AdaptivePrefetch(concurrency=1, max_depth=20, enabled=True)
+    prefetch.record_fetch(0.1)
+    prefetch.record_execution(queue_wait=0.0, duration=0.1, cpu_time=0.0)
+    assert prefetch.target_depth() == 2
+
+    # A single fast task shouldn't swing the target all the way.
+    prefetch.record_execution(queue_wait=0.0, duration=0.001, cpu_time=0.0)
+    assert 2 < prefetch.target_depth() < 20
@@ -1,3 +1,4 @@
+import multiprocessing
 import queue
 import time
 from multiprocessing import Event
@@ -10,6 +11,7 @@ from sentry_protos.taskbroker.v1.taskbroker_pb2 import (
     TASK_ACTIVATION_STATUS_COMPLETE,
     TASK_ACTIVATION_STATUS_FAILURE,
     TASK_ACTIVATION_STATUS_RETRY,
+    FetchNextTask,
     RetryState,
     TaskActivation,
 )
@@ -22,6 +24,7 @@ from sentry.taskworker.workerchild import (
     ProcessingDeadlineExceeded,
     ProcessingResult,
     child_process,
+    child_worker_init,
 )
 from sentry.testutils.cases import TestCase
 from sentry.testutils.helpers.options import override_options
@@ -94,6 +97,34 @@ SCHEDULED_TASK = TaskActivation(
 )
 
 
+class InProcessBroker:
+    """
+    Stand-in for the taskbroker RPC client that serves activations from memory.
+    """
+
+    def __init__(self, activations: list[TaskActivation]) -> None:
+        self.pending = list(activations)
+        self.statuses: dict[str, int] = {}
+        self.get_task_calls = 0
+
+    def _next(self) -> TaskActivation | None:
+        if not self.pending:
+            return None
+        return self.pending.pop(0)
+
+    def get_task(self, namespace: str | None = None) -> TaskActivation | None:
+        self.get_task_calls += 1
+        return self._next()
+
+    def update_task(
+        self, task_id: str, status: int, fetch_next_task: FetchNextTask | None = None
+    ) -> TaskActivation | None:
+        self.statuses[task_id] = status
+        if fetch_next_task is None:
+            return None
+        return self._next()
+
+
 @pytest.mark.django_db
 class TestTaskWorker(TestCase):
     def test_tasks_exist(self) -> None:
@@ -274,6 +305,62 @@ class TestTaskWorker(TestCase):
             assert redis.get("no-retries-remaining"), "key should exist if except block was hit"
             redis.delete("no-retries-remaining")
 
+    def test_run_once_in_process_broker_adaptive_prefetch(self) -> None:
+        max_runtime = 10
+        activations = [
+            TaskActivation(
+                id=f"task-{i}",
+                taskname="examples.simple_task",
+                namespace="examples",
+                parameters='{"args": [], "kwargs": {}}',
+                processing_deadline_duration=2,
+            )
+            for i in range(6)
+        ]
+        broker = InProcessBroker(activations)
+        taskworker = TaskWorker(
+            rpc_host="127.0.0.1:50051",
+            num_brokers=1,
+            max_child_task_count=100,
+            concurrency=2,
+            process_type="fork",
+            adaptive_prefetch=True,
+        )
+        taskworker.client = broker  # type: ignore[assignment]
+
+        with mock.patch("sentry.taskworker.worker.metrics.distribution") as mock_distribution:
+            taskworker.start_result_thread()
+            taskworker.start_spawn_children_thread()
+            start = time.time()
+            while len(broker.statuses) < len(activations):
+                taskworker.run_once()
+                if time.time() - start > max_runtime:
+                    taskworker.shutdown()
+                    raise AssertionError("Timeout waiting for tasks to complete")
+                time.sleep(0.01)
+            taskworker.shutdown()
+
+        assert broker.statuses == {
+            activation.id: TASK_ACTIVATION_STATUS_COMPLETE for activation in activations
+        }
+        stages = {
+            call.kwargs["tags"]["stage"]
+            for call in mock_distribution.call_args_list
+            if call.args[0] == "taskworker.worker.stage.duration"
+        }
+        assert stages == {"fetch", "queue_wait", "execute", "result_send"}
+
+
+def test_child_worker_init_forkserver_without_zygote() -> None:
+    # A forkserver that preloaded nothing behaves like one whose zygote import failed.
+    mp_context = multiprocessing.get_context("forkserver")
+    mp_context.set_forkserver_preload([])
+    child = mp_context.Process(target=child_worker_init, args=("forkserver",))
+    child.start()
+    child.join(timeout=30)
+
+    assert child.exitcode == 1
+
 
 @pytest.mark.django_db
 @mock.patch("sentry.taskworker.workerchild.capture_checkin")
@@ -296,9 +383,38 @@ def test_child_process_complete(mock_capture_checkin) -> None:
     result = processed.get()
     assert result.task_id == SIMPLE_TASK.id
     assert result.status == TASK_ACTIVATION_STATUS_COMPLETE
+    assert result.dequeued_at > 0
+    assert result.execution_duration > 0
     assert mock_capture_checkin.call_count == 0
 
 
+@pytest.mark.django_db
+@mock.patch("sentry.utils.metrics.distribution")
+def test_child_process_record_startup(mock_distribution: mock.Mock) -> None:
+    todo: queue.Queue[TaskActivation] = queue.Queue()
+    processed: queue.Queue[ProcessingResult] = queue.Queue()
+    shutdown = Event()
+
+    todo.put(SIMPLE_TASK)
+    child_process(
+        todo,
+        processed,
+        shutdown,
+        max_task_count=1,
+        processing_pool_name="test",
+        process_type="fork",
+        spawned_at=time.monotonic(),
+    )
+
+    recorded = {call.args[0]: call for call in mock_distribution.call_args_list}
+    assert "taskworker.worker.child.startup_duration" in recorded
+    assert "taskworker.worker.child.first_task_duration" in recorded
+    assert recorded["taskworker.worker.child.first_task_duration"].kwargs["tags"] == {
+        "process_type": "fork",
+        "processing_pool": "test",
+    }
+
+
 @pytest.mark.django_db
 def test_child_process_remove_start_time_kwargs() -> None:
     activation = TaskActivation(
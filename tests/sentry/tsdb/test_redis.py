@@ -191,6 +191,67 @@ class RedisTSDBTest(TestCase):
         )
         assert sum_results == {1: 0, 2: 0}
 
+    def test_get_range_matrix(self):
+        now = datetime.now(timezone.utc) - timedelta(hours=4)
+        dts = [now + timedelta(hours=i) for i in range(4)]
+
+        def timestamp(d):
+            t = int(d.timestamp())
+            return t - (t % 3600)
+
+        self.db.incr(TSDBModel.project, 1, dts[0])
+        self.db.incr(TSDBModel.project, 1, dts[1], count=2)
+        self.db.incr(TSDBModel.project, "foo", dts[2], count=5)
+        self.db.incr(TSDBModel.project, 2, dts[3], count=3, environment_id=1)
+
+        matrix = self.db.get_range_matrix(
+            TSDBModel.project, [1, 2, "foo"], dts[0], dts[-1], rollup=ONE_HOUR
+        )
+        assert matrix.keys == [1, 2, "foo"]
+        assert matrix.timestamps == [timestamp(dt) for dt in dts]
+        assert matrix.values == [
+            [1, 2, 0, 0],
+            [0, 0, 0, 3],
+            [0, 0, 5, 0],
+        ]
+        assert matrix.to_series() == self.db.get_range(
+            TSDBModel.project, [1, 2, "foo"], dts[0], dts[-1], rollup=ONE_HOUR
+        )
+
+        matrix = self.db.get_range_matrix(
+            TSDBModel.project, [1, 2], dts[0], dts[-1], rollup=ONE_HOUR, environment_id=1
+        )
+        assert matrix.values == [[0, 0, 0, 0], [0, 0, 0, 3]]
+
+    def test_get_range_matrix_matches_counter_keys(self):
+        end = datetime.now(timezone.utc)
+        start = end - timedelta(days=9)
+        # enough keys to cover many vnodes and all hosts
+        keys = list(range(200))
+        for day in range(10):
+            self.db.incr_multi(
+                [(TSDBModel.group, key) for key in keys if key % (day + 1) == 0],
+                timestamp=start + timedelta(days=day),
+                count=day + 1,
+            )
+
+        matrix = self.db.get_range_matrix(TSDBModel.group, keys, start, end, rollup=ONE_DAY)
+
+        with self.db.cluster.map() as client:
+            expected = [
+                [
+                    client.hget(
+                        *self.db.make_counter_key(
+                            TSDBModel.group, ONE_DAY, to_datetime(timestamp), key, None
+                        )
+                    )
+                    for timestamp in matrix.timestamps
+                ]
+                for key in keys
+            ]
+        assert matrix.values == [[int(promise.value or 0) for promise in row] for row in expected]
+        assert matrix.values[0][-10:] == list(range(1, 11))
+
     def test_count_distinct(self):
         now = datetime.now(timezone.utc) - timedelta(hours=4)
         dts = [now + timedelta(hours=i) for i in range(4)]
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+
+from sentry.testutils.cases import TestCase
+from sentry.testutils.performance_issues.event_generators import create_event, create_span
+from sentry.utils.performance_issues.base import fingerprint_span, get_span_duration
+from sentry.utils.performance_issues.detectors.consecutive_http_detector import (
+    ConsecutiveHTTPSpanDetector,
+)
+from sentry.utils.performance_issues.detectors.slow_db_query_detector import SlowDBQueryDetector
+from sentry.utils.performance_issues.performance_detection import (
+    build_detectors,
+    get_detection_settings,
+)
+from sentry.utils.performance_issues.span_index import SpanIndex
+
+
+def test_durations() -> None:
+    spans = [
+        {"span_id": "a", "op": "http.server", "start_timestamp": 1.0, "timestamp": 3.0},
+        {"span_id": "b", "op": "db", "start_timestamp": 2.0},
+        {"span_id": "c", "op": "http.client"},
+    ]
+    index = SpanIndex(spans)
+
+    with mock.patch(
+        "sentry.utils.performance_issues.span_index.get_span_duration",
+        side_effect=get_span_duration,
+    ) as mock_duration:
+        for span in spans:
+            assert index.duration(span) == get_span_duration(span)
+            assert index.duration(span) == get_span_duration(span)
+    assert mock_duration.call_count == len(spans)
+    assert index.duration(spans[0]) == timedelta(seconds=2)
+
+
+def test_malformed_timestamps_raise() -> None:
+    span = {"span_id": "a", "op": "db", "start_timestamp": None, "timestamp": 1.0}
+    index = SpanIndex([span])
+
+    with pytest.raises(TypeError):
+        index.duration(span)
+
+
+def test_memoized_values() -> None:
+    span = create_span("http.client", 100.0, "GET /api/0/organizations/123/")
+    index = SpanIndex([span])
+
+    with mock.patch(
+        "sentry.utils.performance_issues.span_index.fingerprint_span",
+        side_effect=fingerprint_span,
+    ) as mock_fingerprint:
+        assert index.fingerprint(span) == fingerprint_span(span)
+        assert index.fingerprint(span) == fingerprint_span(span)
+    assert mock_fingerprint.call_count == 1
+
+    assert index.url(span) == "/api/0/organizations/123/"
+    assert index.parameterized_url(span) == "/api/*/organizations/*/"
+
+
+def test_unindexed_span() -> None:
+    index = SpanIndex([])
+    span = create_span("db", 250.0)
+
+    assert index.position(span) is None
+    assert index.duration(span) == get_span_duration(span)
+    assert index.fingerprint(span) == fingerprint_span(span)
+
+
+@pytest.mark.django_db
+class BuildDetectorsTest(TestCase):
+    def test_detectors_share_span_index(self) -> None:
+        event = create_event([create_span("db", 1001.0)])
+        detectors = build_detectors(
+            get_detection_settings(),
+            event,
+            [SlowDBQueryDetector, ConsecutiveHTTPSpanDetector],
+        )
+
+        assert len(detectors) == 2
+        assert detectors[0].span_index is detectors[1].span_index
+        assert detectors[0].span_index.spans is event["spans"]
+
+    def test_standalone_detector_builds_span_index(self) -> None:
+        event = create_event([create_span("db", 1001.0)])
+        detector = SlowDBQueryDetector(get_detection_settings(), event)
+
+        assert detector.span_index.spans is event["spans"]
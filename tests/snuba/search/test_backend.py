@@ -2565,7 +2565,40 @@ class EventsSnubaSearchTestCases(EventsDatasetTestSetup):
 
 
 class EventsSnubaSearchTest(TestCase, EventsSnubaSearchTestCases):
-    pass
+    def test_pagination_concurrent_queries(self):
+        for options_set in [
+            {"snuba.search.concurrent-queries": True},
+            # forces post-filtering, which is where chunks are fetched speculatively
+            {
+                "snuba.search.concurrent-queries": True,
+                "snuba.search.speculative-chunks": True,
+                "snuba.search.max-pre-snuba-candidates": 0,
+                "snuba.search.min-pre-snuba-candidates": None,
+            },
+        ]:
+            with self.options(options_set):
+                # an explicit end date skips the Postgres only search
+                date_to = timezone.now()
+                results = self.backend.query(
+                    [self.project], limit=1, sort_by="date", date_to=date_to, count_hits=True
+                )
+                assert list(results) == [self.group1]
+                assert results.hits == 2
+                assert results.next.has_results
+                assert {"candidates", "chunks"} <= set(results.timings)
+
+                results = self.backend.query(
+                    [self.project],
+                    cursor=results.next,
+                    limit=1,
+                    sort_by="date",
+                    date_to=date_to,
+                    count_hits=True,
+                )
+                assert list(results) == [self.group2]
+                assert results.hits == 2
+                assert not results.next.has_results
+                assert "hits" in results.timings
 
 
 @apply_feature_flag_on_cls("organizations:issue-search-group-attributes-side-query")